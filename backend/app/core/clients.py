@@ -0,0 +1,78 @@
+"""공유 HTTP / OpenAI 클라이언트 관리
+
+모든 외부 호출이 하나의 커넥션 풀을 재사용하도록 지연 생성하고,
+애플리케이션 종료 시(main.lifespan) 닫습니다.
+- OpenAI 클라이언트는 첫 AI 호출 때 생성하므로 키 없이도 앱을 import 할 수 있음
+"""
+import importlib.util
+from typing import Optional
+import httpx
+from openai import AsyncOpenAI
+from app.core.config import settings
+
+
+_http_client: Optional[httpx.AsyncClient] = None
+_openai_client: Optional[AsyncOpenAI] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """공유 httpx.AsyncClient 반환 (최초 호출 시 생성)"""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=settings.HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE,
+            ),
+            timeout=httpx.Timeout(settings.HTTP_TIMEOUT),
+        )
+    return _http_client
+
+
+async def close_http_client():
+    """공유 클라이언트 종료"""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+def _http2_enabled() -> bool:
+    if not settings.OPENAI_HTTP2:
+        return False
+    if importlib.util.find_spec("h2") is None:
+        print("[WARNING] OPENAI_HTTP2 requires the h2 package (falling back to HTTP/1.1)")
+        return False
+    return True
+
+
+def get_openai_client() -> AsyncOpenAI:
+    """공유 AsyncOpenAI 반환 (최초 호출 시 생성, 키가 없으면 RuntimeError)"""
+    global _openai_client
+    if _openai_client is None:
+        if not settings.OPENAI_API_KEY:
+            raise RuntimeError("OPENAI_API_KEY 가 설정되지 않았습니다.")
+        timeout = httpx.Timeout(settings.OPENAI_TIMEOUT, connect=settings.OPENAI_CONNECT_TIMEOUT)
+        _openai_client = AsyncOpenAI(
+            api_key=settings.OPENAI_API_KEY,
+            timeout=timeout,
+            max_retries=settings.OPENAI_MAX_RETRIES,
+            http_client=httpx.AsyncClient(
+                http2=_http2_enabled(),
+                limits=httpx.Limits(
+                    max_connections=settings.OPENAI_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.OPENAI_MAX_KEEPALIVE,
+                    keepalive_expiry=settings.OPENAI_KEEPALIVE_EXPIRY,
+                ),
+                timeout=timeout,
+            ),
+        )
+    return _openai_client
+
+
+async def close_openai_client():
+    """공유 OpenAI 클라이언트 종료 (생성된 적 없으면 무시)"""
+    global _openai_client
+    if _openai_client is not None:
+        await _openai_client.close()
+        _openai_client = None
@@ -0,0 +1,177 @@
+"""응답 압축 (gzip + 선택적 brotli / zstd)
+
+- Accept-Encoding 협상: 설정 우선순위(기본 zstd > br > gzip) 중 클라이언트가 허용하고
+  서버에 모듈이 설치된 인코딩 선택 (brotli, zstandard 패키지는 선택 의존성)
+- 최소 크기(COMPRESSION_MIN_SIZE) 미만, 이미 인코딩된 응답, 스트리밍 응답
+  (text/event-stream, application/x-ndjson 또는 여러 청크 본문)은 그대로 통과
+- 압축에 쓴 CPU 시간과 전/후 바이트를 metrics 에 누적
+"""
+import gzip
+from typing import Callable, Dict, List, Optional
+from app.core.config import settings
+from app.core.metrics import metrics
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # 선택 의존성
+    zstandard = None
+
+
+SKIP_MEDIA_TYPES = ("text/event-stream", "application/x-ndjson")
+ENCODED_ETAG_SUFFIXES = ('-gzip"', '-br"', '-zstd"')
+
+
+def _gzip(data: bytes) -> bytes:
+    return gzip.compress(data, compresslevel=settings.COMPRESSION_GZIP_LEVEL, mtime=0)
+
+
+def _brotli(data: bytes) -> bytes:
+    return brotli.compress(data, quality=settings.COMPRESSION_BROTLI_QUALITY)
+
+
+def _zstd(data: bytes) -> bytes:
+    return zstandard.ZstdCompressor(level=settings.COMPRESSION_ZSTD_LEVEL).compress(data)
+
+
+def available_encodings() -> Dict[str, Callable[[bytes], bytes]]:
+    """설정 순서대로 사용 가능한 인코딩 → 압축 함수"""
+    codecs = {"gzip": _gzip}
+    if brotli is not None:
+        codecs["br"] = _brotli
+    if zstandard is not None:
+        codecs["zstd"] = _zstd
+    return {name: codecs[name] for name in settings.compression_encodings if name in codecs}
+
+
+def parse_accept_encoding(header: str) -> Dict[str, float]:
+    """Accept-Encoding → {인코딩: q}"""
+    accepted = {}
+    for part in header.split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[name] = q
+    return accepted
+
+
+def negotiate(accept_encoding: Optional[str]) -> Optional[str]:
+    """클라이언트가 허용하는 인코딩 중 서버 우선순위가 가장 높은 것"""
+    if not settings.COMPRESSION_ENABLED or not accept_encoding:
+        return None
+    accepted = parse_accept_encoding(accept_encoding)
+    wildcard = accepted.get("*", 0.0)
+    for name in available_encodings():
+        if accepted.get(name, wildcard) > 0:
+            return name
+    return None
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    """압축 + CPU 시간/바이트 지표 기록"""
+    codec = available_encodings()[encoding]
+    with metrics.timer(f"compression.{encoding}.cpu_seconds"):
+        result = codec(data)
+    metrics.incr(f"compression.{encoding}.responses")
+    metrics.incr(f"compression.{encoding}.bytes_in", len(data))
+    metrics.incr(f"compression.{encoding}.bytes_out", len(result))
+    return result
+
+
+def _header(headers: List[tuple], name: bytes) -> Optional[bytes]:
+    for key, value in headers:
+        if key.lower() == name:
+            return value
+    return None
+
+
+def encoded_etag(etag: str, encoding: str) -> str:
+    """표현(인코딩)별 strong ETag ("abc" → "abc-gzip")"""
+    weak = etag.startswith("W/")
+    tag = etag[2:] if weak else etag
+    return ("W/" if weak else "") + tag[:-1] + f'-{encoding}"'
+
+
+class CompressionMiddleware:
+    """단일 본문 응답을 협상된 인코딩으로 압축하는 ASGI 미들웨어"""
+
+    def __init__(self, app, minimum_size: Optional[int] = None):
+        self.app = app
+        self.minimum_size = settings.COMPRESSION_MIN_SIZE if minimum_size is None else minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        request_headers = dict(scope.get("headers") or [])
+        encoding = negotiate(request_headers.get(b"accept-encoding", b"").decode("latin-1"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        passthrough = False
+
+        async def send_wrapper(message):
+            nonlocal start_message, passthrough
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            if start_message is not None:
+                start, start_message = start_message, None
+                headers = list(start.get("headers") or [])
+                body = message.get("body", b"")
+                media_type = (_header(headers, b"content-type") or b"").decode("latin-1")
+                if (
+                    message.get("more_body", False)
+                    or _header(headers, b"content-encoding") is not None
+                    or media_type.startswith(SKIP_MEDIA_TYPES)
+                    or len(body) < self.minimum_size
+                ):
+                    passthrough = True
+                    if len(body) < self.minimum_size and not message.get("more_body", False):
+                        metrics.incr("compression.skipped_small")
+                    await send(start)
+                    await send(message)
+                    return
+
+                compressed = compress(body, encoding)
+                headers = [
+                    (key, value) for key, value in headers
+                    if key.lower() not in (b"content-length", b"etag")
+                ]
+                etag = _header(list(start.get("headers") or []), b"etag")
+                if etag is not None:
+                    headers.append((b"etag", encoded_etag(etag.decode("latin-1"), encoding).encode("latin-1")))
+                headers += [
+                    (b"content-encoding", encoding.encode("latin-1")),
+                    (b"content-length", str(len(compressed)).encode("latin-1")),
+                ]
+                vary = _header(headers, b"vary")
+                if vary is None:
+                    headers.append((b"vary", b"Accept-Encoding"))
+                elif b"accept-encoding" not in vary.lower():
+                    headers = [(k, v) for k, v in headers if k.lower() != b"vary"]
+                    headers.append((b"vary", vary + b", Accept-Encoding"))
+                await send({**start, "headers": headers})
+                await send({"type": "http.response.body", "body": compressed})
+                return
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import Dict, List
 
 
 class Settings(BaseSettings):
@@ -9,10 +9,80 @@ class Settings(BaseSettings):
     MONGO_URI: str = "mongodb://localhost:27017"
     MONGO_DB: str = "econlux"
     
-    # OpenAI
-    OPENAI_API_KEY: str
+    # OpenAI (키가 없어도 앱은 뜨고, AI 기능 호출 시점에 오류)
+    OPENAI_API_KEY: str = ""
     OPENAI_MODEL: str = "gpt-4-turbo-preview"
     OPENAI_MAX_TOKENS: int = 2000
+    OPENAI_TIMEOUT: float = 60.0  # 응답 전체 (스트리밍은 청크 간격)
+    OPENAI_CONNECT_TIMEOUT: float = 5.0
+    OPENAI_MAX_RETRIES: int = 2  # SDK 내부 재시도 (연결 오류, 429, 5xx)
+    OPENAI_MAX_CONNECTIONS: int = 50
+    OPENAI_MAX_KEEPALIVE: int = 20
+    OPENAI_KEEPALIVE_EXPIRY: float = 30.0
+    OPENAI_HTTP2: bool = False  # h2 패키지가 설치된 경우만 적용
+    
+    # 문제 대량 생성: 청크별 동시 요청 (청크 크기 이하면 한 번에 요청)
+    GENERATION_CHUNK_SIZE: int = 5
+    GENERATION_CONCURRENCY: int = 4
+    GENERATION_DEDUPE_THRESHOLD: float = 0.8
+    
+    # 자료 추천 (로컬 카탈로그 BM25, LLM 은 선택적 재정렬에만 사용)
+    RECOMMEND_LLM_RERANK: bool = False
+    RECOMMEND_RERANK_CANDIDATES: int = 12  # 재정렬에 넘기는 상위 후보 수
+    
+    # 템플릿 계산 문제 (시계열 값으로 생성, LLM 미사용) 가 객관식 요청에서 차지하는 비율
+    PROBLEM_TEMPLATE_SHARE: float = 0.4
+    
+    # 문제 은행 (MongoDB problem_bank, (난이도, 주제, 형식) 버킷별 사전 생성)
+    PROBLEM_BANK_ENABLED: bool = True
+    PROBLEM_BANK_LOW_WATERMARK: int = 20  # 버킷 문제 수가 이보다 적으면 보충
+    PROBLEM_BANK_TARGET: int = 60  # 보충 시 채우는 목표 개수
+    PROBLEM_BANK_MAX_SERVES: int = 50  # 이만큼 출제된 문제는 폐기 후 새 문제로 교체
+    PROBLEM_BANK_REFILL_INTERVAL: float = 300.0  # 보충 점검 주기 (초)
+    PROBLEM_BANK_REFILL_BUCKETS: int = 4  # 보충 한 번에 생성하는 최대 버킷 수 (가장 부족한 순, 나머지는 다음 주기)
+    PROBLEM_BANK_MONGO_TIMEOUT: float = 1.0  # 출제가 이보다 느리면 은행을 건너뛰고 즉시 생성 (초)
+    
+    # 시계열 아카이브 (비어 있으면 Mock 히스토리 사용)
+    SERIES_ARCHIVE_DIR: str = ""
+    
+    # 외부 HTTP 호출 (공유 커넥션 풀)
+    HTTP_TIMEOUT: float = 10.0
+    HTTP_MAX_CONNECTIONS: int = 100
+    HTTP_MAX_KEEPALIVE: int = 20
+    
+    # 실시간 시장 데이터 소스 ("이름=URL" 콤마 구분, 비어 있으면 Mock)
+    MARKET_SOURCES: str = ""
+    MARKET_SOURCE_TIMEOUT: float = 1.5
+    
+    # 시장 데이터 스냅샷 캐시 (데이터 버전별 직렬화 결과 재사용)
+    SNAPSHOT_CACHE_ENABLED: bool = True
+    SNAPSHOT_MAX_ENTRIES: int = 256
+    
+    # 응답 압축 (brotli/zstd 는 패키지가 설치된 경우만 사용)
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MIN_SIZE: int = 1024
+    COMPRESSION_ENCODINGS: str = "zstd,br,gzip"  # 서버 선호 순서
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 5
+    COMPRESSION_ZSTD_LEVEL: int = 3
+    
+    # LLM 응답 캐시 (프로세스 LRU → MongoDB TTL 컬렉션)
+    LLM_CACHE_ENABLED: bool = True
+    LLM_CACHE_MAX_ENTRIES: int = 1024
+    LLM_CACHE_MONGO_TIMEOUT: float = 0.5  # Mongo 조회/저장이 이보다 느리면 건너뜀 (초)
+    LLM_CACHE_TTLS: str = "qa_chat=86400,qa_summary=86400,recommend=604800,ai_chart=604800,whatif=86400"
+    LLM_CACHE_DEFAULT_TTL: int = 86400
+    
+    # Q&A 의미 캐시 (글자 n-gram MinHash + LSH, 프로세스 내)
+    SEMANTIC_CACHE_ENABLED: bool = True
+    SEMANTIC_CACHE_THRESHOLD: float = 0.7  # n-gram Jaccard 유사도가 이 이상이고 내용어 집합이 같으면 같은 질문
+    SEMANTIC_CACHE_NGRAM: int = 2
+    SEMANTIC_CACHE_PERMUTATIONS: int = 30
+    SEMANTIC_CACHE_BANDS: int = 10  # 밴드당 행 = PERMUTATIONS / BANDS (J=0.7 후보 재현율 약 0.98)
+    SEMANTIC_CACHE_MAX_ENTRIES: int = 200000
+    
+    # 관리자 API (/admin/*) 토큰, 비우면 관리자 API 비활성 (404)
+    ADMIN_TOKEN: str = ""
     
     # CORS
     CORS_ORIGINS: str = "http://localhost:5173"
@@ -33,6 +103,31 @@ class Settings(BaseSettings):
     def cors_origins_list(self) -> List[str]:
         """CORS origins를 리스트로 반환"""
         return [origin.strip() for origin in self.CORS_ORIGINS.split(",")]
+    
+    @property
+    def compression_encodings(self) -> List[str]:
+        """압축 인코딩 선호 순서"""
+        return [name.strip().lower() for name in self.COMPRESSION_ENCODINGS.split(",") if name.strip()]
+    
+    @property
+    def market_sources(self) -> Dict[str, str]:
+        """시장 데이터 소스를 {이름: URL} 로 반환"""
+        sources = {}
+        for item in self.MARKET_SOURCES.split(","):
+            name, sep, url = item.partition("=")
+            if sep and name.strip() and url.strip():
+                sources[name.strip()] = url.strip()
+        return sources
+    
+    @property
+    def llm_cache_ttls(self) -> Dict[str, int]:
+        """엔드포인트별 LLM 캐시 TTL (초)"""
+        ttls = {}
+        for item in self.LLM_CACHE_TTLS.split(","):
+            name, sep, seconds = item.partition("=")
+            if sep and name.strip() and seconds.strip().isdigit():
+                ttls[name.strip()] = int(seconds)
+        return ttls
 
 
 settings = Settings()
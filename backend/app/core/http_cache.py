@@ -0,0 +1,109 @@
+"""HTTP 조건부 요청 (ETag / Last-Modified → 304)
+
+대시보드는 같은 엔드포인트를 주기적으로 다시 조회하므로, 내용이 같으면
+본문 없이 304 만 돌려주어 대역폭과 직렬화 비용을 줄입니다.
+- ETag: 응답 바이트의 해시 (strong)
+- If-None-Match 가 있으면 If-Modified-Since 보다 우선 (RFC 9110)
+"""
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Optional
+from fastapi import Request, Response
+from app.core.config import settings
+from app.core.compression import ENCODED_ETAG_SUFFIXES, encoded_etag
+
+
+# 엔드포인트별 Cache-Control
+CACHE_CONTROL: Dict[str, str] = {
+    "kpis": "public, max-age=60, stale-while-revalidate=30",
+    "kpis_extended": "public, max-age=30, stale-while-revalidate=30",
+    "trends": "public, max-age=300",
+    "news": "public, max-age=300",
+    "calendar": "public, max-age=300",
+    "tickers": "public, max-age=15",
+    "rolling": "public, max-age=60",
+    "dashboard": "public, max-age=15",
+    "session": "private, no-cache",
+}
+DEFAULT_CACHE_CONTROL = "no-cache"
+
+
+def make_etag(body: bytes) -> str:
+    return '"' + hashlib.blake2b(body, digest_size=12).hexdigest() + '"'
+
+
+def http_date(value: datetime) -> str:
+    """HTTP-date (naive datetime 은 UTC 로 간주)"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def _base_tag(tag: str) -> str:
+    """W/ 접두사와 인코딩 접미사(-gzip 등)를 뗀 ETag"""
+    tag = tag.strip().removeprefix("W/")
+    for suffix in ENCODED_ETAG_SUFFIXES:
+        if tag.endswith(suffix):
+            return tag[:-len(suffix)] + '"'
+    return tag
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    if header.strip() == "*":
+        return True
+    # GET 조건부 요청은 weak 비교, 같은 내용의 다른 인코딩 표현도 일치로 봄
+    wanted = _base_tag(etag)
+    return any(_base_tag(tag) == wanted for tag in header.split(","))
+
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[datetime] = None) -> bool:
+    """요청의 조건부 헤더 기준으로 304 를 줄 수 있는지"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        modified = last_modified if last_modified.tzinfo else last_modified.replace(tzinfo=timezone.utc)
+        # HTTP-date 는 초 단위
+        return modified.replace(microsecond=0) <= since
+    return False
+
+
+def conditional_response(
+    request: Request,
+    body: bytes,
+    resource: str,
+    etag: Optional[str] = None,
+    last_modified: Optional[datetime] = None,
+    media_type: str = "application/json",
+    encoding: Optional[str] = None,
+) -> Response:
+    """
+    ETag/Last-Modified/Cache-Control 을 붙여 200 또는 304 응답
+    - encoding: body 가 이미 압축된 경우 인코딩 이름 (ETag 에 표현 접미사 부여)
+    """
+    etag = etag or make_etag(body)
+    if encoding:
+        etag = encoded_etag(etag, encoding)
+    headers = {
+        "ETag": etag,
+        "Cache-Control": CACHE_CONTROL.get(resource, DEFAULT_CACHE_CONTROL),
+    }
+    if settings.COMPRESSION_ENABLED:
+        headers["Vary"] = "Accept-Encoding"
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified)
+
+    if is_not_modified(request, etag, last_modified):
+        return Response(status_code=304, headers=headers)
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return Response(content=body, media_type=media_type, headers=headers)
@@ -0,0 +1,50 @@
+"""프로세스 내 런타임 지표 (카운터 / 누적 시간)
+
+외부 모니터링 의존성 없이 /api/health/metrics 로 노출합니다.
+이름은 "영역.항목" 형식 (예: compression.gzip.bytes_out).
+"""
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+
+class Metrics:
+    """스레드 안전 카운터 모음"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[str, float] = {}
+        self.started_at = time.time()
+
+    def incr(self, name: str, value: float = 1) -> None:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def get(self, name: str) -> float:
+        return self._counters.get(name, 0)
+
+    @contextmanager
+    def timer(self, name: str, clock=time.thread_time) -> Iterator[None]:
+        """블록 실행 시간(기본: 현재 스레드 CPU 시간)을 초 단위로 누적"""
+        started = clock()
+        try:
+            yield
+        finally:
+            self.incr(name, clock() - started)
+
+    def snapshot(self, prefix: str = "") -> Dict[str, float]:
+        with self._lock:
+            return {
+                name: round(value, 6) if isinstance(value, float) else value
+                for name, value in sorted(self._counters.items())
+                if name.startswith(prefix)
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+
+
+# 프로세스 공유 지표
+metrics = Metrics()
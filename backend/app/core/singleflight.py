@@ -0,0 +1,104 @@
+"""키 단위 요청 병합 (single-flight)
+
+같은 키로 동시에 들어온 호출은 진행 중인 한 번의 계산을 함께 기다리고 결과를 공유합니다.
+결과를 저장하지는 않으므로 계산이 끝나면 다음 호출은 새로 실행됩니다.
+- 계산은 별도 Task 로 돌려, 먼저 온 호출자가 취소돼도 기다리는 다른 호출자에게는 영향 없음
+- 기다리는 호출자가 모두 취소되면 계산도 취소
+- 예외는 그때 기다리던 호출자 모두에게 전달 (실패 결과는 공유 후 버림)
+- 지표: singleflight.<이름>.leaders / joins / cancelled
+"""
+import asyncio
+import functools
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+from pydantic import BaseModel
+from app.core.metrics import metrics
+
+
+def normalize_key(value: Any) -> Hashable:
+    """호출 인자 → 해시 가능한 키 (문자열은 공백 정리 + 소문자, dict 는 키 정렬)"""
+    if isinstance(value, str):
+        return " ".join(value.split()).lower()
+    if isinstance(value, BaseModel):
+        value = value.model_dump()
+    if isinstance(value, dict):
+        return tuple(sorted((str(name), normalize_key(item)) for name, item in value.items()))
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = [normalize_key(item) for item in value]
+        return tuple(sorted(items, key=repr) if isinstance(value, (set, frozenset)) else items)
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+class _Call:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """키별 진행 중 계산 레지스트리"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._calls: Dict[Hashable, _Call] = {}
+
+    @property
+    def inflight(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: Hashable, fn: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        """key 로 진행 중인 계산이 있으면 합류, 없으면 fn(*args, **kwargs) 실행"""
+        call = self._calls.get(key)
+        if call is None:
+            call = _Call(asyncio.ensure_future(fn(*args, **kwargs)))
+            self._calls[key] = call
+            call.task.add_done_callback(functools.partial(self._forget, key, call))
+            metrics.incr(f"singleflight.{self.name}.leaders")
+        else:
+            metrics.incr(f"singleflight.{self.name}.joins")
+
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                # 기다리는 호출자가 없으면 계산도 중단
+                # (취소가 끝나기 전에 들어온 같은 키 호출이 취소된 Task 에 합류하지 않도록 먼저 제거)
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+                call.task.cancel()
+                metrics.incr(f"singleflight.{self.name}.cancelled")
+
+    def _forget(self, key: Hashable, call: _Call, task: asyncio.Task) -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
+        if not task.cancelled():
+            # 기다리던 호출자가 없을 때의 예외 경고 방지
+            task.exception()
+
+
+def singleflight(name: str, key: Optional[Callable[..., Hashable]] = None):
+    """
+    async 함수용 데코레이터
+    - key 미지정 시 정규화한 전체 인자를 키로 사용
+    - key 가 None 을 반환하면 병합하지 않고 바로 실행
+    """
+    def decorator(fn: Callable[..., Awaitable[Any]]):
+        flight = SingleFlight(name)
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            flight_key = key(*args, **kwargs) if key else normalize_key((args, kwargs))
+            if flight_key is None:
+                return await fn(*args, **kwargs)
+            return await flight.do(flight_key, fn, *args, **kwargs)
+
+        wrapper.flight = flight
+        return wrapper
+    return decorator
@@ -0,0 +1,43 @@
+"""스트리밍 응답 포맷 (SSE / NDJSON)
+
+서비스 계층은 (이벤트 이름, 데이터) 튜플을 내보내고, 라우터는 요청한 포맷으로 프레임을 만듭니다.
+- sse: "event: <이름>\\ndata: <JSON>\\n\\n"
+- ndjson: {"event": <이름>, "data": <JSON>}\\n
+압축 미들웨어는 두 미디어 타입을 그대로 통과시키므로 프레임이 즉시 전송됩니다.
+"""
+from typing import Any, AsyncIterator, Tuple
+import orjson
+from fastapi.responses import StreamingResponse
+
+
+STREAM_FORMATS = ("sse", "ndjson")
+MEDIA_TYPES = {"sse": "text/event-stream", "ndjson": "application/x-ndjson"}
+
+
+def _dumps(data: Any) -> bytes:
+    return orjson.dumps(data, default=str, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+def sse_event(event: str, data: Any) -> bytes:
+    """Server-Sent Events 프레임"""
+    return b"event: " + event.encode() + b"\ndata: " + _dumps(data) + b"\n\n"
+
+
+def ndjson_event(event: str, data: Any) -> bytes:
+    """NDJSON 한 줄"""
+    return _dumps({"event": event, "data": data}) + b"\n"
+
+
+def stream_response(events: AsyncIterator[Tuple[str, Any]], format: str = "sse") -> StreamingResponse:
+    """이벤트 스트림 → StreamingResponse (프록시 버퍼링 비활성화)"""
+    frame = sse_event if format == "sse" else ndjson_event
+
+    async def frames():
+        async for event, data in events:
+            yield frame(event, data)
+
+    return StreamingResponse(
+        frames(),
+        media_type=MEDIA_TYPES[format],
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -1,10 +1,20 @@
 """FastAPI 메인 애플리케이션"""
+import asyncio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from app.core.config import settings
-from app.db.mongo import connect_to_mongo, close_mongo_connection
-from app.routers import health, qa, problems, recommend, market, advanced, chat
+from app.core.clients import close_http_client, close_openai_client
+from app.core.compression import CompressionMiddleware
+from app.db.mongo import connect_to_mongo, close_mongo_connection, get_database
+from app.services.series_store import store
+from app.services.series_archive import load_archive
+from app.services.live_adapters import configure_sources
+from app.services.calendar_store import calendar, load_calendar
+from app.services.resource_catalog import catalog, load_catalog
+from app.services.problem_bank import problem_bank, refill_worker
+from app.services.llm_cache import LLMCacheControlMiddleware, ensure_indexes as ensure_llm_cache_indexes
+from app.routers import health, qa, problems, recommend, market, advanced, chat, dashboard, admin
 
 
 @asynccontextmanager
@@ -13,9 +23,41 @@ async def lifespan(app: FastAPI):
     # Startup
     print("==> Application Starting...")
     await connect_to_mongo()
+    if settings.SERIES_ARCHIVE_DIR:
+        loaded = load_archive(settings.SERIES_ARCHIVE_DIR, store)
+        print(f"[OK] Series Archive Mapped: {loaded} metrics")
+    try:
+        loaded = await asyncio.wait_for(load_calendar(get_database(), calendar), timeout=5)
+        print(f"[OK] Calendar Loaded: {loaded} events")
+    except Exception as e:
+        print(f"[WARNING] Calendar Load Failed: {e} (using mock calendar)")
+    try:
+        loaded = await asyncio.wait_for(load_catalog(get_database(), catalog), timeout=5)
+        print(f"[OK] Resource Catalog Loaded: {loaded} resources")
+    except Exception as e:
+        print(f"[WARNING] Resource Catalog Load Failed: {e} (using seed catalog)")
+    if settings.LLM_CACHE_ENABLED:
+        try:
+            await asyncio.wait_for(ensure_llm_cache_indexes(get_database()), timeout=5)
+            print("[OK] LLM Cache Index Ready")
+        except Exception as e:
+            print(f"[WARNING] LLM Cache Index Failed: {e} (memory cache only)")
+    if settings.PROBLEM_BANK_ENABLED:
+        try:
+            await asyncio.wait_for(problem_bank.ensure_indexes(), timeout=5)
+            if settings.OPENAI_API_KEY:
+                refill_worker.start()
+                print("[OK] Problem Bank Refill Worker Started")
+        except Exception as e:
+            print(f"[WARNING] Problem Bank Unavailable: {e} (generating on demand)")
+    if configure_sources():
+        print(f"[OK] Market Sources: {', '.join(settings.market_sources)}")
     yield
     # Shutdown
     print("==> Application Shutting Down...")
+    await refill_worker.stop()
+    await close_openai_client()
+    await close_http_client()
     await close_mongo_connection()
 
 
@@ -35,6 +77,13 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# LLM 캐시 우회 헤더 (Cache-Control: no-cache/no-store, X-LLM-Cache: refresh/bypass)
+app.add_middleware(LLMCacheControlMiddleware)
+
+# 응답 압축 (가장 바깥 미들웨어에서 최종 본문을 압축)
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(CompressionMiddleware)
+
 # 라우터 등록
 app.include_router(health.router, prefix=settings.API_PREFIX)
 app.include_router(chat.router, prefix=settings.API_PREFIX)  # 챗봇 (최우선)
@@ -43,6 +92,8 @@ app.include_router(problems.router, prefix=settings.API_PREFIX)
 app.include_router(recommend.router, prefix=settings.API_PREFIX)
 app.include_router(market.router, prefix=settings.API_PREFIX)
 app.include_router(advanced.router, prefix=settings.API_PREFIX)
+app.include_router(dashboard.router, prefix=settings.API_PREFIX)
+app.include_router(admin.router, prefix=settings.API_PREFIX)
 
 
 @app.get("/")
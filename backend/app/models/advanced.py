@@ -1,6 +1,6 @@
 """고급 데이터 모델"""
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 
 
@@ -37,8 +37,11 @@ class ExtendedKPIData(BaseModel):
 
 # ===== Economic Calendar =====
 class CalendarEvent(BaseModel):
+    id: Optional[str] = None
     datetime: str
     indicator: str
+    code: Optional[str] = None
+    country: str = "KR"
     actual: Optional[float] = None
     consensus: Optional[float] = None
     previous: Optional[float] = None
@@ -51,6 +54,9 @@ class CalendarEvent(BaseModel):
 class CalendarResponse(BaseModel):
     events: List[CalendarEvent]
     period: str = "upcoming_week"
+    total: Optional[int] = None
+    page: int = 1
+    page_size: Optional[int] = None
 
 
 # ===== AI Chart Request =====
@@ -97,6 +103,16 @@ class WhatIfResponse(BaseModel):
 
 
 # ===== Market Tickers =====
+class TickerRange(BaseModel):
+    window: str  # "1W", "3M", "52W", "YTD" 등
+    start: str  # 구간 첫 관측일
+    high: float
+    low: float
+    first: float
+    last: float
+    change_pct: Optional[float] = None
+
+
 class TickerData(BaseModel):
     symbol: str
     name: str
@@ -107,6 +123,7 @@ class TickerData(BaseModel):
     range_52w_low: Optional[float] = None
     range_52w_high: Optional[float] = None
     sparkline_7d: List[float] = []
+    ranges: Dict[str, TickerRange] = {}
     source: str = "Mock"
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
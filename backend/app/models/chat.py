@@ -24,6 +24,7 @@ class ChartWidget(BaseModel):
     type: Literal["chart"] = "chart"
     spec: Dict[str, Any]  # {type, series, y2, annotations}
     data: Dict[str, List[Dict[str, Any]]]  # {series_name: [{date, value}]}
+    aligned: Optional[Dict[str, Any]] = None  # {freq, dates, series, values[날짜][시리즈]}
     title: Optional[str] = None
     source: Optional[str] = None
 
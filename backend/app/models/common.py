@@ -1,6 +1,6 @@
 """공통 데이터 모델"""
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 
 
@@ -42,6 +42,7 @@ class RecommendRequest(BaseModel):
     topic: str = Field(..., min_length=1, max_length=200)
     level: str = Field(..., pattern="^(beginner|intermediate|advanced)$")
     purpose: str = Field(..., pattern="^(report|study|data|api)$")
+    count: int = Field(6, ge=1, le=30)
 
 
 class RecommendItem(BaseModel):
@@ -86,6 +87,15 @@ class TrendsData(BaseModel):
     gdp_series: List[TimeSeriesPoint]
 
 
+class RollingStatsResponse(BaseModel):
+    metric: str
+    window: int
+    other: Optional[str] = None
+    latest: Dict[str, Optional[float]]
+    series: Dict[str, List[TimeSeriesPoint]]
+    source: str
+
+
 class NewsItem(BaseModel):
     title: str
     summary: str
@@ -98,6 +108,18 @@ class NewsResponse(BaseModel):
     items: List[NewsItem]
 
 
+# ===== 대시보드 배치 =====
+class DashboardPartError(BaseModel):
+    status: int
+    detail: str
+
+
+class DashboardResponse(BaseModel):
+    version: str
+    parts: Dict[str, Any]
+    errors: Dict[str, DashboardPartError] = {}
+
+
 # ===== 북마크 =====
 class Bookmark(BaseModel):
     title: str
@@ -0,0 +1,37 @@
+"""관리자 라우터"""
+import secrets
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from app.core.config import settings
+from app.services.semantic_cache import semantic_indexes
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+
+def require_admin(x_admin_token: Optional[str] = Header(None)):
+    """X-Admin-Token 헤더 확인 (ADMIN_TOKEN 이 비어 있으면 관리자 API 비활성)"""
+    if not settings.ADMIN_TOKEN:
+        raise HTTPException(status_code=404, detail="관리자 API 가 비활성화되어 있습니다.")
+    if not secrets.compare_digest(x_admin_token or "", settings.ADMIN_TOKEN):
+        raise HTTPException(status_code=401, detail="관리자 토큰이 필요합니다.")
+
+
+@router.get("/semantic-cache", dependencies=[Depends(require_admin)])
+async def semantic_cache_clusters(
+    endpoint: Optional[str] = Query(None, description="qa_chat 또는 qa_summary (미지정 시 전체)"),
+    limit: int = Query(20, ge=1, le=500, description="엔드포인트별 군집 수"),
+):
+    """
+    Q&A 의미 캐시 군집
+    - size: 대표 질문 1 + 바꿔 말한 질문으로 재사용된 횟수 (큰 순)
+    - paraphrases: 최근 재사용된 질문 예시
+    """
+    indexes = semantic_indexes()
+    if endpoint is not None:
+        if endpoint not in indexes:
+            raise HTTPException(status_code=404, detail=f"의미 캐시가 없습니다: {endpoint}")
+        indexes = {endpoint: indexes[endpoint]}
+    return {
+        name: {**index.stats(), "threshold": index.threshold, "clusters": index.clusters(limit)}
+        for name, index in sorted(indexes.items())
+    }
@@ -1,5 +1,6 @@
 """고급 기능 라우터"""
-from fastapi import APIRouter, HTTPException
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Query, Request
 from app.models.advanced import (
     ExtendedKPIData, CalendarResponse,
     TickersResponse, AIChartRequest, AIChartResponse,
@@ -7,50 +8,91 @@ from app.models.advanced import (
     WhatIfRequest, WhatIfResponse
 )
 from app.services.advanced_adapters import (
-    generate_extended_kpis,
-    generate_calendar_events,
-    generate_market_tickers
+    fetch_extended_kpis,
+    fetch_calendar_events,
+    fetch_market_tickers
 )
 from app.services.ai_advanced import (
     generate_chart_from_query,
     get_metric_explanation,
     generate_whatif_scenario
 )
+from app.services.range_index import parse_windows
+from app.services.calendar_store import IMPORTANCE_LEVELS, MAX_PAGE_SIZE
+from app.services.snapshot import snapshot_response
 
 router = APIRouter(tags=["advanced"])
 
 
 @router.get("/market/kpis/extended", response_model=ExtendedKPIData)
-async def get_extended_kpis():
+async def get_extended_kpis(request: Request):
     """
     확장된 KPI 데이터 (스파크라인 포함)
     - 10개 주요 지표
     - 각 지표별 12개월 스파크라인
     - MoM, YoY 변화율
     """
-    return generate_extended_kpis()
+    return snapshot_response(request, await fetch_extended_kpis(), "kpis_extended")
 
 
 @router.get("/market/calendar", response_model=CalendarResponse)
-async def get_calendar():
+async def get_calendar(
+    request: Request,
+    from_: Optional[str] = Query(None, alias="from", description="시작 (YYYY-MM-DD[ HH:MM])"),
+    to: Optional[str] = Query(None, description="종료 (YYYY-MM-DD[ HH:MM], 날짜만 주면 그날 포함)"),
+    country: Optional[str] = Query(None, description="쉼표 구분 국가 코드 (예: KR,US)"),
+    importance: Optional[str] = Query(None, description="쉼표 구분 중요도 (low, medium, high)"),
+    page: int = Query(1, ge=1),
+    page_size: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+):
     """
     경제 지표 캘린더
-    - 다음 주 주요 발표 일정
+    - 기간 미지정 시 다음 주 주요 발표 일정
+    - 국가/중요도 필터, 페이지네이션
     - Actual, Consensus, Previous
     - Surprise (차이) 계산
     """
-    return generate_calendar_events()
+    importances = _split(importance)
+    if importances and not set(importances) <= set(IMPORTANCE_LEVELS):
+        raise HTTPException(status_code=400, detail=f"중요도는 {', '.join(IMPORTANCE_LEVELS)} 중 하나여야 합니다.")
+    try:
+        snapshot = await fetch_calendar_events(
+            start=from_,
+            end=to,
+            countries=_split(country),
+            importances=importances,
+            page=page,
+            page_size=page_size,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"잘못된 날짜 형식: {e}")
+    return snapshot_response(request, snapshot, "calendar")
+
+
+def _split(value: Optional[str]) -> Optional[list]:
+    """쉼표 구분 쿼리 파라미터 → 리스트"""
+    if not value:
+        return None
+    return [item.strip() for item in value.split(",") if item.strip()] or None
 
 
 @router.get("/market/tickers", response_model=TickersResponse)
-async def get_tickers():
+async def get_tickers(
+    request: Request,
+    windows: Optional[str] = Query(None, description="쉼표 구분 조회 구간 (예: 1W,1M,3M,52W,YTD,10D)")
+):
     """
     실시간 마켓 티커
     - 환율, 증시, 원자재, 국채
     - 7일 스파크라인
     - 1D/1W/1M 변화율
+    - windows 지정 시 구간별 high/low/first/last
     """
-    return generate_market_tickers()
+    try:
+        parsed = parse_windows(windows)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return snapshot_response(request, await fetch_market_tickers(parsed), "tickers")
 
 
 @router.post("/ai/chart", response_model=AIChartResponse)
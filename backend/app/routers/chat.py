@@ -1,14 +1,59 @@
 """챗봇 라우터"""
-from fastapi import APIRouter, HTTPException, Depends
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from fastapi import APIRouter, HTTPException, Depends, Request
 from app.models.chat import ChatRequest, ChatResponse, ChatMessage
-from app.services.chat_service import chat_with_tools, generate_auto_briefing
+from app.services.chat_service import BRIEFING_PROMPT, chat_with_tools, generate_auto_briefing, stream_chat
 from app.db.mongo import get_database
+from app.core.http_cache import conditional_response
+from app.core.streaming import stream_response
+from app.services.snapshot import encode
 from motor.motor_asyncio import AsyncIOMotorDatabase
 import uuid
 
 router = APIRouter(prefix="/chat", tags=["chat"])
 
 
+def _optional_database() -> Optional[AsyncIOMotorDatabase]:
+    """MongoDB 미연결이어도 대화는 진행"""
+    try:
+        return get_database()
+    except Exception:
+        return None
+
+
+async def load_history(db: Optional[AsyncIOMotorDatabase], session_id: str) -> List[ChatMessage]:
+    """세션 히스토리 최근 10개 (MongoDB 연결 실패 시 빈 히스토리)"""
+    if db is None:
+        return []
+    try:
+        session_doc = await db.sessions.find_one({"session_id": session_id})
+        if session_doc and "history" in session_doc:
+            return [ChatMessage(**msg) for msg in session_doc["history"][-10:]]
+    except Exception:
+        pass
+    return []
+
+
+async def save_session(db: Optional[AsyncIOMotorDatabase], session_id: str, messages: List[Dict[str, Any]]) -> None:
+    if db is None:
+        return
+    try:
+        await db.sessions.update_one(
+            {"session_id": session_id},
+            {
+                "$set": {
+                    "session_id": session_id,
+                    "history": messages,
+                    "updated_at": datetime.utcnow()
+                }
+            },
+            upsert=True
+        )
+    except Exception as e:
+        print(f"Session save error: {e}")
+
+
 @router.post("")
 async def chat(request: ChatRequest):
     """
@@ -19,11 +64,7 @@ async def chat(request: ChatRequest):
     """
     try:
         # MongoDB dependency를 optional로 처리
-        db = None
-        try:
-            db = get_database()
-        except Exception:
-            pass
+        db = _optional_database()
         # 세션 ID 생성 또는 사용
         session_id = request.session_id or str(uuid.uuid4())
         
@@ -32,16 +73,7 @@ async def chat(request: ChatRequest):
             result = await generate_auto_briefing(session_id)
         else:
             # 세션 히스토리 로드 (MongoDB에서)
-            session_history = []
-            if db is not None:
-                try:
-                    session_doc = await db.sessions.find_one({"session_id": session_id})
-                    if session_doc and "history" in session_doc:
-                        session_history = [
-                            ChatMessage(**msg) for msg in session_doc["history"][-10:]
-                        ]
-                except Exception:
-                    pass  # MongoDB 연결 실패 시 빈 히스토리로 진행
+            session_history = await load_history(db, session_id)
             
             # 챗봇 실행
             result = await chat_with_tools(
@@ -51,21 +83,7 @@ async def chat(request: ChatRequest):
             )
         
         # 세션 저장 (MongoDB)
-        if db is not None:
-            try:
-                await db.sessions.update_one(
-                    {"session_id": session_id},
-                    {
-                        "$set": {
-                            "session_id": session_id,
-                            "history": result["messages"],
-                            "updated_at": datetime.now()
-                        }
-                    },
-                    upsert=True
-                )
-            except Exception as e:
-                print(f"Session save error: {e}")
+        await save_session(db, session_id, result["messages"])
         
         # ChatMessage 객체로 변환
         messages = []
@@ -103,6 +121,42 @@ async def chat(request: ChatRequest):
         raise HTTPException(status_code=500, detail=f"챗봇 오류: {str(e)}")
 
 
+@router.post("/stream")
+async def chat_stream(request: ChatRequest):
+    """
+    챗봇 대화 (SSE 스트리밍)
+    - token: 어시스턴트 토큰 (도착 즉시)
+    - tool_start / tool_end: 툴 실행 시작/완료
+    - widget: make_chart 완료 즉시 위젯
+    - done: 후속 질문 제안, 출처
+    - error: 도중 실패
+    """
+    db = _optional_database()
+    session_id = request.session_id or str(uuid.uuid4())
+    if request.auto_brief:
+        message, session_history = BRIEFING_PROMPT, []
+    else:
+        message, session_history = request.message, await load_history(db, session_id)
+
+    async def events():
+        yield "session", {"session_id": session_id}
+        try:
+            async for event, data in stream_chat(session_id, message, session_history):
+                if event == "done":
+                    await save_session(db, session_id, data["messages"])
+                    data = {
+                        "session_id": session_id,
+                        "suggestions": data["suggestions"],
+                        "sources": data["sources"],
+                    }
+                yield event, data
+        except Exception as e:
+            print(f"[WARNING] Chat stream failed: {e}")
+            yield "error", {"detail": f"챗봇 오류: {str(e)}"}
+
+    return stream_response(events())
+
+
 @router.get("/briefing")
 async def get_auto_briefing():
     """
@@ -125,9 +179,13 @@ async def get_auto_briefing():
 @router.get("/sessions/{session_id}")
 async def get_session(
     session_id: str,
+    request: Request,
     db: AsyncIOMotorDatabase = Depends(get_database)
 ):
-    """세션 기록 조회"""
+    """
+    세션 기록 조회
+    - ETag(내용 해시) / Last-Modified(updated_at) 기반 304 응답
+    """
     try:
         session_doc = await db.sessions.find_one({"session_id": session_id})
         
@@ -137,7 +195,12 @@ async def get_session(
         # ObjectId 변환
         session_doc["_id"] = str(session_doc["_id"])
         
-        return session_doc
+        return conditional_response(
+            request,
+            encode(session_doc),
+            "session",
+            last_modified=session_doc.get("updated_at"),
+        )
     
     except HTTPException:
         raise
@@ -0,0 +1,27 @@
+"""대시보드 배치 라우터"""
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Query, Request
+from app.models.common import DashboardResponse
+from app.services.dashboard import PARTS, parse_parts, resolve_dashboard
+from app.core.http_cache import conditional_response
+
+router = APIRouter(tags=["dashboard"])
+
+
+@router.get("/dashboard", response_model=DashboardResponse)
+async def get_dashboard(
+    request: Request,
+    parts: Optional[str] = Query(None, description=f"쉼표 구분 파트 ({', '.join(PARTS)})"),
+    windows: Optional[str] = Query(None, description="tickers 파트의 조회 구간 (예: 1W,1M,52W)"),
+):
+    """
+    대시보드 첫 화면 배치 조회
+    - 요청한 파트를 서버에서 동시에 조회해 한 번에 응답
+    - 파트별 실패는 errors 에 기록하고 나머지 파트는 정상 응답
+    - 미지정 시 kpis, trends, news
+    """
+    try:
+        names = parse_parts(parts)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return conditional_response(request, await resolve_dashboard(names, windows), "dashboard")
@@ -1,7 +1,12 @@
 """헬스 체크 라우터"""
+import time
 from fastapi import APIRouter
 from app.models.common import HealthResponse
 from app.core.config import settings
+from app.core.compression import available_encodings
+from app.core.metrics import metrics
+from app.services.llm_cache import llm_cache
+from app.services.semantic_cache import semantic_indexes
 
 router = APIRouter(tags=["health"])
 
@@ -14,3 +19,32 @@ async def health_check():
         app_name=settings.APP_NAME
     )
 
+
+
+@router.get("/health/metrics")
+async def runtime_metrics():
+    """
+    런타임 지표
+    - 압축: 인코딩별 응답 수, 전/후 바이트, CPU 시간, 압축률, MB 당 CPU ms
+    - LLM 응답 캐시: 엔드포인트별 적중률, 의미 캐시 항목/군집 수
+    - 스냅샷 캐시 적중/빌드 수 등
+    """
+    counters = metrics.snapshot()
+    compression = {}
+    for encoding in available_encodings():
+        prefix = f"compression.{encoding}."
+        bytes_in = counters.get(prefix + "bytes_in", 0)
+        bytes_out = counters.get(prefix + "bytes_out", 0)
+        cpu = counters.get(prefix + "cpu_seconds", 0)
+        compression[encoding] = {
+            "ratio": round(bytes_out / bytes_in, 4) if bytes_in else None,
+            "saved_bytes": bytes_in - bytes_out,
+            "cpu_ms_per_mb": round(cpu * 1000 / (bytes_in / 1_048_576), 3) if bytes_in else None,
+        }
+    return {
+        "uptime_seconds": round(time.time() - metrics.started_at, 1),
+        "compression": compression,
+        "llm_cache": llm_cache.stats(),
+        "semantic_cache": {name: index.stats() for name, index in semantic_indexes().items()},
+        "counters": counters,
+    }
@@ -1,36 +1,66 @@
 """시장 데이터 라우터"""
-from fastapi import APIRouter
-from app.models.common import KPIData, TrendsData, NewsResponse
-from app.services.market_adapters import (
-    generate_mock_kpis,
-    generate_mock_trends,
-    generate_mock_news
-)
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Query, Request
+from app.models.common import KPIData, TrendsData, NewsResponse, RollingStatsResponse
+from app.services.market_adapters import kpis_snapshot, trends_snapshot, news_snapshot
+from app.services.rolling import DEFAULT_WINDOW, engine as rolling_engine
+from app.services.snapshot import encode, snapshot_response
+from app.core.http_cache import conditional_response
 
 router = APIRouter(prefix="/market", tags=["market"])
 
 
 @router.get("/kpis", response_model=KPIData)
-async def get_kpis():
+async def get_kpis(request: Request):
     """
     주요 경제 지표 조회
     """
-    return generate_mock_kpis()
+    return snapshot_response(request, kpis_snapshot(), "kpis")
 
 
 @router.get("/trends", response_model=TrendsData)
-async def get_trends():
+async def get_trends(request: Request):
     """
     경제 트렌드 시계열 데이터
     """
-    return generate_mock_trends()
+    return snapshot_response(request, trends_snapshot(), "trends")
 
 
 @router.get("/news", response_model=NewsResponse)
-async def get_news():
+async def get_news(request: Request):
     """
     경제 뉴스 조회
     """
-    news_items = generate_mock_news()
-    return NewsResponse(items=news_items)
+    return snapshot_response(request, news_snapshot(), "news")
 
+
+
+@router.get("/series/{metric:path}/rolling", response_model=RollingStatsResponse)
+async def get_rolling_stats(
+    request: Request,
+    metric: str,
+    stats: str = Query("sma,std", description="쉼표 구분 (sma, ema, std, zscore, drawdown, corr)"),
+    window: int = Query(DEFAULT_WINDOW, ge=2),
+    other: Optional[str] = Query(None, description="corr 비교 지표"),
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+):
+    """
+    롤링 통계 (이동평균, 변동성, z-score, 낙폭, 상관계수)
+    - 윈도우 단위는 관측치 개수
+    - 지표/통계/윈도우별로 캐시된 배열에서 응답
+    """
+    try:
+        result = rolling_engine.summary(
+            metric,
+            [stat.strip() for stat in stats.split(",") if stat.strip()],
+            window,
+            other,
+            start,
+            end,
+        )
+    except LookupError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return conditional_response(request, encode(RollingStatsResponse(**result)), "rolling")
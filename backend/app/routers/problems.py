@@ -1,7 +1,10 @@
 """경제 문제 생성 라우터"""
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 from app.models.common import ProblemGenRequest, ProblemGenResponse
-from app.services.openai_svc import generate_problems
+from app.services.openai_svc import generate_problems, stream_problems
+from app.services.problem_bank import problem_bank
+from app.services.problem_templates import generate_template_problems, template_count
+from app.core.streaming import STREAM_FORMATS, stream_response
 
 router = APIRouter(prefix="/problems", tags=["problems"])
 
@@ -10,14 +13,21 @@ router = APIRouter(prefix="/problems", tags=["problems"])
 async def create_problems(request: ProblemGenRequest):
     """
     경제 문제 생성
+    - 객관식은 PROBLEM_TEMPLATE_SHARE 만큼 템플릿 계산 문제로 채움
+    - 나머지는 문제 은행에서 먼저 꺼내고, 부족한 만큼만 즉시 생성
     """
     try:
-        items = await generate_problems(
-            level=request.level,
-            topic=request.topic,
-            count=request.count,
-            style=request.style
+        items = generate_template_problems(
+            request.level, request.topic, template_count(request.count, request.style)
         )
+        items += await problem_bank.draw(request.level, request.topic, request.style, request.count - len(items))
+        if len(items) < request.count:
+            items += await generate_problems(
+                level=request.level,
+                topic=request.topic,
+                count=request.count - len(items),
+                style=request.style
+            )
         
         return ProblemGenResponse(
             items=items,
@@ -27,3 +37,42 @@ async def create_problems(request: ProblemGenRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"문제 생성 실패: {str(e)}")
 
+
+@router.post("/stream")
+async def stream_problems_endpoint(
+    request: ProblemGenRequest,
+    format: str = Query("ndjson", pattern=f"^({'|'.join(STREAM_FORMATS)})$", description="ndjson 또는 sse"),
+):
+    """
+    경제 문제 스트리밍 생성
+    - problem: 문제 하나가 완성될 때마다 {index, question, options, answer, explain}
+      (템플릿 계산 문제, 문제 은행에 있는 문제를 먼저 보내고, 부족한 만큼만 생성)
+    - done: {count, level, topic}
+    - error: 도중 실패 (이미 보낸 문제는 유지)
+    """
+    async def events():
+        count = 0
+        try:
+            ready = generate_template_problems(
+                request.level, request.topic, template_count(request.count, request.style)
+            )
+            ready += await problem_bank.draw(request.level, request.topic, request.style, request.count - len(ready))
+            for problem in ready:
+                yield "problem", {"index": count, **problem.model_dump()}
+                count += 1
+            if count < request.count:
+                async for problem in stream_problems(
+                    level=request.level,
+                    topic=request.topic,
+                    count=request.count - count,
+                    style=request.style
+                ):
+                    yield "problem", {"index": count, **problem.model_dump()}
+                    count += 1
+        except Exception as e:
+            print(f"[WARNING] Problem stream failed: {e}")
+            yield "error", {"detail": f"문제 생성 실패: {str(e)}"}
+            return
+        yield "done", {"count": count, "level": request.level, "topic": request.topic}
+
+    return stream_response(events(), format)
@@ -1,7 +1,15 @@
 """Q&A 라우터"""
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 from app.models.common import QARequest, QAResponse
-from app.services.openai_svc import generate_summary, generate_chat_response
+from app.services.openai_svc import (
+    SUMMARY_PROMPT,
+    build_qa_messages,
+    generate_summary,
+    generate_summary_answer,
+    generate_chat_response,
+    stream_answer,
+)
+from app.core.streaming import STREAM_FORMATS, stream_response
 from datetime import datetime
 
 router = APIRouter(prefix="/qa", tags=["qa"])
@@ -42,3 +50,50 @@ async def chat(request: QARequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"응답 생성 실패: {str(e)}")
 
+
+def _stream(messages, format: str, label: str, cached, *cache_args):
+    """
+    스트림 도중 실패는 error 이벤트로 전달 (이미 보낸 조각은 유지)
+    - cached: 비스트리밍 엔드포인트와 공유하는 LLM 캐시 함수
+    """
+    async def events():
+        try:
+            async for event, data in stream_answer(messages, cached, cache_args):
+                yield event, data
+        except Exception as e:
+            print(f"[WARNING] QA stream failed: {e}")
+            yield "error", {"detail": f"{label} 실패: {str(e)}"}
+    return stream_response(events(), format)
+
+
+@router.post("/summary/stream")
+async def create_summary_stream(
+    request: QARequest,
+    format: str = Query("sse", pattern=f"^({'|'.join(STREAM_FORMATS)})$", description="sse 또는 ndjson"),
+):
+    """
+    경제 요약 스트리밍
+    - delta: 텍스트 조각 (도착 즉시)
+    - citations: 출처 (스트림 중 점진적으로 추출해 마지막에 전송)
+    - done / error
+    """
+    try:
+        messages = build_qa_messages(request.question, request.context, SUMMARY_PROMPT)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return _stream(messages, format, "요약 생성", generate_summary_answer, request.question, request.context)
+
+
+@router.post("/chat/stream")
+async def chat_stream(
+    request: QARequest,
+    format: str = Query("sse", pattern=f"^({'|'.join(STREAM_FORMATS)})$", description="sse 또는 ndjson"),
+):
+    """
+    Q&A 채팅 스트리밍 (이벤트는 /qa/summary/stream 과 같음)
+    """
+    try:
+        messages = build_qa_messages(request.question, request.context)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return _stream(messages, format, "응답 생성", generate_chat_response, request.question, request.context)
@@ -12,13 +12,14 @@ router = APIRouter(prefix="/recommend", tags=["recommend"])
 @router.post("", response_model=RecommendResponse)
 async def get_recommendations(request: RecommendRequest):
     """
-    자료 추천 생성
+    자료 추천 (로컬 자료 카탈로그 검색, 같은 조건이면 같은 결과)
     """
     try:
         items = await generate_recommendations(
             topic=request.topic,
             level=request.level,
-            purpose=request.purpose
+            purpose=request.purpose,
+            count=request.count
         )
         
         return RecommendResponse(items=items)
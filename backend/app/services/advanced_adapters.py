@@ -1,235 +1,227 @@
 """고급 시장 데이터 어댑터"""
 from datetime import datetime, timedelta
-from typing import List
-import random
+from typing import Dict, Any, List, Optional
+import numpy as np
 from app.models.advanced import (
     KPIDetail, SparklinePoint, ExtendedKPIData,
     CalendarEvent, CalendarResponse,
     TickerData, TickersResponse
 )
+from app.services.series_store import store
+from app.services.derived import engine
+from app.services.downsample import budget_for, downsample, cache as downsample_cache
+from app.services.range_index import ranges as range_index
+from app.services.calendar_store import calendar, persist_events
+from app.services.live_adapters import LiveSnapshot, fan_out
+from app.services.snapshot import Snapshot, Version, data_version, snapshots
 
 
-def generate_sparkline(base_value: float, months: int = 12) -> List[SparklinePoint]:
-    """스파크라인 데이터 생성"""
-    sparkline = []
-    current_date = datetime.now()
-    
-    for i in range(months):
-        date = current_date - timedelta(days=30 * (months - i - 1))
-        # 약간의 변동성 추가
-        value = base_value + random.uniform(-base_value * 0.1, base_value * 0.1)
-        sparkline.append(SparklinePoint(
-            date=date.strftime("%Y-%m"),
-            value=round(value, 2)
-        ))
-    
-    return sparkline
-
-
-def generate_extended_kpis() -> ExtendedKPIData:
-    """확장된 KPI 데이터 생성"""
-    return ExtendedKPIData(
-        cpi=KPIDetail(
-            value=110.5,
-            mom=0.3,
-            yoy=2.3,
-            sparkline=generate_sparkline(110.0, 12),
-            source="통계청",
-        ),
-        core_cpi=KPIDetail(
-            value=108.2,
-            mom=0.2,
-            yoy=2.0,
-            sparkline=generate_sparkline(108.0, 12),
-            source="통계청",
-        ),
-        policy_rate=KPIDetail(
-            value=3.50,
-            mom=0.0,
-            yoy=0.75,
-            sparkline=generate_sparkline(3.5, 12),
-            source="한국은행",
-        ),
-        unemployment=KPIDetail(
-            value=3.4,
-            mom=-0.1,
-            yoy=-0.3,
-            sparkline=generate_sparkline(3.4, 12),
-            source="통계청",
-        ),
-        gdp_growth=KPIDetail(
-            value=2.2,
-            mom=0.6,  # QoQ
-            yoy=2.2,
-            sparkline=generate_sparkline(2.2, 12),
-            source="한국은행",
-        ),
-        usdkrw=KPIDetail(
-            value=1335.50,
-            mom=5.20,
-            yoy=45.30,
-            sparkline=generate_sparkline(1335, 12),
-            source="서울외환중개",
-        ),
-        kospi=KPIDetail(
-            value=2655.20,
-            mom=1.12,
-            yoy=8.45,
-            sparkline=generate_sparkline(2655, 12),
-            source="한국거래소",
-        ),
-        spx=KPIDetail(
-            value=4783.45,
-            mom=0.85,
-            yoy=15.23,
-            sparkline=generate_sparkline(4783, 12),
-            source="S&P",
-        ),
-        pmi_manufacturing=KPIDetail(
-            value=51.2,
-            mom=0.5,
-            yoy=2.1,
-            sparkline=generate_sparkline(51, 12),
-            source="S&P Global",
-        ),
-        retail_sales=KPIDetail(
-            value=3.8,
-            mom=0.4,
-            yoy=3.8,
-            sparkline=generate_sparkline(3.8, 12),
-            source="통계청",
-        ),
-    )
+def generate_sparkline(metric: str, months: int = 12, values: Optional[np.ndarray] = None) -> List[SparklinePoint]:
+    """
+    스파크라인 데이터 (공유 시계열 저장소의 최근 구간)
+    - values 를 주면 같은 날짜축의 파생 배열(예: YoY)을 사용
+    - 일별 시계열은 스파크라인 포인트 예산에 맞춰 LTTB 로 축약
+    """
+    series = store.ensure(metric)
+    if not len(series):
+        return []
+    start = series.dates[-1].astype("datetime64[M]") - (months - 1)
+    budget = budget_for("sparkline")
+    if values is None:
+        dates, values = downsample_cache.get(metric, start, budget=budget)
+    else:
+        lo, hi = series.bounds(start)
+        dates, values = downsample(series.dates[lo:hi], values[lo:hi], budget)
+    labels = series.labels(dates)
+    return [
+        SparklinePoint(date=label, value=value)
+        for label, value in zip(labels, values.round(2).tolist())
+    ]
 
 
-def generate_calendar_events() -> CalendarResponse:
-    """경제 지표 캘린더 생성"""
-    now = datetime.now()
-    events = []
-    
-    # 다음 주 이벤트들
-    indicators = [
-        ("CPI (YoY)", 2.3, 2.4, 2.5, "high", "통계청"),
-        ("실업률", 3.4, 3.5, 3.5, "medium", "통계청"),
-        ("소매판매 (YoY)", 3.8, 3.5, 3.2, "medium", "통계청"),
-        ("무역수지 (억$)", 42.5, 38.0, 35.2, "high", "관세청"),
-        ("산업생산 (YoY)", 2.1, 2.3, 2.8, "medium", "통계청"),
-        ("기준금리 결정", 3.50, 3.50, 3.50, "high", "한국은행"),
-    ]
-    
-    for i, (indicator, actual, consensus, previous, importance, source) in enumerate(indicators):
-        event_date = now + timedelta(days=i + 1)
-        surprise = actual - consensus if actual and consensus else None
-        
-        events.append(CalendarEvent(
-            datetime=event_date.strftime("%Y-%m-%d %H:%M"),
-            indicator=indicator,
-            actual=actual if random.random() > 0.5 else None,  # 50% 이미 발표됨
-            consensus=consensus,
-            previous=previous,
-            surprise=surprise,
-            importance=importance,
-            source=source,
-            source_url=f"https://example.com/{indicator.replace(' ', '_')}"
-        ))
-    
+# 확장 KPI 구성: (필드, 지표, 값 기간, MoM 기간, 출처)
+# - 값 기간이 있으면 표시 값도 파생 값 (예: GDP 성장률 = 실질 GDP 의 YoY)
+EXTENDED_KPIS = [
+    ("cpi", "CPI", None, "mom", "통계청"),
+    ("core_cpi", "CORE_CPI", None, "mom", "통계청"),
+    ("policy_rate", "POLICY_RATE", None, "mom", "한국은행"),
+    ("unemployment", "UNEMPLOYMENT", None, "mom", "통계청"),
+    ("gdp_growth", "GDP", "yoy", "qoq", "한국은행"),  # mom = QoQ
+    ("usdkrw", "USD/KRW", None, "mom", "서울외환중개"),
+    ("kospi", "KOSPI", None, "mom", "한국거래소"),
+    ("spx", "SPX", None, "mom", "S&P"),
+    ("pmi_manufacturing", "PMI_MANUFACTURING", None, "mom", "S&P Global"),
+    ("retail_sales", "RETAIL_SALES", None, "mom", "통계청"),
+]
+
+
+def _freshness(live: Optional[LiveSnapshot], key: str, source: str) -> Dict[str, Any]:
+    """실시간 시세가 있으면 값/출처/기준시각을 덮어씀"""
+    quote = live.quote(key) if live else None
+    if quote is None:
+        return {"source": source}
+    return {"value": quote["value"], "source": quote["source"], "updated_at": quote["updated_at"]}
+
+
+def _kpi_detail(metric: str, value_period: Optional[str], mom_period: str) -> Dict[str, Any]:
+    """파생 엔진 캐시에서 값/MoM/YoY/스파크라인 구성"""
+    if value_period:
+        changes = engine.changes(metric, value_period)
+        value = engine.latest(metric, value_period)
+        yoy = engine.latest(metric, "yoy")
+        sparkline = generate_sparkline(metric, 12, values=changes)
+    else:
+        value = engine.last_value(metric)
+        yoy = engine.latest(metric, "yoy")
+        sparkline = generate_sparkline(metric, 12)
+    return {
+        "value": value if value is not None else 0.0,
+        "mom": engine.latest(metric, mom_period),
+        "yoy": yoy,
+        "sparkline": sparkline,
+    }
+
+
+def generate_extended_kpis(live: Optional[LiveSnapshot] = None) -> ExtendedKPIData:
+    """
+    확장된 KPI 데이터 생성
+    - MoM/YoY 는 저장소 시계열에서 파생 (비율 지표는 %p 차분)
+    - live 시세가 있는 지표는 실시간 값 사용
+    """
+    fields = {}
+    for field, metric, value_period, mom_period, source in EXTENDED_KPIS:
+        fields[field] = KPIDetail(**{
+            **_kpi_detail(metric, value_period, mom_period),
+            **_freshness(live, metric, source),
+        })
+    return ExtendedKPIData(**fields)
+
+
+def generate_calendar_events(
+    live: Optional[LiveSnapshot] = None,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    countries: Optional[List[str]] = None,
+    importances: Optional[List[str]] = None,
+    page: int = 1,
+    page_size: int = 50,
+) -> CalendarResponse:
+    """
+    경제 지표 캘린더 조회 (캘린더 저장소 인덱스)
+    - 기간 미지정 시 지금부터 7일
+    - live 소스 일정은 fetch_calendar_events 에서 검증/저장된 뒤 저장소로 함께 조회됨
+    """
+    period = f"{start or 'now'} ~ {end or '+7days'}"
+    if start is None and end is None:
+        now = datetime.now()
+        start, end = now.strftime("%Y-%m-%d %H:%M"), now + timedelta(days=7)
+        period = "upcoming_week"
+
+    events, total = calendar.query(start, end, countries, importances, page, page_size)
     return CalendarResponse(
-        events=events,
-        period="upcoming_week"
+        events=[CalendarEvent(**event) for event in events],
+        period=period,
+        total=total,
+        page=page,
+        page_size=page_size,
     )
 
 
-def generate_market_tickers() -> TickersResponse:
-    """마켓 티커 데이터 생성"""
-    tickers = [
-        TickerData(
-            symbol="USD/KRW",
-            name="달러/원",
-            last=1335.50,
-            change_1d_pct=0.39,
-            change_1w_pct=1.12,
-            change_1m_pct=2.35,
-            range_52w_low=1250.00,
-            range_52w_high=1380.00,
-            sparkline_7d=[1328, 1330, 1332, 1329, 1333, 1336, 1335.5],
-            source="서울외환중개",
-        ),
-        TickerData(
-            symbol="JPY/KRW",
-            name="엔/원 (100엔)",
-            last=898.20,
-            change_1d_pct=-0.15,
-            change_1w_pct=-0.82,
-            change_1m_pct=-2.14,
-            sparkline_7d=[902, 900, 901, 899, 897, 898, 898.2],
-            source="서울외환중개",
-        ),
-        TickerData(
-            symbol="KOSPI",
-            name="코스피",
-            last=2655.20,
-            change_1d_pct=1.12,
-            change_1w_pct=2.35,
-            change_1m_pct=5.67,
-            range_52w_low=2300.00,
-            range_52w_high=2750.00,
-            sparkline_7d=[2610, 2625, 2640, 2630, 2645, 2650, 2655],
-            source="한국거래소",
-        ),
-        TickerData(
-            symbol="SPX",
-            name="S&P 500",
-            last=4783.45,
-            change_1d_pct=0.85,
-            change_1w_pct=1.67,
-            change_1m_pct=4.23,
-            range_52w_low=4100.00,
-            range_52w_high=4850.00,
-            sparkline_7d=[4720, 4735, 4750, 4745, 4765, 4775, 4783],
-            source="S&P Global",
-        ),
-        TickerData(
-            symbol="GOLD",
-            name="금 (온스)",
-            last=2045.30,
-            change_1d_pct=-0.23,
-            change_1w_pct=1.45,
-            change_1m_pct=3.89,
-            sparkline_7d=[2020, 2025, 2035, 2040, 2042, 2048, 2045],
-            source="COMEX",
-        ),
-        TickerData(
-            symbol="WTI",
-            name="WTI 원유",
-            last=78.45,
-            change_1d_pct=2.15,
-            change_1w_pct=3.67,
-            change_1m_pct=-1.23,
-            sparkline_7d=[76, 75, 76.5, 77, 77.5, 77, 78.45],
-            source="NYMEX",
-        ),
-        TickerData(
-            symbol="KR3YT",
-            name="국채 3년",
-            last=3.42,
-            change_1d_pct=0.05,
-            change_1w_pct=0.12,
-            sparkline_7d=[3.38, 3.39, 3.40, 3.41, 3.42, 3.41, 3.42],
-            source="한국거래소",
-        ),
-        TickerData(
-            symbol="KR10YT",
-            name="국채 10년",
-            last=3.68,
-            change_1d_pct=0.08,
-            change_1w_pct=0.15,
-            sparkline_7d=[3.62, 3.63, 3.65, 3.66, 3.68, 3.67, 3.68],
-            source="한국거래소",
-        ),
-    ]
+# 티커 구성: (심볼 = 저장소 일별 시계열, 표시 이름)
+TICKERS = [
+    ("USD/KRW", "달러/원"),
+    ("JPY/KRW", "엔/원 (100엔)"),
+    ("KOSPI", "코스피"),
+    ("SPX", "S&P 500"),
+    ("GOLD", "금 (온스)"),
+    ("WTI", "WTI 원유"),
+    ("KR3YT", "국채 3년"),
+    ("KR10YT", "국채 10년"),
+]
+
+
+def _ticker(symbol: str, name: str, windows: List[str]) -> TickerData:
+    """일별 시계열 + 파생 엔진 캐시 + 구간 인덱스로 티커 구성"""
+    series = store.ensure(symbol)
+    ranges = range_index.ranges(symbol, list(dict.fromkeys(["52W", *windows])))
+    range_52w = ranges.get("52W", {})
+    _, recent = downsample_cache.get(symbol, series.dates[-7], budget=budget_for("sparkline_7d"))
+    return TickerData(
+        symbol=symbol,
+        name=name,
+        last=engine.last_value(symbol) or 0.0,
+        change_1d_pct=engine.latest(symbol, "1d", "pct") or 0.0,
+        change_1w_pct=engine.latest(symbol, "1w", "pct"),
+        change_1m_pct=engine.latest(symbol, "1m", "pct"),
+        range_52w_low=range_52w.get("low"),
+        range_52w_high=range_52w.get("high"),
+        sparkline_7d=recent.round(2).tolist(),
+        ranges={window: ranges[window] for window in windows if window in ranges},
+        source=series.source,
+    )
+
+
+def generate_market_tickers(
+    live: Optional[LiveSnapshot] = None,
+    windows: Optional[List[str]] = None,
+) -> TickersResponse:
+    """
+    마켓 티커 데이터 생성 (live 시세가 있는 심볼은 실시간 값 사용)
+    - windows: 구간별 high/low/first/last (예: ["1W", "1M", "3M", "52W"])
+    """
+    tickers = [_ticker(symbol, name, windows or []) for symbol, name in TICKERS]
+    
+    if live:
+        for i, ticker in enumerate(tickers):
+            quote = live.quote(ticker.symbol)
+            if quote:
+                tickers[i] = ticker.model_copy(update={
+                    "last": quote["value"],
+                    "source": quote["source"],
+                    "updated_at": quote["updated_at"],
+                })
     
     return TickersResponse(
         tickers=tickers,
         category="mixed"
     )
 
+
+# ===== 실시간 소스 fan-out + 스냅샷 =====
+# 소스를 동시에 조회한 뒤, 데이터 버전이 같으면 인코딩된 스냅샷을 재사용
+# live/version 을 넘기면 (대시보드 배치처럼) 이미 조회한 결과를 공유
+async def fetch_extended_kpis(live: Optional[LiveSnapshot] = None, version: Optional[Version] = None) -> Snapshot:
+    live = live if live is not None else await fan_out()
+    return snapshots.get(
+        ("kpis_extended",), version or (lambda: data_version(live)), lambda: generate_extended_kpis(live)
+    )
+
+
+async def fetch_calendar_events(
+    live: Optional[LiveSnapshot] = None, version: Optional[Version] = None, **query
+) -> Snapshot:
+    live = live if live is not None else await fan_out()
+    if live.events:
+        # 검증을 통과해 새로 반영된 일정만 저장 (재시작 후에도 유지)
+        await persist_events(calendar.apply(live.events))
+    key = ("calendar",) + tuple(
+        (name, tuple(value) if isinstance(value, list) else value)
+        for name, value in sorted(query.items())
+    )
+    if query.get("start") is None and query.get("end") is None:
+        # "지금부터 7일" 기본 구간은 시간 단위로 갱신
+        key += (datetime.now().strftime("%Y-%m-%d %H"),)
+    return snapshots.get(key, version or (lambda: data_version(live)), lambda: generate_calendar_events(live, **query))
+
+
+async def fetch_market_tickers(
+    windows: Optional[List[str]] = None,
+    live: Optional[LiveSnapshot] = None,
+    version: Optional[Version] = None,
+) -> Snapshot:
+    live = live if live is not None else await fan_out()
+    return snapshots.get(
+        ("tickers", tuple(windows or ())),
+        version or (lambda: data_version(live)),
+        lambda: generate_market_tickers(live, windows),
+    )
@@ -1,9 +1,12 @@
 """AI 고급 기능"""
 import json
 from typing import Dict, Any
-from app.services.openai_svc import client, SYSTEM_PROMPT_BASE
+from app.services.openai_svc import SYSTEM_PROMPT_BASE
 from app.models.advanced import AIChartResponse, AIExplainResponse, WhatIfResponse
 from app.core.config import settings
+from app.core.clients import get_openai_client
+from app.core.singleflight import singleflight
+from app.services.llm_cache import llm_cached
 
 
 # 경제 지표 설명 데이터베이스
@@ -55,6 +58,24 @@ METRIC_DEFINITIONS = {
 
 async def generate_chart_from_query(query: str, date_range: str = None) -> AIChartResponse:
     """자연어 쿼리로부터 차트 설정 생성"""
+    try:
+        return await _request_chart(query, date_range)
+    except Exception as e:
+        # 기본 응답 (캐시하지 않음)
+        return AIChartResponse(
+            chart_type="line",
+            title=query,
+            data_keys=["CPI", "기준금리"],
+            time_range="2019-2024",
+            chart_config={"y_axis": "dual"},
+            explanation=f"'{query}' 차트 생성 중 오류 발생: {str(e)}"
+        )
+
+
+@llm_cached("ai_chart", AIChartResponse)
+@singleflight("ai_chart")
+async def _request_chart(query: str, date_range: str = None) -> AIChartResponse:
+    """차트 설정 요청 (실패 시 예외)"""
     
     prompt = f"""다음 자연어 요청을 차트 설정으로 변환하세요:
 
@@ -77,39 +98,27 @@ async def generate_chart_from_query(query: str, date_range: str = None) -> AICha
 사용 가능한 지표: CPI, Core CPI, 기준금리, 실업률, GDP, 환율, KOSPI, S&P500
 """
 
-    try:
-        response = await client.chat.completions.create(
-            model=settings.OPENAI_MODEL,
-            messages=[
-                {"role": "system", "content": SYSTEM_PROMPT_BASE},
-                {"role": "user", "content": prompt}
-            ],
-            max_tokens=1000,
-            temperature=0.3,
-            response_format={"type": "json_object"}
-        )
-        
-        data = json.loads(response.choices[0].message.content)
-        
-        return AIChartResponse(
-            chart_type=data.get("chart_type", "line"),
-            title=data.get("title", "차트"),
-            data_keys=data.get("data_keys", []),
-            time_range=data.get("time_range", "recent"),
-            chart_config=data.get("chart_config", {}),
-            explanation=data.get("explanation", "")
-        )
+    response = await get_openai_client().chat.completions.create(
+        model=settings.OPENAI_MODEL,
+        messages=[
+            {"role": "system", "content": SYSTEM_PROMPT_BASE},
+            {"role": "user", "content": prompt}
+        ],
+        max_tokens=1000,
+        temperature=0.3,
+        response_format={"type": "json_object"}
+    )
     
-    except Exception as e:
-        # 기본 응답
-        return AIChartResponse(
-            chart_type="line",
-            title=query,
-            data_keys=["CPI", "기준금리"],
-            time_range="2019-2024",
-            chart_config={"y_axis": "dual"},
-            explanation=f"'{query}' 차트 생성 중 오류 발생: {str(e)}"
-        )
+    data = json.loads(response.choices[0].message.content)
+    
+    return AIChartResponse(
+        chart_type=data.get("chart_type", "line"),
+        title=data.get("title", "차트"),
+        data_keys=data.get("data_keys", []),
+        time_range=data.get("time_range", "recent"),
+        chart_config=data.get("chart_config", {}),
+        explanation=data.get("explanation", "")
+    )
 
 
 def get_metric_explanation(metric: str, level: str = "easy") -> AIExplainResponse:
@@ -148,6 +157,28 @@ def get_metric_explanation(metric: str, level: str = "easy") -> AIExplainRespons
 
 async def generate_whatif_scenario(scenario: str, parameters: Dict[str, Any]) -> WhatIfResponse:
     """What-if 시나리오 생성"""
+    try:
+        return await _request_whatif(scenario, parameters)
+    except Exception as e:
+        # 기본 응답 (캐시하지 않음)
+        return WhatIfResponse(
+            scenario=scenario,
+            scenarios=[
+                {
+                    "name": "기본 시나리오",
+                    "probability": "불확실",
+                    "impacts": [f"분석 중 오류 발생: {str(e)}"],
+                    "timeframe": "불명"
+                }
+            ],
+            assumptions=["AI 분석 실패"],
+            disclaimer="시나리오 생성 중 오류가 발생했습니다."
+        )
+
+
+@llm_cached("whatif", WhatIfResponse)
+async def _request_whatif(scenario: str, parameters: Dict[str, Any]) -> WhatIfResponse:
+    """시나리오 분석 요청 (실패 시 예외)"""
     
     prompt = f"""다음 시나리오에 대해 3가지 가능한 결과를 분석하세요:
 
@@ -181,39 +212,22 @@ async def generate_whatif_scenario(scenario: str, parameters: Dict[str, Any]) ->
 }}
 """
 
-    try:
-        response = await client.chat.completions.create(
-            model=settings.OPENAI_MODEL,
-            messages=[
-                {"role": "system", "content": SYSTEM_PROMPT_BASE + "\n시나리오 분석 전문가로서 답변하세요."},
-                {"role": "user", "content": prompt}
-            ],
-            max_tokens=2000,
-            temperature=0.7,
-            response_format={"type": "json_object"}
-        )
-        
-        data = json.loads(response.choices[0].message.content)
-        
-        return WhatIfResponse(
-            scenario=scenario,
-            scenarios=data.get("scenarios", []),
-            assumptions=data.get("assumptions", []),
-            disclaimer=data.get("disclaimer", "이 분석은 참고용입니다.")
-        )
+    response = await get_openai_client().chat.completions.create(
+        model=settings.OPENAI_MODEL,
+        messages=[
+            {"role": "system", "content": SYSTEM_PROMPT_BASE + "\n시나리오 분석 전문가로서 답변하세요."},
+            {"role": "user", "content": prompt}
+        ],
+        max_tokens=2000,
+        temperature=0.7,
+        response_format={"type": "json_object"}
+    )
     
-    except Exception as e:
-        return WhatIfResponse(
-            scenario=scenario,
-            scenarios=[
-                {
-                    "name": "기본 시나리오",
-                    "probability": "불확실",
-                    "impacts": [f"분석 중 오류 발생: {str(e)}"],
-                    "timeframe": "불명"
-                }
-            ],
-            assumptions=["AI 분석 실패"],
-            disclaimer="시나리오 생성 중 오류가 발생했습니다."
-        )
-
+    data = json.loads(response.choices[0].message.content)
+    
+    return WhatIfResponse(
+        scenario=scenario,
+        scenarios=data.get("scenarios", []),
+        assumptions=data.get("assumptions", []),
+        disclaimer=data.get("disclaimer", "이 분석은 참고용입니다.")
+    )
@@ -0,0 +1,160 @@
+"""다중 시계열 정렬 / 혼합 주기 리샘플링
+
+월별 CPI 와 분기별 GDP 처럼 주기가 다른 N개 시계열을 공통 달력에 outer join 하여
+하나의 행렬(날짜 × 시계열)로 만듭니다. 모든 단계는 NumPy 벡터 연산입니다.
+- 리샘플링: 기간별 last / first / mean / sum
+- 결측 처리: ffill (직전 값 유지) / interpolate (선형 보간, 양 끝 외삽 없음)
+"""
+from typing import Dict, Any, List, Optional, Tuple
+import numpy as np
+
+
+FREQ_ORDER = {"D": 0, "M": 1, "Q": 2, "A": 3}
+RESAMPLE_METHODS = ("last", "first", "mean", "sum")
+FILL_METHODS = ("ffill", "interpolate")
+
+
+def to_periods(dates: np.ndarray, freq: str) -> np.ndarray:
+    """날짜를 기간 시작일(datetime64[D])로 내림"""
+    dates = np.asarray(dates, dtype="datetime64[D]")
+    if freq == "D":
+        return dates
+    if freq == "A":
+        return dates.astype("datetime64[Y]").astype("datetime64[D]")
+    months = dates.astype("datetime64[M]")
+    if freq == "Q":
+        months = months - (months.astype(np.int64) % 3)
+    return months.astype("datetime64[D]")
+
+
+def resample(
+    dates: np.ndarray,
+    values: np.ndarray,
+    freq: str,
+    how: str = "last",
+) -> Tuple[np.ndarray, np.ndarray]:
+    """정렬된 시계열을 기간별로 집계 (NaN 은 제외)"""
+    if how not in RESAMPLE_METHODS:
+        raise ValueError(f"지원하지 않는 집계 방식: {how}")
+    values = np.asarray(values, dtype=np.float64)
+    keep = ~np.isnan(values)
+    periods, values = to_periods(dates, freq)[keep], values[keep]
+    if not len(periods):
+        return periods, values
+
+    starts = np.r_[0, np.flatnonzero(periods[1:] != periods[:-1]) + 1]
+    ends = np.r_[starts[1:], len(periods)] - 1
+    if how == "last":
+        reduced = values[ends]
+    elif how == "first":
+        reduced = values[starts]
+    else:
+        reduced = np.add.reduceat(values, starts)
+        if how == "mean":
+            reduced = reduced / (ends - starts + 1)
+    return periods[starts], reduced
+
+
+def forward_fill(matrix: np.ndarray) -> np.ndarray:
+    """열별 직전 유효 값으로 채움 (앞쪽 결측은 유지)"""
+    valid = ~np.isnan(matrix)
+    index = np.where(valid, np.arange(len(matrix))[:, None], 0)
+    np.maximum.accumulate(index, axis=0, out=index)
+    filled = np.take_along_axis(matrix, index, axis=0)
+    # 첫 유효 값 이전 구간은 NaN 유지
+    filled[np.cumsum(valid, axis=0) == 0] = np.nan
+    return filled
+
+
+def interpolate(matrix: np.ndarray) -> np.ndarray:
+    """열별 선형 보간 (첫/마지막 유효 값 바깥은 NaN)"""
+    result = matrix.copy()
+    x = np.arange(len(matrix))
+    for j in range(matrix.shape[1]):
+        valid = ~np.isnan(matrix[:, j])
+        if valid.sum() >= 2:
+            result[:, j] = np.interp(x, x[valid], matrix[valid, j], left=np.nan, right=np.nan)
+    return result
+
+
+def align(
+    series: Dict[str, Tuple[np.ndarray, np.ndarray]],
+    freq: str = "M",
+    how: str = "last",
+    fill: Optional[str] = None,
+) -> Tuple[np.ndarray, List[str], np.ndarray]:
+    """
+    N개 시계열을 공통 달력으로 outer join
+
+    Returns:
+        (달력 날짜 배열, 시계열 이름 리스트, 값 행렬[날짜, 시계열])
+    """
+    if fill is not None and fill not in FILL_METHODS:
+        raise ValueError(f"지원하지 않는 결측 처리: {fill}")
+    names = list(series)
+    resampled = [resample(dates, values, freq, how) for dates, values in series.values()]
+
+    calendar = np.unique(np.concatenate(
+        [periods for periods, _ in resampled] or [np.array([], dtype="datetime64[D]")]
+    ))
+    matrix = np.full((len(calendar), len(names)), np.nan)
+    for j, (periods, values) in enumerate(resampled):
+        matrix[np.searchsorted(calendar, periods), j] = values
+
+    if fill == "ffill":
+        matrix = forward_fill(matrix)
+    elif fill == "interpolate":
+        matrix = interpolate(matrix)
+    return calendar, names, matrix
+
+
+def finest_freq(freqs: List[str]) -> str:
+    """가장 촘촘한 주기 (공통 달력 기본값)"""
+    return min(freqs, key=lambda f: FREQ_ORDER.get(f, 1)) if freqs else "M"
+
+
+def infer_freq(labels: List[str]) -> str:
+    """날짜 라벨 형식과 간격으로 주기 추정 (YYYY-MM-DD → D, 3개월 간격 → Q)"""
+    if not labels:
+        return "M"
+    if len(labels[0]) >= 10:
+        return "D"
+    months = np.array(labels, dtype="datetime64[M]").astype(np.int64)
+    if len(months) > 1 and np.all(np.diff(months) % 3 == 0):
+        return "Q"
+    return "M"
+
+
+def align_points(
+    points: Dict[str, List[Dict[str, Any]]],
+    freq: Optional[str] = None,
+    how: str = "last",
+    fill: Optional[str] = None,
+    ndigits: int = 2,
+) -> Dict[str, Any]:
+    """
+    [{date, value}] 형식의 시계열 묶음을 정렬된 행렬 payload 로 변환
+
+    Returns:
+        {freq, dates: [...], series: [...], values: [[...], ...]}  (결측은 null)
+    """
+    arrays = {}
+    freqs = []
+    for name, items in points.items():
+        labels = [item["date"] for item in items]
+        freqs.append(infer_freq(labels))
+        arrays[name] = (
+            np.array(labels, dtype="datetime64[D]"),
+            np.array([item["value"] for item in items], dtype=np.float64),
+        )
+    freq = freq or finest_freq(freqs)
+    calendar, names, matrix = align(arrays, freq=freq, how=how, fill=fill)
+
+    rounded = np.round(matrix, ndigits).astype(object)
+    rounded[np.isnan(matrix)] = None
+    return {
+        "freq": freq,
+        "dates": np.datetime_as_string(calendar, unit="D" if freq == "D" else "M").tolist(),
+        "series": names,
+        "values": rounded.tolist(),
+    }
@@ -0,0 +1,307 @@
+"""경제지표 발표 캘린더 저장소
+
+(국가, 중요도)별 버킷에 발표 시각 순으로 정렬된 이벤트를 두고,
+기간 조회는 버킷마다 bisect 로 경계를 찾은 뒤 heapq.merge 로 시간순 병합합니다.
+조회 비용은 버킷 수와 페이지 크기에만 비례하므로 이력이 쌓여도 일정합니다.
+영속화는 MongoDB calendar_events 컬렉션 (비어 있으면 Mock 일정으로 시드).
+실시간 소스가 준 일정은 형식을 검증한 뒤 반영하고, 바뀐 일정만 컬렉션에 저장합니다.
+"""
+import asyncio
+import heapq
+import random
+import zlib
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from pymongo import ASCENDING, UpdateOne
+from app.core.metrics import metrics
+from app.db.mongo import get_database
+
+
+IMPORTANCE_LEVELS = ("low", "medium", "high")
+MAX_PAGE_SIZE = 500
+# 실시간 일정 저장이 이보다 느리면 건너뜀 (초, 요청 지연 상한)
+SAVE_TIMEOUT = 0.5
+
+# Mock 시드 구성: (국가, 코드, 지표명, 중요도, 주기, 발표일, 시각, 기준값, 변동폭, 출처)
+# 주기: M = 매월 발표일, Q = 분기 첫 달 발표일, W = 매주 발표 요일(0=월)
+SEED_INDICATORS = [
+    ("KR", "CPI", "CPI (YoY)", "high", "M", 2, "08:00", 2.5, 0.2, "통계청"),
+    ("KR", "UNEMPLOYMENT", "실업률", "medium", "M", 12, "08:00", 3.2, 0.15, "통계청"),
+    ("KR", "RETAIL_SALES", "소매판매 (YoY)", "medium", "M", 30, "08:00", 3.5, 0.6, "통계청"),
+    ("KR", "TRADE_BALANCE", "무역수지 (억$)", "high", "M", 1, "09:00", 40.0, 6.0, "관세청"),
+    ("KR", "INDUSTRIAL_PRODUCTION", "산업생산 (YoY)", "medium", "M", 29, "08:00", 2.3, 0.8, "통계청"),
+    ("KR", "POLICY_RATE", "기준금리 결정", "high", "M", 22, "10:00", 3.5, 0.0, "한국은행"),
+    ("KR", "GDP", "GDP 성장률 (QoQ)", "high", "Q", 25, "08:00", 0.6, 0.2, "한국은행"),
+    ("US", "CPI", "CPI (YoY)", "high", "M", 12, "22:30", 3.0, 0.2, "BLS"),
+    ("US", "NFP", "비농업 고용 (천명)", "high", "M", 5, "22:30", 180.0, 40.0, "BLS"),
+    ("US", "JOBLESS_CLAIMS", "신규 실업수당 청구 (천건)", "medium", "W", 3, "22:30", 220.0, 8.0, "DOL"),
+    ("US", "RETAIL_SALES", "소매판매 (MoM)", "medium", "M", 15, "22:30", 0.3, 0.4, "Census"),
+    ("US", "ISM_PMI", "ISM 제조업 PMI", "medium", "M", 1, "00:00", 49.5, 1.2, "ISM"),
+    ("US", "GDP", "GDP 성장률 (QoQ 연율)", "high", "Q", 28, "22:30", 2.2, 0.6, "BEA"),
+    ("EU", "CPI", "HICP (YoY)", "high", "M", 17, "19:00", 2.4, 0.2, "Eurostat"),
+    ("EU", "PMI", "HCOB 제조업 PMI", "medium", "M", 23, "18:00", 47.0, 1.0, "S&P Global"),
+    ("JP", "CPI", "전국 CPI (YoY)", "medium", "M", 19, "08:30", 2.6, 0.2, "총무성"),
+    ("JP", "TANKAN", "단칸 대형제조업", "low", "Q", 1, "08:50", 12.0, 2.0, "일본은행"),
+    ("CN", "CPI", "CPI (YoY)", "medium", "M", 9, "10:30", 0.4, 0.3, "국가통계국"),
+    ("CN", "PMI", "제조업 PMI", "medium", "M", 30, "10:30", 49.8, 0.6, "국가통계국"),
+]
+
+# 시드 범위 (오늘 기준 과거/미래 개월 수)
+SEED_MONTHS_BACK = 24
+SEED_MONTHS_AHEAD = 3
+
+
+def event_id(event: Dict[str, Any]) -> str:
+    """(국가, 발표 시각, 지표) 기반 고유 ID"""
+    key = f"{event.get('country', 'KR')}|{event['datetime']}|{event.get('code') or event['indicator']}"
+    return f"ev_{zlib.crc32(key.encode('utf-8')):08x}"
+
+
+def is_valid_event(event: Any) -> bool:
+    """발표 시각(YYYY-MM-DD[ HH:MM])과 지표명(또는 코드)이 있는 일정인지"""
+    if not isinstance(event, dict) or not (event.get("indicator") or event.get("code")):
+        return False
+    try:
+        return to_bound(event.get("datetime")) is not None
+    except (TypeError, ValueError):
+        return False
+
+
+def normalize_event(event: Dict[str, Any]) -> Dict[str, Any]:
+    """저장 형식으로 정리 (발표 시각 정렬 키 형식, 국가 대문자, 중요도 검증, surprise/ID 보완)"""
+    event = {key: value for key, value in event.items() if key != "_id"}
+    event["datetime"] = to_bound(event["datetime"])
+    event["indicator"] = event.get("indicator") or event["code"]
+    event["country"] = (event.get("country") or "KR").upper()
+    if event.get("importance") not in IMPORTANCE_LEVELS:
+        event["importance"] = "medium"
+    if event.get("surprise") is None and event.get("actual") is not None and event.get("consensus") is not None:
+        event["surprise"] = round(event["actual"] - event["consensus"], 2)
+    event["id"] = event.get("id") or event_id(event)
+    return event
+
+
+def to_bound(value: Any, end: bool = False) -> Optional[str]:
+    """조회 경계를 정렬 키("YYYY-MM-DD HH:MM")로 변환 (종료일만 주면 그날 끝까지 포함)"""
+    if value is None or value == "":
+        return None
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d %H:%M")
+    text = str(value).strip().replace("T", " ")
+    day = datetime.strptime(text[:10], "%Y-%m-%d")
+    if len(text) <= 10:
+        return day.strftime("%Y-%m-%d") + (" 23:59" if end else " 00:00")
+    return text[:16]
+
+
+class CalendarStore:
+    """(국가, 중요도) 버킷별 정렬 인덱스"""
+
+    def __init__(self):
+        # (country, importance) → (정렬 키 리스트, 이벤트 리스트)
+        self._buckets: Dict[Tuple[str, str], Tuple[List[str], List[Dict[str, Any]]]] = {}
+        # id → (버킷 키, 정렬 키) (갱신 시 기존 위치 제거용)
+        self._locations: Dict[str, Tuple[Tuple[str, str], str]] = {}
+        self.loaded = False
+        # 일정이 바뀔 때마다 증가 (스냅샷 캐시 키)
+        self.version = 0
+
+    def __len__(self) -> int:
+        return len(self._locations)
+
+    def _find(self, eid: str) -> Optional[Tuple[List[str], List[Dict[str, Any]], int]]:
+        location = self._locations.get(eid)
+        if location is None:
+            return None
+        bucket_key, key = location
+        keys, events = self._buckets[bucket_key]
+        for i in range(bisect_left(keys, key), bisect_right(keys, key)):
+            if events[i]["id"] == eid:
+                return keys, events, i
+        return None
+
+    def apply(self, events: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        이벤트 추가/갱신 (같은 ID 는 교체, 내용이 같으면 무시), 반영된 이벤트 반환
+        - 발표 시각/지표명이 없는 이벤트는 건너뜀 (calendar.invalid_events)
+        """
+        applied = []
+        for event in events:
+            if not is_valid_event(event):
+                metrics.incr("calendar.invalid_events")
+                continue
+            event = normalize_event(event)
+            found = self._find(event["id"])
+            if found is not None:
+                keys, bucket, i = found
+                if bucket[i] == event:
+                    continue
+                del keys[i], bucket[i]
+            bucket_key = (event["country"], event["importance"])
+            keys, bucket = self._buckets.setdefault(bucket_key, ([], []))
+            position = bisect_right(keys, event["datetime"])
+            keys.insert(position, event["datetime"])
+            bucket.insert(position, event)
+            self._locations[event["id"]] = (bucket_key, event["datetime"])
+            applied.append(event)
+        if applied:
+            self.version += 1
+        return applied
+
+    def upsert(self, events: Iterable[Dict[str, Any]]) -> int:
+        """apply 후 반영 건수 반환"""
+        return len(self.apply(events))
+
+    def ensure(self) -> "CalendarStore":
+        """비어 있으면 Mock 일정으로 시드 (DB 없이 실행되는 경우)"""
+        if not self.loaded:
+            self.upsert(generate_seed_events())
+            self.loaded = True
+        return self
+
+    def countries(self) -> List[str]:
+        return sorted({country for country, _ in self._buckets})
+
+    def query(
+        self,
+        start: Any = None,
+        end: Any = None,
+        countries: Optional[List[str]] = None,
+        importances: Optional[List[str]] = None,
+        page: int = 1,
+        page_size: int = 50,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        기간/국가/중요도 조회 (시간순, 페이지 단위)
+
+        Returns:
+            (해당 페이지 이벤트, 전체 건수)
+        """
+        self.ensure()
+        lo_key, hi_key = to_bound(start), to_bound(end, end=True)
+        wanted_countries = {c.upper() for c in countries} if countries else None
+        wanted_importance = set(importances) if importances else None
+
+        ranges = []
+        total = 0
+        for (country, importance), (keys, events) in self._buckets.items():
+            if wanted_countries is not None and country not in wanted_countries:
+                continue
+            if wanted_importance is not None and importance not in wanted_importance:
+                continue
+            lo = 0 if lo_key is None else bisect_left(keys, lo_key)
+            hi = len(keys) if hi_key is None else bisect_right(keys, hi_key)
+            if hi > lo:
+                ranges.append((events, lo, hi))
+                total += hi - lo
+
+        offset = (max(page, 1) - 1) * page_size
+        if offset >= total:
+            return [], total
+        # 각 버킷 구간을 지연 반복자로 병합 → 필요한 페이지까지만 순회
+        merged = heapq.merge(
+            *[map(events.__getitem__, range(lo, hi)) for events, lo, hi in ranges],
+            key=lambda event: event["datetime"],
+        )
+        return list(islice(merged, offset, offset + page_size)), total
+
+
+def generate_seed_events(now: Optional[datetime] = None) -> List[Dict[str, Any]]:
+    """결정적 Mock 발표 일정 (과거 이벤트는 실제치, 미래 이벤트는 컨센서스만)"""
+    now = now or datetime.now()
+    first_month = (now.year * 12 + now.month - 1) - SEED_MONTHS_BACK
+    last_month = (now.year * 12 + now.month - 1) + SEED_MONTHS_AHEAD
+    now_key = now.strftime("%Y-%m-%d %H:%M")
+    events = []
+
+    for country, code, name, importance, freq, day, time, base, vol, source in SEED_INDICATORS:
+        rng = random.Random(zlib.crc32(f"{country}|{code}".encode("utf-8")))
+        dates = []
+        if freq == "W":
+            start = datetime(first_month // 12, first_month % 12 + 1, 1)
+            start += timedelta(days=(day - start.weekday()) % 7)
+            end = datetime(last_month // 12, last_month % 12 + 1, 28)
+            while start <= end:
+                dates.append(start)
+                start += timedelta(days=7)
+        else:
+            for month in range(first_month, last_month + 1):
+                if freq == "Q" and month % 3 != 0:
+                    continue
+                year, mon = month // 12, month % 12 + 1
+                last_day = ((datetime(year + mon // 12, mon % 12 + 1, 1)) - timedelta(days=1)).day
+                dates.append(datetime(year, mon, min(day, last_day)))
+
+        value = base
+        previous = None
+        for date in dates:
+            value = round(value + rng.gauss(0, vol), 2) if vol else value
+            stamp = f"{date:%Y-%m-%d} {time}"
+            consensus = round(value + rng.gauss(0, vol / 2), 2) if vol else value
+            released = stamp <= now_key
+            events.append({
+                "datetime": stamp,
+                "indicator": name,
+                "code": code,
+                "country": country,
+                "actual": value if released else None,
+                "consensus": consensus,
+                "previous": previous,
+                "importance": importance,
+                "source": source,
+                "source_url": f"https://example.com/{country}/{code}",
+            })
+            if released:
+                previous = value
+    return events
+
+
+async def load_calendar(db, target: "CalendarStore") -> int:
+    """MongoDB 에서 일정을 읽어 인덱스 구성 (비어 있으면 시드 후 저장)"""
+    collection = db.calendar_events
+    await collection.create_index("id", unique=True)
+    await collection.create_index([("country", ASCENDING), ("datetime", ASCENDING), ("importance", ASCENDING)])
+
+    events = [event async for event in collection.find({}, {"_id": 0})]
+    if not events:
+        events = generate_seed_events()
+        await save_events(db, events)
+    target.upsert(events)
+    target.loaded = True
+    return len(target)
+
+
+async def save_events(db, events: List[Dict[str, Any]], batch_size: int = 1000) -> int:
+    """일정 upsert (ID 기준, 순서 무관 bulk)"""
+    normalized = [normalize_event(event) for event in events]
+    written = 0
+    for i in range(0, len(normalized), batch_size):
+        batch = normalized[i:i + batch_size]
+        result = await db.calendar_events.bulk_write(
+            [UpdateOne({"id": event["id"]}, {"$set": event}, upsert=True) for event in batch],
+            ordered=False,
+        )
+        written += result.upserted_count + result.modified_count
+    return written
+
+
+async def persist_events(
+    events: List[Dict[str, Any]],
+    database: Callable[[], Any] = get_database,
+    timeout: float = SAVE_TIMEOUT,
+) -> int:
+    """실시간 소스 일정을 컬렉션에 저장 (MongoDB 가 없거나 느리면 건너뛰고 0)"""
+    if not events:
+        return 0
+    try:
+        return await asyncio.wait_for(save_events(database(), events), timeout=timeout)
+    except Exception as e:
+        print(f"[WARNING] Calendar save failed: {e}")
+        return 0
+
+
+# 프로세스 공유 캘린더
+calendar = CalendarStore()
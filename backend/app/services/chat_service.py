@@ -1,13 +1,15 @@
 """챗봇 서비스 (OpenAI Function Calling)"""
 import json
 import uuid
-from typing import List, Dict, Any
-from openai import AsyncOpenAI
+from typing import Any, AsyncIterator, Dict, List, Tuple
 from app.core.config import settings
+from app.core.clients import get_openai_client
+from app.core.singleflight import SingleFlight
 from app.models.chat import ChatMessage, ChatSession, Widget
 from app.services.tools import TOOL_DEFINITIONS, execute_tool
-
-client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+from app.services.alignment import align_points
+from app.services.downsample import budget_for, downsample_points, cache as downsample_cache
+from app.services.series_store import store
 
 # 시스템 프롬프트
 SYSTEM_PROMPT = """당신은 경제 분석 코파일럿입니다.
@@ -15,7 +17,7 @@ SYSTEM_PROMPT = """당신은 경제 분석 코파일럿입니다.
 **핵심 원칙:**
 1. 모르는 것은 모른다고 말하고, 추측하지 않습니다.
 2. 모든 데이터에 출처와 날짜를 명시합니다.
-3. 산술/통계/집계는 반드시 calc_whatif 툴을 사용합니다.
+3. 산술/통계/집계는 반드시 calc_whatif 툴을, 이동평균/변동성/상관계수는 rolling_stats 툴을 사용합니다.
 4. 차트는 make_chart 툴로 생성합니다.
 5. 설명은 마크다운으로 간결하게 작성합니다.
 
@@ -31,6 +33,7 @@ SYSTEM_PROMPT = """당신은 경제 분석 코파일럿입니다.
 - make_chart: 차트 생성
 - get_calendar: 발표 일정
 - calc_whatif: 계산/시나리오
+- rolling_stats: 이동평균/변동성/z-score/낙폭/상관계수
 - save_bookmark: 북마크 저장
 - render_report: PDF 리포트
 
@@ -45,7 +48,7 @@ async def chat_with_tools(
     session_history: List[ChatMessage] = None
 ) -> Dict[str, Any]:
     """
-    툴을 사용하는 대화형 챗봇
+    툴을 사용하는 대화형 챗봇 (stream_chat 결과를 모아 한 번에 반환)
     
     Args:
         session_id: 세션 ID
@@ -61,27 +64,62 @@ async def chat_with_tools(
             sources: [...]
         }
     """
-    # 세션 히스토리 초기화
-    if session_history is None:
-        session_history = []
-    
-    # 시스템 메시지 + 히스토리 + 새 메시지
+    async for event, data in stream_chat(session_id, message, session_history):
+        if event == "done":
+            return data
+    raise RuntimeError("챗봇 응답이 완료되지 않았습니다.")
+
+
+def build_messages(message: str, session_history: List[ChatMessage] = None) -> List[Dict[str, Any]]:
+    """시스템 메시지 + 최근 히스토리 10개 + 새 사용자 메시지"""
     messages = [
         {"role": "system", "content": SYSTEM_PROMPT}
     ]
-    
-    # 기존 히스토리 추가
-    for msg in session_history[-10:]:  # 최근 10개만
+    for msg in (session_history or [])[-10:]:
         messages.append({
             "role": msg.role,
             "content": msg.content
         })
-    
-    # 새 사용자 메시지
     messages.append({
         "role": "user",
         "content": message
     })
+    return messages
+
+
+def _merge_tool_call_deltas(tool_calls: Dict[int, Dict[str, Any]], deltas) -> None:
+    """스트리밍 tool_call 조각을 index 별로 이어 붙임 (id/name 은 첫 조각, arguments 는 분할 전송)"""
+    for delta in deltas:
+        call = tool_calls.setdefault(delta.index, {
+            "id": "",
+            "type": "function",
+            "function": {"name": "", "arguments": ""}
+        })
+        if delta.id:
+            call["id"] = delta.id
+        if delta.function:
+            if delta.function.name:
+                call["function"]["name"] += delta.function.name
+            if delta.function.arguments:
+                call["function"]["arguments"] += delta.function.arguments
+
+
+async def stream_chat(
+    session_id: str,
+    message: str,
+    session_history: List[ChatMessage] = None
+) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+    """
+    툴 호출 루프를 이벤트 단위로 진행 (OpenAI stream=True)
+    
+    Yields:
+        ("token", {content})                  어시스턴트 토큰 도착 즉시
+        ("tool_start", {id, name, arguments}) 툴 실행 직전
+        ("tool_end", {id, name, success})     툴 실행 직후
+        ("widget", widget)                    make_chart 완료 즉시
+        ("done", {session_id, messages, widgets, suggestions, sources})
+    """
+    messages = build_messages(message, session_history)
     
     # OpenAI 호출 (최대 5번 반복 - 툴 호출 처리)
     max_iterations = 5
@@ -92,83 +130,75 @@ async def chat_with_tools(
     while iteration < max_iterations:
         iteration += 1
         
-        response = await client.chat.completions.create(
+        stream = await get_openai_client().chat.completions.create(
             model=settings.OPENAI_MODEL,
             messages=messages,
             tools=TOOL_DEFINITIONS,
             tool_choice="auto",
             max_tokens=2000,
-            temperature=0.7
+            temperature=0.7,
+            stream=True
         )
         
-        assistant_message = response.choices[0].message
+        content = []
+        tool_calls: Dict[int, Dict[str, Any]] = {}
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta
+            if delta.content:
+                content.append(delta.content)
+                yield "token", {"content": delta.content}
+            if delta.tool_calls:
+                _merge_tool_call_deltas(tool_calls, delta.tool_calls)
         
         # 툴 호출이 없으면 종료
-        if not assistant_message.tool_calls:
+        if not tool_calls:
             # 최종 응답
             messages.append({
                 "role": "assistant",
-                "content": assistant_message.content or ""
+                "content": "".join(content)
             })
             break
         
         # 툴 호출 처리
+        calls = [tool_calls[index] for index in sorted(tool_calls)]
         messages.append({
             "role": "assistant",
-            "content": assistant_message.content or "",
-            "tool_calls": [
-                {
-                    "id": tc.id,
-                    "type": "function",
-                    "function": {
-                        "name": tc.function.name,
-                        "arguments": tc.function.arguments
-                    }
-                }
-                for tc in assistant_message.tool_calls
-            ]
+            "content": "".join(content),
+            "tool_calls": calls
         })
         
         # 각 툴 실행
-        for tool_call in assistant_message.tool_calls:
-            tool_name = tool_call.function.name
-            tool_args = json.loads(tool_call.function.arguments)
+        for tool_call in calls:
+            tool_name = tool_call["function"]["name"]
+            tool_args = json.loads(tool_call["function"]["arguments"] or "{}")
             
             print(f"[TOOL] {tool_name}({tool_args})")
+            yield "tool_start", {"id": tool_call["id"], "name": tool_name, "arguments": tool_args}
             
             # 툴 실행
             tool_result = await execute_tool(tool_name, tool_args)
-            tool_results[tool_call.id] = tool_result
+            tool_results[tool_call["id"]] = tool_result
+            yield "tool_end", {
+                "id": tool_call["id"],
+                "name": tool_name,
+                "success": "error" not in tool_result
+            }
             
             # 결과를 메시지에 추가
             messages.append({
                 "role": "tool",
-                "tool_call_id": tool_call.id,
+                "tool_call_id": tool_call["id"],
                 "name": tool_name,
                 "content": json.dumps(tool_result, ensure_ascii=False)
             })
             
             # 위젯 생성
             if tool_name == "make_chart":
-                widget_id = str(uuid.uuid4())
-                # get_series 결과와 결합하여 위젯 생성
-                chart_spec = tool_result
-                
-                # 이전 get_series 결과 찾기
-                series_data = {}
-                for tid, result in tool_results.items():
-                    if "data" in result and isinstance(result["data"], dict):
-                        series_data = result["data"]
-                        break
-                
-                widgets.append({
-                    "id": widget_id,
-                    "type": "chart",
-                    "spec": chart_spec.get("spec", {}),
-                    "data": series_data,
-                    "title": "차트",
-                    "source": series_data.get("source", "Mock Data")
-                })
+                widget = build_chart_widget(tool_result, tool_results)
+                widgets.append(widget)
+                yield "widget", widget
     
     # 후속 질문 제안 추출 (간단한 휴리스틱)
     suggestions = generate_suggestions(message, widgets)
@@ -176,7 +206,7 @@ async def chat_with_tools(
     # 출처 정보 추출
     sources = extract_sources(tool_results)
     
-    return {
+    yield "done", {
         "session_id": session_id,
         "messages": messages,
         "widgets": widgets,
@@ -185,6 +215,66 @@ async def chat_with_tools(
     }
 
 
+def collect_series(tool_results: Dict[str, Any]) -> Dict[str, Any]:
+    """지금까지의 get_series 결과를 지표별로 병합 (나중 호출이 우선)"""
+    series_data = {}
+    source = None
+    for result in tool_results.values():
+        if "data" in result and isinstance(result["data"], dict):
+            series_data.update(result["data"])
+            source = result.get("source", source)
+    return {"data": series_data, "source": source}
+
+
+def build_chart_widget(chart_result: Dict[str, Any], tool_results: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    make_chart 결과 + get_series 데이터로 차트 위젯 생성
+    - data: 시리즈별 포인트 (차트 타입별 포인트 예산으로 다운샘플)
+    - aligned: 공통 달력에 정렬된 행렬 (혼합 주기 시리즈도 한 번에 렌더링)
+    """
+    spec = chart_result.get("spec", {})
+    collected = collect_series(tool_results)
+    wanted = spec.get("series") or list(collected["data"])
+    series_data = {
+        name: collected["data"][name]
+        for name in wanted
+        if name in collected["data"]
+    } or collected["data"]
+    budget = budget_for(spec.get("chart_type", "line"))
+    series_data = {
+        name: limit_points(name, items, budget)
+        for name, items in series_data.items()
+    }
+    
+    aligned = None
+    if series_data:
+        aligned = align_points(
+            series_data,
+            freq=spec.get("freq"),
+            how=spec.get("resample", "last"),
+            fill=spec.get("fill", "ffill"),
+        )
+    
+    return {
+        "id": str(uuid.uuid4()),
+        "type": "chart",
+        "spec": spec,
+        "data": series_data,
+        "aligned": aligned,
+        "title": "차트",
+        "source": collected["source"] or "Mock Data"
+    }
+
+
+def limit_points(name: str, items: List[Dict[str, Any]], budget: int) -> List[Dict[str, Any]]:
+    """포인트 예산 초과 시 LTTB 축약 (저장소 시계열은 구간별 캐시 사용)"""
+    if len(items) <= budget:
+        return items
+    if store.get(name) is not None:
+        return downsample_cache.points(name, items[0]["date"], items[-1]["date"], budget)
+    return downsample_points(items, budget)
+
+
 def generate_suggestions(user_message: str, widgets: List[Dict]) -> List[str]:
     """후속 질문 제안 생성"""
     suggestions = []
@@ -237,15 +327,7 @@ def extract_sources(tool_results: Dict[str, Any]) -> List[Dict[str, str]]:
     return unique_sources
 
 
-async def generate_auto_briefing(session_id: str) -> Dict[str, Any]:
-    """
-    자동 브리핑 생성
-    - 오늘의 핵심 지표 3개
-    - 주요 포인트 3줄
-    - 차트 2개
-    - 오늘/이번 주 일정 3건
-    """
-    briefing_prompt = """오늘의 경제 브리핑을 생성해주세요:
+BRIEFING_PROMPT = """오늘의 경제 브리핑을 생성해주세요:
 
 1. **핵심 지표 3개**: CPI, 기준금리, 실업률의 최신 값과 전월 대비
 2. **주요 포인트 3줄**: 한 줄 요약
@@ -253,6 +335,18 @@ async def generate_auto_briefing(session_id: str) -> Dict[str, Any]:
 4. **이번 주 일정**: 주요 발표 3건
 
 각 섹션을 명확히 구분하고, 차트는 make_chart 툴로 생성해주세요."""
-    
-    return await chat_with_tools(session_id, briefing_prompt)
 
+# 동시에 들어온 브리핑 요청은 한 번의 툴 루프 결과를 공유
+_briefing_flight = SingleFlight("briefing")
+
+
+async def generate_auto_briefing(session_id: str) -> Dict[str, Any]:
+    """
+    자동 브리핑 생성
+    - 오늘의 핵심 지표 3개
+    - 주요 포인트 3줄
+    - 차트 2개
+    - 오늘/이번 주 일정 3건
+    """
+    result = await _briefing_flight.do(("briefing",), chat_with_tools, session_id, BRIEFING_PROMPT)
+    return {**result, "session_id": session_id}
@@ -0,0 +1,121 @@
+"""대시보드 첫 화면 배치 조회
+
+여러 리소스(kpis, trends, news, kpis_extended, tickers, calendar)를 한 요청으로
+묶어 서버에서 동시에 조회합니다.
+- 실시간 소스 fan-out 은 요청당 한 번만 하고 모든 파트가 공유 (데이터 버전은 파트 조립 후 다시 읽음)
+- 각 파트는 개별 엔드포인트와 같은 스냅샷 캐시를 쓰므로 인코딩된 바이트를 그대로 이어 붙임
+- 한 파트가 실패해도 나머지는 응답하고, 실패는 errors 에 파트별로 기록
+"""
+import asyncio
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+import orjson
+from app.core.metrics import metrics
+from app.services.calendar_store import calendar, persist_events
+from app.services.live_adapters import LiveSnapshot, fan_out
+from app.services.snapshot import Snapshot, data_version
+from app.services.market_adapters import kpis_snapshot, trends_snapshot, news_snapshot
+from app.services.advanced_adapters import fetch_extended_kpis, fetch_calendar_events, fetch_market_tickers
+from app.services.range_index import parse_windows
+
+
+class DashboardContext:
+    """요청 하나에서 모든 파트가 공유하는 조회 결과"""
+
+    def __init__(self, live: LiveSnapshot, windows: Optional[str] = None):
+        self.live = live
+        self.windows = windows
+
+    # 저장소만 쓰는 파트 / 실시간 소스까지 반영하는 파트의 데이터 버전
+    # (스냅샷 캐시가 조립 후 다시 읽도록 값이 아니라 메서드로 넘김)
+    def base_version(self) -> str:
+        return data_version()
+
+    def live_version(self) -> str:
+        return data_version(self.live)
+
+
+async def _kpis(ctx: DashboardContext) -> Snapshot:
+    return kpis_snapshot(ctx.base_version)
+
+
+async def _trends(ctx: DashboardContext) -> Snapshot:
+    return trends_snapshot(ctx.base_version)
+
+
+async def _news(ctx: DashboardContext) -> Snapshot:
+    return news_snapshot(ctx.base_version)
+
+
+async def _kpis_extended(ctx: DashboardContext) -> Snapshot:
+    return await fetch_extended_kpis(ctx.live, ctx.live_version)
+
+
+async def _tickers(ctx: DashboardContext) -> Snapshot:
+    return await fetch_market_tickers(parse_windows(ctx.windows), ctx.live, ctx.live_version)
+
+
+async def _calendar(ctx: DashboardContext) -> Snapshot:
+    return await fetch_calendar_events(ctx.live, ctx.live_version)
+
+
+PARTS: Dict[str, Callable[[DashboardContext], Awaitable[Snapshot]]] = {
+    "kpis": _kpis,
+    "trends": _trends,
+    "news": _news,
+    "kpis_extended": _kpis_extended,
+    "tickers": _tickers,
+    "calendar": _calendar,
+}
+DEFAULT_PARTS = ("kpis", "trends", "news")
+
+
+def parse_parts(value: Optional[str]) -> List[str]:
+    """쉼표 구분 파트 목록 검증 (순서 유지, 중복 제거)"""
+    if not value:
+        return list(DEFAULT_PARTS)
+    parts = list(dict.fromkeys(part.strip().lower() for part in value.split(",") if part.strip()))
+    unknown = [part for part in parts if part not in PARTS]
+    if unknown:
+        raise ValueError(f"알 수 없는 파트: {', '.join(unknown)} (가능: {', '.join(PARTS)})")
+    return parts or list(DEFAULT_PARTS)
+
+
+def _error(exc: BaseException) -> Dict[str, object]:
+    if isinstance(exc, ValueError):
+        return {"status": 400, "detail": str(exc)}
+    return {"status": 500, "detail": "파트 조회 실패"}
+
+
+async def resolve_dashboard(parts: List[str], windows: Optional[str] = None) -> bytes:
+    """
+    파트별 스냅샷을 동시에 조회해 하나의 JSON 바이트로 조립
+    {"version": ..., "parts": {이름: payload}, "errors": {이름: {status, detail}}}
+    """
+    live = await fan_out()
+    if live.events:
+        # 캘린더 버전이 바뀌므로 파트 조회 전에 반영 (검증을 통과한 일정만 저장)
+        await persist_events(calendar.apply(live.events))
+    ctx = DashboardContext(live, windows)
+
+    results = await asyncio.gather(*(PARTS[name](ctx) for name in parts), return_exceptions=True)
+
+    bodies: List[Tuple[str, bytes]] = []
+    errors: Dict[str, Dict[str, object]] = {}
+    for name, result in zip(parts, results):
+        if isinstance(result, BaseException):
+            if not isinstance(result, ValueError):
+                print(f"[WARNING] Dashboard part {name} failed: {result}")
+            errors[name] = _error(result)
+            metrics.incr("dashboard.part_errors")
+        else:
+            bodies.append((name, result.body))
+    metrics.incr("dashboard.requests")
+    metrics.incr("dashboard.parts", len(parts))
+
+    # 스냅샷 바이트는 이미 JSON 이므로 다시 인코딩하지 않고 이어 붙임
+    parts_body = b",".join(orjson.dumps(name) + b":" + body for name, body in bodies)
+    return (
+        b'{"version":' + orjson.dumps(ctx.live_version())
+        + b',"parts":{' + parts_body
+        + b'},"errors":' + orjson.dumps(errors) + b"}"
+    )
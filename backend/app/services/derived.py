@@ -0,0 +1,137 @@
+"""파생 지표 엔진 (MoM / QoQ / YoY 등 변화율)
+
+저장소 시계열에서 변화율·차분을 벡터 연산으로 계산하고 (지표, 기간, 방식)별로 캐시합니다.
+시계열에 관측치가 append 되면 늘어난 꼬리 구간만 계산해 이어 붙이고,
+시계열이 교체(put/merge)되면 전체를 다시 계산합니다.
+
+기간(lag) 정의:
+- ("obs", k): k개 이전 관측치 (예: 1D = 직전 영업일)
+- ("D", k):  k일 전 시점 이전의 마지막 관측치
+- ("M", k):  k개월 전 같은 날짜 이전의 마지막 관측치 (월말은 말일로 보정)
+"""
+from typing import Dict, Any, Optional, Tuple
+import numpy as np
+from app.services.series_store import Series, SeriesStore, store
+
+
+LAGS: Dict[str, Tuple[str, int]] = {
+    "1d": ("obs", 1),
+    "1w": ("D", 7),
+    "1m": ("M", 1),
+    "3m": ("M", 3),
+    "mom": ("M", 1),
+    "qoq": ("M", 3),
+    "yoy": ("M", 12),
+    "52w": ("D", 364),
+}
+
+# 변화 방식: 기본은 퍼센트 변화율, 비율/금리 지표는 차분(%p)
+DIFF_METRICS = {
+    "CPI_YOY", "CORE_CPI_YOY", "POLICY_RATE", "UNEMPLOYMENT", "GDP_YOY",
+    "RETAIL_SALES", "PMI_MANUFACTURING", "KR3YT", "KR10YT", "USD/KRW", "USD_KRW",
+}
+
+
+def change_kind(metric: str) -> str:
+    return "diff" if metric in DIFF_METRICS else "pct"
+
+
+def shift_months(dates: np.ndarray, months: int) -> np.ndarray:
+    """날짜를 months 개월 이전으로 이동 (대상 월의 말일을 넘지 않도록 보정)"""
+    month_start = dates.astype("datetime64[M]")
+    day_offset = dates - month_start.astype("datetime64[D]")
+    target = month_start - months
+    month_length = (target + 1).astype("datetime64[D]") - target.astype("datetime64[D]")
+    return target.astype("datetime64[D]") + np.minimum(day_offset, month_length - np.timedelta64(1, "D"))
+
+
+def lag_index(dates: np.ndarray, positions: np.ndarray, lag: Tuple[str, int]) -> np.ndarray:
+    """positions 각 관측치의 비교 대상 인덱스 (없으면 -1)"""
+    unit, k = lag
+    if unit == "obs":
+        index = positions - k
+    else:
+        current = dates[positions]
+        target = current - np.timedelta64(k, "D") if unit == "D" else shift_months(current, k)
+        index = np.searchsorted(dates, target, side="right") - 1
+        index = np.where(index < positions, index, -1)
+    return np.where(index >= 0, index, -1)
+
+
+def compute_change(
+    dates: np.ndarray,
+    values: np.ndarray,
+    lag: Tuple[str, int],
+    kind: str = "pct",
+    start: int = 0,
+) -> np.ndarray:
+    """values[start:] 구간의 변화율/차분 (정의되지 않으면 NaN)"""
+    positions = np.arange(start, len(values))
+    index = lag_index(dates, positions, lag)
+    valid = index >= 0
+    base = np.where(valid, values[np.maximum(index, 0)], np.nan)
+    current = values[positions]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if kind == "diff":
+            result = current - base
+        else:
+            result = (current - base) / np.abs(base) * 100.0
+    result[~np.isfinite(result)] = np.nan
+    return result
+
+
+class DerivedEngine:
+    """(지표, 기간, 방식)별 파생 배열 캐시 + 꼬리 증분 계산"""
+
+    def __init__(self, source: SeriesStore = store):
+        self.source = source
+        # key → (series, 계산된 길이, 결과 배열)
+        self._cache: Dict[Tuple[str, str, str], Tuple[Series, int, np.ndarray]] = {}
+        self.full_computes = 0
+        self.tail_computes = 0
+
+    def changes(self, metric: str, period: str, kind: Optional[str] = None) -> np.ndarray:
+        """전체 구간 파생 배열 (시계열과 같은 길이)"""
+        kind = kind or change_kind(metric)
+        key = (metric, period, kind)
+        series = self.source.ensure(metric)
+        cached = self._cache.get(key)
+
+        if cached is not None and cached[0] is series and cached[1] == len(series):
+            return cached[2]
+
+        if cached is not None and cached[0] is series and cached[1] < len(series):
+            # append 된 꼬리만 계산
+            tail = compute_change(series.dates, series.values, LAGS[period], kind, start=cached[1])
+            result = np.concatenate([cached[2], tail])
+            self.tail_computes += 1
+        else:
+            result = compute_change(series.dates, series.values, LAGS[period], kind)
+            self.full_computes += 1
+
+        self._cache[key] = (series, len(series), result)
+        return result
+
+    def latest(self, metric: str, period: str, kind: Optional[str] = None, ndigits: int = 2) -> Optional[float]:
+        """가장 최근 관측치의 파생 값"""
+        result = self.changes(metric, period, kind)
+        if not len(result) or np.isnan(result[-1]):
+            return None
+        return round(float(result[-1]), ndigits)
+
+    def last_value(self, metric: str, ndigits: int = 2) -> Optional[float]:
+        series = self.source.ensure(metric)
+        if not len(series):
+            return None
+        return round(float(series.values[-1]), ndigits)
+
+    def summary(self, metric: str, periods: Tuple[str, ...] = ("mom", "yoy")) -> Dict[str, Any]:
+        """최근 값 + 기간별 변화 (API 응답용)"""
+        return {
+            "value": self.last_value(metric),
+            **{period: self.latest(metric, period) for period in periods},
+        }
+
+
+# 프로세스 공유 엔진
+engine = DerivedEngine()
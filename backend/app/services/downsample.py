@@ -0,0 +1,159 @@
+"""차트/스파크라인 다운샘플링
+
+일별 데이터가 10년 이상 쌓여도 위젯 payload 와 렌더링 시간이 일정하도록
+위젯 타입별 포인트 예산(budget)에 맞춰 서버에서 축약합니다.
+- lttb: Largest-Triangle-Three-Buckets (모양 보존, 선/영역 차트)
+- minmax: 버킷별 최솟값/최댓값 엔벨로프 (급등락 보존)
+저장소 시계열은 (시계열, 구간, 예산, 방식)별로 결과를 캐시합니다.
+"""
+from collections import OrderedDict
+from typing import Dict, Any, List, Tuple
+import numpy as np
+from app.services.series_store import SeriesStore, DateLike, store, points
+
+
+# 위젯 타입별 포인트 예산
+POINT_BUDGETS: Dict[str, int] = {
+    "line": 400,
+    "area": 400,
+    "combo": 400,
+    "bar": 120,
+    "sparkline": 24,
+    "sparkline_7d": 7,
+}
+DEFAULT_BUDGET = 400
+
+CACHE_SIZE = 512
+
+
+def budget_for(widget_type: str) -> int:
+    return POINT_BUDGETS.get(widget_type, DEFAULT_BUDGET)
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """LTTB 로 선택된 인덱스 (처음/끝 포함, threshold 개)"""
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    # 버킷 i = [edges[i], edges[i+1]), 첫/마지막 점은 고정
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    # 버킷별 평균을 한 번에 계산, 버킷 i 는 다음 버킷 평균(마지막은 끝 점)을 꼭짓점으로 사용
+    inner = edges[:-1]
+    counts = np.diff(edges)
+    avg_x = np.r_[(np.add.reduceat(x[:n - 1], inner) / counts)[1:], x[-1]]
+    avg_y = np.r_[(np.add.reduceat(y[:n - 1], inner) / counts)[1:], y[-1]]
+
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i in range(threshold - 2):
+        lo, hi = edges[i], edges[i + 1]
+        area = np.abs(
+            (x[a] - avg_x[i]) * (y[lo:hi] - y[a])
+            - (x[a] - x[lo:hi]) * (avg_y[i] - y[a])
+        )
+        a = lo + int(np.argmax(area))
+        selected[i + 1] = a
+    return selected
+
+
+def minmax_indices(y: np.ndarray, threshold: int) -> np.ndarray:
+    """버킷별 최솟값/최댓값 인덱스 (처음/끝 포함, 시간순)"""
+    n = len(y)
+    if threshold >= n or threshold < 4:
+        return np.arange(n)
+    buckets = max((threshold - 2) // 2, 1)
+    bucket = np.arange(n) * buckets // n
+    order = np.lexsort((y, bucket))
+    starts = np.r_[0, np.flatnonzero(np.diff(bucket[order])) + 1]
+    ends = np.r_[starts[1:], n] - 1
+    return np.unique(np.r_[0, order[starts], order[ends], n - 1])
+
+
+def downsample(
+    dates: np.ndarray,
+    values: np.ndarray,
+    budget: int,
+    method: str = "lttb",
+) -> Tuple[np.ndarray, np.ndarray]:
+    """(dates, values) 를 budget 이하 포인트로 축약 (NaN 제외)"""
+    keep = ~np.isnan(values)
+    dates, values = dates[keep], values[keep]
+    if len(values) <= budget:
+        return dates, values
+    if method == "minmax":
+        index = minmax_indices(values, budget)
+    else:
+        index = lttb_indices(dates.astype(np.int64), values, budget)
+    return dates[index], values[index]
+
+
+class DownsampleCache:
+    """저장소 시계열 다운샘플 결과 LRU 캐시"""
+
+    def __init__(self, source: SeriesStore = store, size: int = CACHE_SIZE):
+        self.source = source
+        self.size = size
+        self._cache: "OrderedDict[tuple, Tuple[np.ndarray, np.ndarray]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self,
+        metric: str,
+        start: DateLike = None,
+        end: DateLike = None,
+        budget: int = DEFAULT_BUDGET,
+        method: str = "lttb",
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        series = self.source.ensure(metric)
+        lo, hi = series.bounds(start, end)
+        # 시계열 교체(uid)·append(len) 시 자동으로 다른 키
+        key = (metric, series.uid, len(series), lo, hi, budget, method)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        result = downsample(series.dates[lo:hi], series.values[lo:hi], budget, method)
+        self._cache[key] = result
+        if len(self._cache) > self.size:
+            self._cache.popitem(last=False)
+        return result
+
+    def points(
+        self,
+        metric: str,
+        start: DateLike = None,
+        end: DateLike = None,
+        budget: int = DEFAULT_BUDGET,
+        method: str = "lttb",
+    ) -> List[Dict[str, Any]]:
+        dates, values = self.get(metric, start, end, budget, method)
+        return points(self.source.ensure(metric).labels(dates), values)
+
+
+def downsample_points(
+    items: List[Dict[str, Any]],
+    budget: int,
+    method: str = "lttb",
+) -> List[Dict[str, Any]]:
+    """[{date, value}] 리스트 축약 (저장소 밖 데이터용, 캐시 없음)"""
+    if len(items) <= budget:
+        return items
+    values = np.array([item["value"] for item in items], dtype=np.float64)
+    if method == "minmax":
+        index = minmax_indices(values, budget)
+    else:
+        x = np.array([item["date"] for item in items], dtype="datetime64[D]").astype(np.int64)
+        index = lttb_indices(x, values, budget)
+    return [items[i] for i in index.tolist()]
+
+
+# 프로세스 공유 캐시
+cache = DownsampleCache()
@@ -0,0 +1,431 @@
+"""ECOS / KOSIS / KRX 파일 덤프 일괄 적재 파이프라인
+
+대용량 CSV / JSON / NDJSON 내보내기 파일을 청크 단위로 스트리밍하여
+- 기간 표기(YYYYMMDD, YYYYMM, YYYYQn, YYYY 등)를 기간 시작일로 정규화
+- 단위(천원, 억달러 등)를 기본 단위로 환산
+- 같은 (지표, 날짜)의 리비전은 최신 값만 유지
+- 청크마다 시계열 저장소 / 아카이브 / MongoDB(bulk_write 배치)에 바로 기록
+하며, 진행 중 처리량(rows/s)을 출력합니다.
+
+사용 예:
+    python -m app.services.ingest --format ecos --archive ./data/series dumps/ecos_*.json
+"""
+import argparse
+import asyncio
+import csv
+import json
+import os
+import re
+import time
+from datetime import datetime
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from app.services.json_stream import iter_array_items, read_chunks
+from app.services.series_store import SeriesStore, merge_arrays, store
+from app.services import series_archive
+
+
+# ===== 소스별 컬럼 매핑 =====
+SOURCE_FORMATS: Dict[str, Dict[str, Any]] = {
+    "ecos": {
+        "time": "TIME",
+        "value": "DATA_VALUE",
+        "code": ["STAT_CODE", "ITEM_CODE1"],
+        "unit": "UNIT_NAME",
+        "source": "한국은행 ECOS",
+    },
+    "kosis": {
+        "time": "PRD_DE",
+        "value": "DT",
+        "code": ["TBL_ID", "ITM_ID", "C1"],
+        "unit": "UNIT_NM",
+        "revision": "LST_CHN_DE",
+        "source": "통계청 KOSIS",
+    },
+    "krx": {
+        "time": "BAS_DD",
+        "value": "CLSPRC_IDX",
+        "code": ["IDX_NM"],
+        "unit": None,
+        "source": "한국거래소",
+    },
+}
+
+# 원천 코드 → 내부 지표명
+METRIC_CODES: Dict[str, str] = {
+    "722Y001:0101000": "POLICY_RATE",
+    "901Y009:0": "CPI",
+    "731Y001:0000001": "USD_KRW",
+    "코스피": "KOSPI",
+}
+
+# 단위 환산 배수 (기본 단위 기준)
+UNIT_SCALES: Dict[str, float] = {
+    "천원": 1e3,
+    "백만원": 1e6,
+    "억원": 1e8,
+    "십억원": 1e9,
+    "조원": 1e12,
+    "천달러": 1e3,
+    "백만달러": 1e6,
+    "억달러": 1e8,
+    "천명": 1e3,
+    "만명": 1e4,
+}
+
+# 목표 주기 → numpy 기간 단위
+FREQ_PERIODS = {"M": "M", "Q": "M", "A": "Y"}
+
+_QUARTER = re.compile(r"^(\d{4})\s*Q([1-4])$", re.IGNORECASE)
+_DIGITS = re.compile(r"[^\d]")
+
+
+def parse_period(text: str) -> Optional[Tuple[np.datetime64, str]]:
+    """
+    기간 표기를 (기간 시작일, 주기)로 변환
+    - 20240115 / 2024-01-15 → D, 202401 / 2024.01 → M, 2024Q1 → Q, 2024 → A
+    """
+    text = str(text).strip()
+    match = _QUARTER.match(text)
+    if match:
+        month = (int(match.group(2)) - 1) * 3 + 1
+        return np.datetime64(f"{match.group(1)}-{month:02d}-01", "D"), "Q"
+    digits = _DIGITS.sub("", text)
+    if len(digits) == 8:
+        return np.datetime64(f"{digits[:4]}-{digits[4:6]}-{digits[6:]}", "D"), "D"
+    if len(digits) == 6:
+        return np.datetime64(f"{digits[:4]}-{digits[4:]}-01", "D"), "M"
+    if len(digits) == 4:
+        return np.datetime64(f"{digits}-01-01", "D"), "A"
+    return None
+
+
+def parse_value(text: Any) -> Optional[float]:
+    """숫자 문자열 파싱 ("2,655.20" 허용, "-"/빈값은 None)"""
+    if text is None:
+        return None
+    if isinstance(text, (int, float)):
+        return float(text)
+    text = str(text).replace(",", "").strip()
+    if not text or text in ("-", ".", "..."):
+        return None
+    try:
+        return float(text)
+    except ValueError:
+        return None
+
+
+def normalize_row(
+    row: Dict[str, Any],
+    fmt: Dict[str, Any],
+    metric: Optional[str] = None,
+) -> Optional[Tuple[str, np.datetime64, float, str, str]]:
+    """원천 행 → (지표, 날짜, 값, 주기, 리비전) / 유효하지 않으면 None"""
+    period = parse_period(row.get(fmt["time"], ""))
+    value = parse_value(row.get(fmt["value"]))
+    if period is None or value is None:
+        return None
+    if fmt.get("unit"):
+        value *= UNIT_SCALES.get(str(row.get(fmt["unit"], "")).strip(), 1.0)
+    if metric is None:
+        code = ":".join(str(row.get(key, "")).strip() for key in fmt["code"] if row.get(key) not in (None, ""))
+        metric = METRIC_CODES.get(code, code)
+    revision = str(row.get(fmt["revision"], "")) if fmt.get("revision") else ""
+    return metric, period[0], value, period[1], revision
+
+
+# ===== 파일 리더 (청크 단위) =====
+def read_rows(path: str, chunk_size: int = 50_000, encoding: str = "utf-8-sig") -> Iterator[List[Dict[str, Any]]]:
+    """파일 확장자에 따라 CSV / NDJSON / JSON 배열을 청크(list of dict)로 읽기"""
+    ext = os.path.splitext(path)[1].lower()
+    with open(path, encoding=encoding, newline="") as fp:
+        if ext == ".csv":
+            rows: Iterator[Dict[str, Any]] = csv.DictReader(fp)
+        elif ext in (".ndjson", ".jsonl"):
+            rows = _iter_ndjson(fp)
+        else:
+            rows = iter_array_items(read_chunks(fp))
+
+        chunk: List[Dict[str, Any]] = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+
+def _iter_ndjson(fp) -> Iterator[Dict[str, Any]]:
+    for line in fp:
+        line = line.strip()
+        if line:
+            yield json.loads(line)
+
+
+# ===== 파이프라인 =====
+class IngestPipeline:
+    """
+    청크 단위 정규화 → 지표별 최신 리비전 병합 → 저장소/아카이브 즉시 반영
+
+    입력 행은 청크를 처리하는 동안만 메모리에 두고, 지표별로는 결과 포인트마다
+    (값, 원천 날짜, 리비전) 만 보관합니다. 메모리는 입력 크기가 아니라 결과 포인트 수에 비례합니다.
+    """
+
+    def __init__(
+        self,
+        fmt: str,
+        metric: Optional[str] = None,
+        target_freq: Optional[str] = None,
+        target: SeriesStore = store,
+        archive_dir: Optional[str] = None,
+    ):
+        if fmt not in SOURCE_FORMATS:
+            raise ValueError(f"지원하지 않는 형식: {fmt} (사용 가능: {', '.join(SOURCE_FORMATS)})")
+        self.fmt = SOURCE_FORMATS[fmt]
+        self.metric = metric
+        self.target_freq = target_freq
+        self.target = target
+        self.archive_dir = archive_dir
+        # 지표별 적재 결과 (날짜 오름차순): (dates, values, 원천 날짜, revisions)
+        self._state: Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]] = {}
+        self._freqs: Dict[str, str] = {}
+        # 지표별 아카이브에 기록된 마지막 날짜 (빈 아카이브는 None)
+        self._archived: Dict[str, Optional[np.datetime64]] = {}
+        self.rows_read = 0
+        self.rows_skipped = 0
+        self.started_at = time.perf_counter()
+
+    def feed(self, rows: List[Dict[str, Any]]) -> Dict[str, Tuple[np.ndarray, np.ndarray, str]]:
+        """청크 하나를 정규화하여 바로 병합/반영, 이 청크로 바뀐 포인트 반환 (지표별 dates, values, freq)"""
+        grouped: Dict[str, Tuple[list, list, list]] = {}
+        for row in rows:
+            parsed = normalize_row(row, self.fmt, self.metric)
+            if parsed is None:
+                self.rows_skipped += 1
+                continue
+            metric, day, value, freq, revision = parsed
+            dates, values, revisions = grouped.setdefault(metric, ([], [], []))
+            dates.append(day)
+            values.append(value)
+            revisions.append(revision)
+            self._freqs[metric] = freq
+        self.rows_read += len(rows)
+
+        changed = {}
+        for metric, (dates, values, revisions) in grouped.items():
+            update = self._merge(
+                metric,
+                np.array(dates, dtype="datetime64[D]"),
+                np.array(values, dtype=np.float64),
+                np.array(revisions),
+            )
+            if len(update[0]):
+                self._apply(metric, *update)
+                changed[metric] = update
+        return changed
+
+    def _freq(self, metric: str) -> str:
+        freq = self._freqs[metric]
+        return self.target_freq if self.target_freq and self.target_freq != freq else freq
+
+    def _periods(self, metric: str, days: np.ndarray) -> np.ndarray:
+        """목표 주기가 다르면 기간 시작일로 내림"""
+        if not self.target_freq or self.target_freq == self._freqs[metric]:
+            return days
+        periods = days.astype(f"datetime64[{FREQ_PERIODS[self.target_freq]}]")
+        if self.target_freq == "Q":
+            periods = periods - (periods.astype(np.int64) % 3)
+        return periods.astype("datetime64[D]")
+
+    def _merge(
+        self, metric: str, days: np.ndarray, values: np.ndarray, revisions: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, str]:
+        """
+        청크를 지금까지의 결과와 병합, 이 청크 값이 채택된 포인트만 반환
+        - 같은 날짜(기간)는 (원천 날짜, 리비전, 읽은 순서) 가 가장 큰 값 = 기간별 마지막 관측치의 최신 리비전
+        """
+        dates = self._periods(metric, days)
+        previous = self._state.get(metric)
+        fresh_from = 0
+        if previous is not None:
+            fresh_from = len(previous[0])
+            dates, values, days, revisions = (
+                np.concatenate([old, new]) for old, new in zip(previous, (dates, values, days, revisions))
+            )
+        order = np.lexsort((np.arange(len(dates)), revisions, days))
+        # 역순에서 첫 번째 = 날짜별 마지막
+        _, first = np.unique(dates[order][::-1], return_index=True)
+        keep = order[::-1][first]
+        self._state[metric] = (dates[keep], values[keep], days[keep], revisions[keep])
+        fresh = keep[keep >= fresh_from]
+        return dates[fresh], values[fresh], self._freq(metric)
+
+    def _apply(self, metric: str, dates: np.ndarray, values: np.ndarray, freq: str) -> None:
+        """저장소에 병합하고, 아카이브는 뒤에 붙는 경우 append / 아니면 다시 기록"""
+        if self.archive_dir and metric not in self._archived:
+            self._seed(metric)
+        series = self.target.merge(metric, dates, values, freq=freq, source=self.fmt["source"])
+        if not self.archive_dir:
+            return
+        last = self._archived.get(metric)
+        if last is not None and dates[0] > last:
+            series_archive.append(self.archive_dir, metric, dates, values)
+        else:
+            series_archive.write_series(
+                self.archive_dir, metric, series.dates, series.values,
+                freq=series.freq, source=series.source,
+            )
+        self._archived[metric] = series.dates[-1]
+
+    def _seed(self, metric: str) -> None:
+        """
+        기존 아카이브를 이어받음 (이전 실행의 히스토리를 지우지 않도록)
+        - 저장소에 없으면 아카이브를 연결하고, 있으면 아카이브 히스토리를 아래에 깔아 병합
+        """
+        archived = series_archive.open_series(self.archive_dir, metric)
+        if archived is None:
+            return
+        current = self.target.get(metric)
+        if current is None:
+            self.target.attach(archived)
+        else:
+            dates, values = merge_arrays(archived.dates, archived.values, current.dates, current.values)
+            self.target.put(metric, dates, values, freq=current.freq, source=current.source)
+        self._archived[metric] = archived.dates[-1] if len(archived.dates) else None
+
+    def finish(self) -> Dict[str, Tuple[np.ndarray, np.ndarray, str]]:
+        """지표별 적재 결과 반환 (저장소/아카이브는 feed 시점에 이미 반영됨)"""
+        resolved = {
+            metric: (dates, values, self._freq(metric))
+            for metric, (dates, values, _, _) in self._state.items()
+        }
+        self._state.clear()
+        return resolved
+
+    @property
+    def rows_per_second(self) -> float:
+        elapsed = time.perf_counter() - self.started_at
+        return self.rows_read / elapsed if elapsed > 0 else 0.0
+
+
+async def ensure_indexes(db) -> None:
+    await db.series_points.create_index([("metric", 1), ("date", 1)], unique=True)
+
+
+async def write_to_mongo(
+    db,
+    resolved: Dict[str, Tuple[np.ndarray, np.ndarray, str]],
+    source: str,
+    batch_size: int = 5_000,
+) -> int:
+    """(metric, date) 기준 upsert 를 batch_size 단위 bulk_write 로 기록"""
+    from pymongo import UpdateOne
+
+    collection = db.series_points
+    written = 0
+    now = datetime.utcnow()
+    for metric, (dates, values, freq) in resolved.items():
+        days = dates.tolist()
+        for lo in range(0, len(dates), batch_size):
+            ops = [
+                UpdateOne(
+                    {"metric": metric, "date": datetime(day.year, day.month, day.day)},
+                    {"$set": {"value": value, "freq": freq, "source": source, "ingested_at": now}},
+                    upsert=True,
+                )
+                for day, value in zip(days[lo:lo + batch_size], values[lo:lo + batch_size].tolist())
+            ]
+            await collection.bulk_write(ops, ordered=False)
+            written += len(ops)
+    return written
+
+
+def iter_ingest(
+    pipeline: IngestPipeline,
+    paths: List[str],
+    chunk_size: int = 50_000,
+    encoding: str = "utf-8-sig",
+    report=print,
+) -> Iterator[Dict[str, Tuple[np.ndarray, np.ndarray, str]]]:
+    """파일들을 순서대로 청크 적재하며 청크별 변경 포인트를 내보냄 (뒤에 오는 파일이 같은 리비전 내에서 우선)"""
+    for path in paths:
+        for rows in read_rows(path, chunk_size=chunk_size, encoding=encoding):
+            changed = pipeline.feed(rows)
+            report(f"[INGEST] {os.path.basename(path)}: {pipeline.rows_read:,} rows ({pipeline.rows_per_second:,.0f} rows/s)")
+            yield changed
+
+
+def _summary(pipeline: IngestPipeline, resolved: Dict[str, Tuple[np.ndarray, np.ndarray, str]], report=print) -> None:
+    points = sum(len(dates) for dates, _, _ in resolved.values())
+    report(
+        f"[OK] Ingested {pipeline.rows_read:,} rows → {len(resolved)} metrics, {points:,} points "
+        f"(skipped {pipeline.rows_skipped:,}, {pipeline.rows_per_second:,.0f} rows/s)"
+    )
+
+
+def run(
+    paths: List[str],
+    fmt: str,
+    metric: Optional[str] = None,
+    target_freq: Optional[str] = None,
+    chunk_size: int = 50_000,
+    archive_dir: Optional[str] = None,
+    encoding: str = "utf-8-sig",
+    target: SeriesStore = store,
+    report=print,
+) -> Tuple[IngestPipeline, Dict[str, Tuple[np.ndarray, np.ndarray, str]]]:
+    """파일들을 적재하고 (파이프라인, 지표별 결과) 반환"""
+    pipeline = IngestPipeline(fmt, metric=metric, target_freq=target_freq, target=target, archive_dir=archive_dir)
+    for _ in iter_ingest(pipeline, paths, chunk_size=chunk_size, encoding=encoding, report=report):
+        pass
+    resolved = pipeline.finish()
+    _summary(pipeline, resolved, report)
+    return pipeline, resolved
+
+
+async def _main(args: argparse.Namespace) -> None:
+    pipeline = IngestPipeline(args.format, metric=args.metric, target_freq=args.freq, archive_dir=args.archive)
+    chunks = iter_ingest(pipeline, args.paths, chunk_size=args.chunk_size, encoding=args.encoding)
+    if not args.mongo:
+        for _ in chunks:
+            pass
+        _summary(pipeline, pipeline.finish())
+        return
+
+    from app.db.mongo import connect_to_mongo, close_mongo_connection, get_database
+
+    await connect_to_mongo()
+    try:
+        db = get_database()
+        await ensure_indexes(db)
+        started = time.perf_counter()
+        written = 0
+        # 청크를 파싱하는 대로 bulk_write (전체 파일 파싱을 기다리지 않음)
+        for changed in chunks:
+            written += await write_to_mongo(db, changed, pipeline.fmt["source"], args.batch_size)
+        elapsed = time.perf_counter() - started
+        _summary(pipeline, pipeline.finish())
+        print(f"[OK] MongoDB bulk_write: {written:,} points ({written / max(elapsed, 1e-9):,.0f} rows/s)")
+    finally:
+        await close_mongo_connection()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="ECOS/KOSIS/KRX 파일 덤프 적재")
+    parser.add_argument("paths", nargs="+", help="CSV / JSON / NDJSON 파일 경로")
+    parser.add_argument("--format", required=True, choices=sorted(SOURCE_FORMATS))
+    parser.add_argument("--metric", help="모든 행을 하나의 지표로 적재 (코드 매핑 무시)")
+    parser.add_argument("--freq", choices=sorted(FREQ_PERIODS), help="목표 주기로 변환 (기간별 마지막 값)")
+    parser.add_argument("--chunk-size", type=int, default=50_000)
+    parser.add_argument("--batch-size", type=int, default=5_000, help="MongoDB bulk_write 배치 크기")
+    parser.add_argument("--archive", help="시계열 아카이브 디렉토리")
+    parser.add_argument("--mongo", action="store_true", help="MongoDB series_points 컬렉션에도 기록")
+    parser.add_argument("--encoding", default="utf-8-sig", help="파일 인코딩 (예: cp949)")
+    asyncio.run(_main(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""증분 JSON 배열 파서
+
+청크 단위로 들어오는 텍스트에서 첫 번째 "객체 배열"을 찾아,
+배열 원소가 닫히는 즉시 하나씩 돌려줍니다.
+- ECOS 응답: {"StatisticSearch": {"row": [{...}, {...}]}}
+- 문제 생성 응답: {"problems": [{...}, {...}]}
+- 최상위 배열: [{...}, {...}]
+마지막 원소가 깨져 있어도 그 이전 원소들은 이미 반환된 상태입니다.
+"""
+import json
+from typing import Any, Iterable, Iterator, List, TextIO
+
+
+# 소비한 버퍼 앞부분을 정리하는 기준 (문자 수)
+COMPACT_THRESHOLD = 1 << 16
+
+
+class ArrayItemParser:
+    """feed() 로 텍스트 청크를 넣으면 완성된 배열 원소 리스트를 반환"""
+
+    def __init__(self):
+        self._buf = ""
+        self._pos = 0
+        self._state = "seek"  # seek → items → done
+        self._in_string = False
+        self._escape = False
+        self._decoder = json.JSONDecoder()
+
+    @property
+    def done(self) -> bool:
+        """배열이 닫혔는지 여부"""
+        return self._state == "done"
+
+    @property
+    def pending(self) -> str:
+        """아직 완성되지 않은 꼬리 텍스트"""
+        return self._buf[self._pos:]
+
+    def feed(self, text: str) -> List[Any]:
+        self._buf += text
+        items: List[Any] = []
+        if self._state == "seek":
+            self._seek()
+        if self._state == "items":
+            items = self._drain()
+        if self._pos > COMPACT_THRESHOLD:
+            self._buf = self._buf[self._pos:]
+            self._pos = 0
+        return items
+
+    def _seek(self) -> None:
+        """문자열 내부를 건너뛰며 원소가 객체인 첫 '[' 를 찾음"""
+        buf, i = self._buf, self._pos
+        while i < len(buf):
+            ch = buf[i]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch == "[":
+                j = i + 1
+                while j < len(buf) and buf[j].isspace():
+                    j += 1
+                if j == len(buf):
+                    # 다음 청크에서 다시 판단
+                    break
+                if buf[j] in "{]":
+                    self._state = "items"
+                    i += 1
+                    break
+            i += 1
+        self._pos = i
+
+    def _drain(self) -> List[Any]:
+        buf, pos = self._buf, self._pos
+        items = []
+        while True:
+            while pos < len(buf) and (buf[pos].isspace() or buf[pos] == ","):
+                pos += 1
+            if pos >= len(buf):
+                break
+            if buf[pos] == "]":
+                self._state = "done"
+                pos += 1
+                break
+            try:
+                value, pos = self._decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                # 아직 닫히지 않은 원소 (또는 깨진 꼬리)
+                break
+            items.append(value)
+        self._pos = pos
+        return items
+
+
+def iter_array_items(chunks: Iterable[str]) -> Iterator[Any]:
+    """텍스트 청크 이터러블에서 배열 원소를 순서대로 생성"""
+    parser = ArrayItemParser()
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+        if parser.done:
+            return
+
+
+def read_chunks(fp: TextIO, chunk_size: int = 1 << 16) -> Iterator[str]:
+    """파일을 고정 크기 텍스트 청크로 읽기"""
+    while True:
+        chunk = fp.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
@@ -0,0 +1,170 @@
+"""실시간 시장 데이터 소스 어댑터
+
+여러 업스트림 소스를 공유 httpx.AsyncClient 로 동시에 조회(fan-out)하고,
+소스별 마감 시간(timeout)을 넘긴 소스는 건너뛴 채 부분 결과를 조립합니다.
+느린 거래소 피드 하나가 /market/kpis/extended 전체 지연을 결정하지 않도록 합니다.
+
+소스 응답 형식 (JSON):
+{
+    "source": "한국거래소",
+    "updated_at": "2024-01-15T09:00:00",
+    "quotes": {"KOSPI": 2655.2, "SPX": {"value": 4783.45, "updated_at": "..."}},
+    "events": [{"datetime": "2024-01-16 08:00", "indicator": "CPI (YoY)", ...}]
+}
+"""
+import asyncio
+import zlib
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+import httpx
+import orjson
+from app.core.config import settings
+from app.core.clients import get_http_client
+from app.core.singleflight import singleflight
+
+
+class SourceAdapter(ABC):
+    """업스트림 소스 공통 인터페이스"""
+
+    def __init__(self, name: str, label: Optional[str] = None, timeout: Optional[float] = None):
+        self.name = name
+        self.label = label or name
+        self.timeout = timeout if timeout is not None else settings.MARKET_SOURCE_TIMEOUT
+
+    @abstractmethod
+    async def fetch(self, client: httpx.AsyncClient) -> Dict[str, Any]:
+        """{"quotes": {metric: quote}, "events": [...]} 반환"""
+
+
+class HTTPJSONSource(SourceAdapter):
+    """JSON 엔드포인트 하나를 조회하는 소스"""
+
+    def __init__(self, name: str, url: str, label: Optional[str] = None, timeout: Optional[float] = None):
+        super().__init__(name, label, timeout)
+        self.url = url
+
+    async def fetch(self, client: httpx.AsyncClient) -> Dict[str, Any]:
+        response = await client.get(self.url)
+        response.raise_for_status()
+        return parse_payload(response.json(), self.label)
+
+
+def _parse_time(value: Any, default: datetime) -> datetime:
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, str) and value:
+        try:
+            return datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            pass
+    return default
+
+
+def parse_payload(payload: Dict[str, Any], label: str) -> Dict[str, Any]:
+    """소스 응답을 {quotes, events} 로 정규화 (출처/기준 시각 부여)"""
+    source = payload.get("source") or label
+    as_of = _parse_time(payload.get("updated_at"), datetime.utcnow())
+
+    quotes = {}
+    for metric, quote in (payload.get("quotes") or {}).items():
+        if not isinstance(quote, dict):
+            quote = {"value": quote}
+        if quote.get("value") is None:
+            continue
+        quotes[metric] = {
+            "value": float(quote["value"]),
+            "updated_at": _parse_time(quote.get("updated_at"), as_of),
+            "source": quote.get("source") or source,
+        }
+
+    events = [
+        {**event, "source": event.get("source") or source}
+        for event in payload.get("events") or []
+        if isinstance(event, dict)
+    ]
+    return {"quotes": quotes, "events": events}
+
+
+class LiveSnapshot:
+    """fan-out 결과 (소스별 상태 포함)"""
+
+    def __init__(self):
+        self.quotes: Dict[str, Dict[str, Any]] = {}
+        self.events: List[Dict[str, Any]] = []
+        self.status: Dict[str, str] = {}
+
+    def quote(self, metric: str) -> Optional[Dict[str, Any]]:
+        return self.quotes.get(metric)
+
+    def fingerprint(self) -> str:
+        """시세/일정 내용 해시 (비어 있으면 빈 문자열, 스냅샷 캐시 키용)"""
+        if not self.quotes and not self.events:
+            return ""
+        payload = orjson.dumps({"quotes": self.quotes, "events": self.events}, option=orjson.OPT_SORT_KEYS)
+        return f"{zlib.crc32(payload):08x}"
+
+
+# ===== 소스 레지스트리 =====
+_sources: Dict[str, SourceAdapter] = {}
+
+
+def register_source(adapter: SourceAdapter) -> SourceAdapter:
+    """소스 등록 (같은 이름은 교체)"""
+    _sources[adapter.name] = adapter
+    return adapter
+
+
+def unregister_source(name: str) -> None:
+    _sources.pop(name, None)
+
+
+def get_sources() -> List[SourceAdapter]:
+    return list(_sources.values())
+
+
+def configure_sources() -> int:
+    """설정(MARKET_SOURCES)의 HTTP 소스 등록, 등록된 수 반환"""
+    for name, url in settings.market_sources.items():
+        register_source(HTTPJSONSource(name, url))
+    return len(_sources)
+
+
+async def _fetch_one(adapter: SourceAdapter, client: httpx.AsyncClient) -> Dict[str, Any]:
+    return await asyncio.wait_for(adapter.fetch(client), timeout=adapter.timeout)
+
+
+@singleflight("fan_out", key=lambda sources=None, client=None: ("fan_out",) if sources is None and client is None else None)
+async def fan_out(
+    sources: Optional[List[SourceAdapter]] = None,
+    client: Optional[httpx.AsyncClient] = None,
+) -> LiveSnapshot:
+    """
+    모든 소스를 동시에 조회
+    - 소스별 timeout 을 넘기면 "timeout", 예외는 "error" 로 기록하고 나머지로 조립
+    - 같은 지표를 여러 소스가 주면 먼저 등록된 소스 우선
+    - 기본 소스 조회는 동시 요청끼리 한 번으로 병합 (결과 LiveSnapshot 공유)
+    """
+    sources = get_sources() if sources is None else sources
+    snapshot = LiveSnapshot()
+    if not sources:
+        return snapshot
+
+    client = client or get_http_client()
+    results = await asyncio.gather(
+        *(_fetch_one(adapter, client) for adapter in sources),
+        return_exceptions=True,
+    )
+
+    for adapter, result in zip(sources, results):
+        if isinstance(result, asyncio.TimeoutError):
+            snapshot.status[adapter.name] = "timeout"
+        elif isinstance(result, BaseException):
+            print(f"[WARNING] Market source {adapter.name} failed: {result}")
+            snapshot.status[adapter.name] = "error"
+        else:
+            snapshot.status[adapter.name] = "ok"
+            for metric, quote in result.get("quotes", {}).items():
+                snapshot.quotes.setdefault(metric, quote)
+            snapshot.events.extend(result.get("events", []))
+    return snapshot
@@ -0,0 +1,293 @@
+"""LLM 응답 캐시 (정확 일치, 2단계)
+
+같은 질문이 하루 종일 반복되므로, 정규화한 프롬프트 + 모델 + 파라미터가 같으면
+OpenAI 를 다시 호출하지 않고 저장된 응답을 돌려줍니다.
+- 1단계: 프로세스 내 LRU (만료 시각 포함)
+- 2단계: MongoDB llm_cache 컬렉션 (expires_at TTL 인덱스, 프로세스 간 공유/재시작 후 유지)
+- 엔드포인트별 TTL: settings.LLM_CACHE_TTLS
+- 우회: Cache-Control: no-cache 또는 X-LLM-Cache: refresh → 새로 생성해 저장,
+        Cache-Control: no-store 또는 X-LLM-Cache: bypass → 읽기/저장 모두 생략
+- 정확 일치 미스 시 Q&A 는 의미 캐시 (semantic_cache, MinHash) 도 조회
+- 지표: llm_cache.<엔드포인트>.memory_hits / mongo_hits / misses / stores / bypass
+"""
+import asyncio
+import functools
+import hashlib
+import inspect
+import re
+import time
+import unicodedata
+from collections import OrderedDict
+from contextvars import ContextVar
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+import orjson
+from pydantic import TypeAdapter
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.db.mongo import get_database
+from app.services.semantic_cache import semantic_index
+
+
+COLLECTION = "llm_cache"
+
+# 요청 단위 캐시 모드 ("use" | "refresh" | "bypass")
+cache_mode: ContextVar[str] = ContextVar("llm_cache_mode", default="use")
+
+# 숫자(부호/소수점/천 단위/퍼센트 포함), 글자 묶음, 또는 연산 기호
+_TOKEN = re.compile(r"[-+]?\d+(?:[.,]\d+)*%?|[^\W\d_]+|[*/×÷^=<>]", re.UNICODE)
+
+
+def normalize_prompt(text: str) -> str:
+    """
+    캐시 키용 프롬프트 정규화
+    - NFKC (전각 문자/호환 한글 자모 통일) + 소문자
+    - 공백, 문장부호 제거 ("CPI 가 뭐야?" == "cpi가 뭐야" == "CPI가 뭐야 ?!")
+    - 숫자의 부호/소수점/쉼표/% 와 숫자 사이 연산 기호는 유지 ("-1%" != "+1%", "1/2" != "1-2")
+    - 인접한 숫자 사이는 구분자로 분리
+    """
+    text = unicodedata.normalize("NFKC", text).lower()
+    parts = []
+    previous_numeric = False
+    for token in _TOKEN.findall(text):
+        numeric = token[0].isdigit()
+        if numeric and previous_numeric:
+            parts.append("|")
+        parts.append(token)
+        previous_numeric = numeric
+    return "".join(parts)
+
+
+def _normalize_value(value: Any) -> Any:
+    if isinstance(value, str):
+        return normalize_prompt(value)
+    if isinstance(value, dict):
+        return {str(name): _normalize_value(item) for name, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize_value(item) for item in value]
+    return value
+
+
+def make_key(endpoint: str, params: Dict[str, Any], model: Optional[str] = None) -> str:
+    """엔드포인트 + 모델 + 정규화한 파라미터의 해시"""
+    payload = orjson.dumps(
+        {"endpoint": endpoint, "model": model or settings.OPENAI_MODEL, "params": _normalize_value(params)},
+        option=orjson.OPT_SORT_KEYS,
+        default=str,
+    )
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def ttl_for(endpoint: str) -> int:
+    return settings.llm_cache_ttls.get(endpoint, settings.LLM_CACHE_DEFAULT_TTL)
+
+
+def mode_from_headers(headers: Dict[str, str]) -> str:
+    """요청 헤더 → 캐시 모드"""
+    explicit = headers.get("x-llm-cache", "").strip().lower()
+    if explicit in ("refresh", "bypass"):
+        return explicit
+    cache_control = headers.get("cache-control", "").lower()
+    if "no-store" in cache_control:
+        return "bypass"
+    if "no-cache" in cache_control:
+        return "refresh"
+    return "use"
+
+
+class LLMCache:
+    """프로세스 LRU + MongoDB TTL 컬렉션"""
+
+    def __init__(
+        self,
+        max_entries: int = settings.LLM_CACHE_MAX_ENTRIES,
+        enabled: bool = settings.LLM_CACHE_ENABLED,
+        database: Callable[[], Any] = get_database,
+    ):
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self._database = database
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    def _collection(self):
+        try:
+            return self._database()[COLLECTION]
+        except Exception:
+            return None  # MongoDB 미연결 시 메모리 캐시만 사용
+
+    def _remember(self, key: str, value: Any, expires_at: float) -> None:
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get(self, endpoint: str, key: str) -> Optional[Any]:
+        """저장된 JSON 값 (없거나 만료되면 None)"""
+        if not self.enabled or cache_mode.get() != "use":
+            if self.enabled:
+                metrics.incr(f"llm_cache.{endpoint}.bypass")
+            return None
+
+        now = time.time()
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] > now:
+                self._entries.move_to_end(key)
+                metrics.incr(f"llm_cache.{endpoint}.memory_hits")
+                return entry[1]
+            del self._entries[key]
+
+        collection = self._collection()
+        if collection is not None:
+            try:
+                doc = await asyncio.wait_for(
+                    collection.find_one({"_id": key, "expires_at": {"$gt": datetime.utcnow()}}),
+                    timeout=settings.LLM_CACHE_MONGO_TIMEOUT,
+                )
+            except Exception as e:
+                print(f"[WARNING] LLM cache lookup failed: {e}")
+                doc = None
+            if doc is not None:
+                expires_at = doc["expires_at"] - datetime.utcnow()
+                self._remember(key, doc["value"], now + expires_at.total_seconds())
+                metrics.incr(f"llm_cache.{endpoint}.mongo_hits")
+                return doc["value"]
+
+        metrics.incr(f"llm_cache.{endpoint}.misses")
+        return None
+
+    async def set(self, endpoint: str, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """JSON 값 저장 (bypass 모드면 생략)"""
+        if not self.enabled or cache_mode.get() == "bypass":
+            return
+        ttl = ttl or ttl_for(endpoint)
+        self._remember(key, value, time.time() + ttl)
+        metrics.incr(f"llm_cache.{endpoint}.stores")
+
+        collection = self._collection()
+        if collection is None:
+            return
+        now = datetime.utcnow()
+        try:
+            await asyncio.wait_for(
+                collection.replace_one(
+                    {"_id": key},
+                    {"endpoint": endpoint, "value": value, "created_at": now, "expires_at": now + timedelta(seconds=ttl)},
+                    upsert=True,
+                ),
+                timeout=settings.LLM_CACHE_MONGO_TIMEOUT,
+            )
+        except Exception as e:
+            print(f"[WARNING] LLM cache store failed: {e}")
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """엔드포인트별 적중률"""
+        counters = metrics.snapshot("llm_cache.")
+        endpoints = {name.split(".")[1] for name in counters}
+        result = {}
+        for endpoint in sorted(endpoints):
+            prefix = f"llm_cache.{endpoint}."
+            hits = counters.get(prefix + "memory_hits", 0) + counters.get(prefix + "mongo_hits", 0)
+            lookups = hits + counters.get(prefix + "misses", 0)
+            result[endpoint] = {
+                "hits": hits,
+                "lookups": lookups,
+                "hit_rate": round(hits / lookups, 4) if lookups else None,
+            }
+        return result
+
+
+async def ensure_indexes(db) -> None:
+    """만료 시각 TTL 인덱스 (MongoDB 가 만료 문서를 주기적으로 삭제)"""
+    await db[COLLECTION].create_index("expires_at", expireAfterSeconds=0)
+
+
+def llm_cached(
+    endpoint: str,
+    returns: Any,
+    cacheable: Callable[[Any], bool] = bool,
+    semantic: Optional[Callable[[Dict[str, Any]], Optional[str]]] = None,
+):
+    """
+    async LLM 호출 함수용 데코레이터
+    - 키: 함수 인자 전체 (기본값 포함) 를 정규화한 해시
+    - returns: 반환 타입 (JSON 으로 저장하고 같은 타입으로 복원)
+    - cacheable(result) 가 False 면 저장하지 않음 (빈 결과/대체 응답)
+    - semantic(인자) 가 질문 문자열을 반환하면 정확 일치 미스 후 의미 캐시도 조회/저장 (None 이면 대상 아님)
+    - wrapper.cache_lookup / cache_store 로 스트리밍 경로에서도 같은 항목 사용
+    """
+    adapter = TypeAdapter(returns)
+
+    def decorator(fn: Callable[..., Awaitable[Any]]):
+        signature = inspect.signature(fn)
+
+        def bind(args, kwargs) -> Dict[str, Any]:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            return dict(bound.arguments)
+
+        def semantic_question(arguments: Dict[str, Any]) -> Optional[str]:
+            if semantic is None or not (llm_cache.enabled and settings.SEMANTIC_CACHE_ENABLED):
+                return None
+            return semantic(arguments)
+
+        async def cache_lookup(*args, **kwargs) -> Optional[Any]:
+            arguments = bind(args, kwargs)
+            value = await llm_cache.get(endpoint, make_key(endpoint, arguments))
+            if value is None and cache_mode.get() == "use":
+                question = semantic_question(arguments)
+                if question:
+                    value = semantic_index(endpoint).lookup(question)
+            return None if value is None else adapter.validate_python(value)
+
+        async def cache_store(result: Any, *args, **kwargs) -> None:
+            if not cacheable(result) or cache_mode.get() == "bypass":
+                return
+            arguments = bind(args, kwargs)
+            value = adapter.dump_python(result, mode="json")
+            await llm_cache.set(endpoint, make_key(endpoint, arguments), value)
+            question = semantic_question(arguments)
+            if question:
+                semantic_index(endpoint).store(question, value, ttl_for(endpoint))
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            cached = await cache_lookup(*args, **kwargs)
+            if cached is not None:
+                return cached
+            result = await fn(*args, **kwargs)
+            await cache_store(result, *args, **kwargs)
+            return result
+
+        wrapper.cache_lookup = cache_lookup
+        wrapper.cache_store = cache_store
+        return wrapper
+    return decorator
+
+
+class LLMCacheControlMiddleware:
+    """요청 헤더의 캐시 우회 지시를 cache_mode 에 반영하는 ASGI 미들웨어"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        headers = {
+            key.decode("latin-1").lower(): value.decode("latin-1")
+            for key, value in scope.get("headers") or []
+        }
+        token = cache_mode.set(mode_from_headers(headers))
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            cache_mode.reset(token)
+
+
+# 프로세스 공유 캐시
+llm_cache = LLMCache()
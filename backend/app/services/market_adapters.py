@@ -1,80 +1,57 @@
 """시장 데이터 어댑터 (Mock)"""
-from datetime import datetime, timedelta
-from typing import List
-import random
-from app.models.common import KPIData, TrendsData, TimeSeriesPoint, NewsItem
+from typing import List, Optional
+from app.models.common import KPIData, TrendsData, TimeSeriesPoint, NewsItem, NewsResponse
+from app.services.series_store import store
+from app.services.derived import engine
+from app.services.snapshot import Snapshot, Version, data_version, snapshots
 
 
 def generate_mock_kpis() -> KPIData:
     """
-    주요 경제 지표 Mock 데이터
+    주요 경제 지표
+    - 최근 값은 저장소 시계열, 변화율은 파생 엔진 캐시에서 조회
     실제 환경에서는 FRED, ECOS, KRX API 등으로 교체
     """
+    def value(metric: str) -> float:
+        return engine.last_value(metric) or 0.0
+    
+    def change(metric: str, period: str, kind: str = None) -> float:
+        return engine.latest(metric, period, kind) or 0.0
+    
     return KPIData(
-        cpi=110.5,
-        cpi_change=2.3,
-        gdp_qoq=0.6,
-        gdp_yoy=2.2,
-        unemployment=3.4,
-        unemployment_change=-0.1,
-        base_rate=3.50,
-        base_rate_change=0.0,
-        usdkrw=1335.50,
-        usdkrw_change=5.20,
-        spx=4783.45,
-        spx_change=0.85,
-        kospi=2655.20,
-        kospi_change=1.12
+        cpi=value("CPI"),
+        cpi_change=change("CPI", "yoy"),
+        gdp_qoq=change("GDP", "qoq"),
+        gdp_yoy=change("GDP", "yoy"),
+        unemployment=value("UNEMPLOYMENT"),
+        unemployment_change=change("UNEMPLOYMENT", "mom"),
+        base_rate=value("POLICY_RATE"),
+        base_rate_change=change("POLICY_RATE", "mom"),
+        usdkrw=value("USD/KRW"),
+        usdkrw_change=change("USD/KRW", "1d"),
+        spx=value("SPX"),
+        spx_change=change("SPX", "1d"),
+        kospi=value("KOSPI"),
+        kospi_change=change("KOSPI", "1d")
     )
 
 
-def generate_mock_trends() -> TrendsData:
+def generate_mock_trends(months: int = 36) -> TrendsData:
     """
     시계열 트렌드 Mock 데이터
+    - 공유 시계열 저장소의 최근 구간을 그대로 사용 (GDP는 분기별)
     """
-    # 36개월 데이터
-    dates = []
-    now = datetime.now()
-    for i in range(36):
-        date = now - timedelta(days=30 * (35 - i))
-        dates.append(date.strftime("%Y-%m"))
-    
-    # CPI 시리즈 (상승 트렌드)
-    cpi_base = 100.0
-    cpi_series = []
-    for i, date in enumerate(dates):
-        value = cpi_base + (i * 0.3) + random.uniform(-0.5, 0.5)
-        cpi_series.append(TimeSeriesPoint(date=date, value=round(value, 2)))
-    
-    # 실업률 시리즈 (변동)
-    unemployment_series = []
-    for i, date in enumerate(dates):
-        value = 3.5 + random.uniform(-0.5, 0.5)
-        unemployment_series.append(TimeSeriesPoint(date=date, value=round(value, 2)))
-    
-    # 기준금리 시리즈 (단계적 변화)
-    rate_series = []
-    for i, date in enumerate(dates):
-        if i < 12:
-            value = 0.5
-        elif i < 24:
-            value = 1.25
-        else:
-            value = 3.5
-        rate_series.append(TimeSeriesPoint(date=date, value=value))
-    
-    # GDP 성장률 시리즈 (분기별)
-    gdp_series = []
-    for i in range(0, 36, 3):
-        if i < len(dates):
-            value = 2.0 + random.uniform(-1.0, 1.5)
-            gdp_series.append(TimeSeriesPoint(date=dates[i], value=round(value, 2)))
+    def recent(metric: str) -> List[TimeSeriesPoint]:
+        series = store.ensure(metric)
+        # 최근 months 개월 구간 (분기 시계열도 같은 기간으로 자름)
+        start = series.dates[-1].astype("datetime64[M]") - (months - 1) if len(series) else None
+        return [TimeSeriesPoint(**point) for point in store.to_points(metric, start)]
     
     return TrendsData(
-        cpi_series=cpi_series,
-        unemployment_series=unemployment_series,
-        rate_series=rate_series,
-        gdp_series=gdp_series
+        cpi_series=recent("CPI"),
+        unemployment_series=recent("UNEMPLOYMENT"),
+        rate_series=recent("POLICY_RATE"),
+        gdp_series=recent("GDP_YOY")
     )
 
 
@@ -128,3 +105,16 @@ def generate_mock_news() -> List[NewsItem]:
         )
     ]
 
+
+# ===== 스냅샷 =====
+# version 을 넘기면 (대시보드 배치처럼) 이미 계산한 데이터 버전을 재사용
+def kpis_snapshot(version: Optional[Version] = None) -> Snapshot:
+    return snapshots.get(("kpis",), version or data_version, generate_mock_kpis)
+
+
+def trends_snapshot(version: Optional[Version] = None) -> Snapshot:
+    return snapshots.get(("trends",), version or data_version, generate_mock_trends)
+
+
+def news_snapshot(version: Optional[Version] = None) -> Snapshot:
+    return snapshots.get(("news",), version or data_version, lambda: NewsResponse(items=generate_mock_news()))
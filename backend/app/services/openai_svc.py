@@ -1,13 +1,22 @@
 """OpenAI API 서비스"""
+import asyncio
 import json
-from typing import List, Dict, Any
-from openai import AsyncOpenAI
+import re
+from contextlib import aclosing
+from datetime import datetime
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
 from tenacity import retry, stop_after_attempt, wait_exponential
 from app.core.config import settings
+from app.core.clients import get_openai_client
+from app.core.singleflight import singleflight
 from app.core.security import sanitize_input, is_safe_prompt
+from app.services.llm_cache import llm_cached
 from app.models.common import ProblemItem, RecommendItem
+from app.services.json_stream import ArrayItemParser
+from app.services.resource_catalog import catalog
+from app.services import textsim
 
-client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+T = TypeVar("T")
 
 
 # ===== 시스템 프롬프트 =====
@@ -18,16 +27,12 @@ SYSTEM_PROMPT_BASE = """당신은 경제 전문가이자 교육자입니다.
 - 한국어로 명확하고 전문적인 톤을 유지합니다."""
 
 
-@retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
-async def generate_chat_response(
+def build_qa_messages(
     question: str,
     context: str = None,
     system_prompt: str = SYSTEM_PROMPT_BASE
-) -> str:
-    """
-    일반 Q&A 응답 생성
-    """
-    # 입력 검증
+) -> List[Dict[str, str]]:
+    """입력 검증 후 Q&A 메시지 구성 (안전하지 않은 입력은 ValueError)"""
     question = sanitize_input(question, max_length=2000)
     if not is_safe_prompt(question):
         raise ValueError("안전하지 않은 입력이 감지되었습니다.")
@@ -41,8 +46,13 @@ async def generate_chat_response(
         messages.append({"role": "user", "content": f"참고 자료:\n{context}"})
     
     messages.append({"role": "user", "content": question})
-    
-    response = await client.chat.completions.create(
+    return messages
+
+
+@retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
+async def _chat_completion(messages: List[Dict[str, str]]) -> str:
+    """단일 Q&A 완성 요청 (3회 재시도)"""
+    response = await get_openai_client().chat.completions.create(
         model=settings.OPENAI_MODEL,
         messages=messages,
         max_tokens=settings.OPENAI_MAX_TOKENS,
@@ -52,61 +62,195 @@ async def generate_chat_response(
     return response.choices[0].message.content
 
 
-async def generate_summary(question: str, context: str = None) -> Dict[str, Any]:
+def _plain_question(arguments: Dict[str, Any]) -> Optional[str]:
+    """참고 자료/시스템 프롬프트 없이 질문만 있는 호출 → 의미 캐시 대상 질문"""
+    if arguments.get("context") or arguments.get("system_prompt", SYSTEM_PROMPT_BASE) != SYSTEM_PROMPT_BASE:
+        return None
+    return arguments["question"]
+
+
+@llm_cached("qa_chat", str, semantic=_plain_question)
+@singleflight("qa_chat")
+async def generate_chat_response(
+    question: str,
+    context: str = None,
+    system_prompt: str = SYSTEM_PROMPT_BASE
+) -> str:
     """
-    요약 생성 (출처 포함)
+    일반 Q&A 응답 생성
     """
-    summary_prompt = SYSTEM_PROMPT_BASE + """
+    return await _chat_completion(build_qa_messages(question, context, system_prompt))
+
+
+SUMMARY_PROMPT = SYSTEM_PROMPT_BASE + """
     
 요청된 주제에 대해 핵심만 간결하게 요약하세요.
 - 주요 포인트를 불릿 리스트로 정리
 - 숫자나 통계가 있다면 명시
 - 가능하면 출처 표기 (예: [출처: 한국은행])
 """
-    
-    answer = await generate_chat_response(question, context, summary_prompt)
-    
-    # 간단한 출처 추출 (실제로는 더 정교한 로직 필요)
-    citations = []
-    if "[출처:" in answer or "(출처:" in answer:
-        citations = ["한국은행", "통계청", "금융감독원"]  # mock
+
+
+@llm_cached("qa_summary", str, semantic=_plain_question)
+@singleflight("qa_summary")
+async def generate_summary_answer(question: str, context: str = None) -> str:
+    """요약 본문 (마크다운)"""
+    return await _chat_completion(build_qa_messages(question, context, SUMMARY_PROMPT))
+
+
+async def generate_summary(question: str, context: str = None) -> Dict[str, Any]:
+    """
+    요약 생성 (출처 포함)
+    """
+    answer = await generate_summary_answer(question, context)
     
     return {
         "answer_md": answer,
-        "citations": citations
+        "citations": extract_citations(answer)
     }
 
 
-async def generate_problems(
-    level: str,
-    topic: str,
-    count: int,
-    style: str
-) -> List[ProblemItem]:
+# ===== 출처 추출 =====
+CITATION_PATTERN = re.compile(r"[\[(]\s*출처\s*:\s*([^\])\n]+?)\s*[\])]")
+# 닫히지 않은 표기가 이 길이를 넘으면 출처가 아닌 것으로 보고 버림
+CITATION_MAX_LENGTH = 120
+
+
+class CitationExtractor:
     """
-    경제 문제 생성
+    스트림 조각에서 [출처: ...] / (출처: ...) 표기를 점진적으로 추출
+    - 이미 확인한 텍스트는 다시 훑지 않고, 닫히지 않은 표기만 다음 조각까지 보관
+    - 쉼표로 나열된 출처는 각각, 중복은 처음 등장 순서로 한 번만
     """
-    level_map = {
-        "basic": "초급 (기본 개념)",
-        "intermediate": "중급 (실전 응용)",
-        "advanced": "고급 (심화 분석)"
-    }
-    
-    topic_map = {
-        "macro": "거시경제 (GDP, 인플레이션, 실업 등)",
-        "finance": "금융 (금리, 환율, 주식, 채권 등)",
-        "trade": "국제무역 (수출입, 환율, 관세 등)",
-        "stats": "경제통계 (지표 해석, 분석 방법)"
-    }
+
+    def __init__(self):
+        self._pending = ""
+        self.citations: List[str] = []
+
+    def feed(self, text: str) -> List[str]:
+        """새로 발견된 출처 목록"""
+        buffer = self._pending + text
+        found = []
+        end = 0
+        for match in CITATION_PATTERN.finditer(buffer):
+            for name in match.group(1).split(","):
+                name = name.strip()
+                if name and name not in self.citations:
+                    self.citations.append(name)
+                    found.append(name)
+            end = match.end()
+        rest = buffer[end:]
+        start = max(rest.rfind("["), rest.rfind("("))
+        self._pending = rest[start:] if start >= 0 and len(rest) - start <= CITATION_MAX_LENGTH else ""
+        return found
+
+
+def extract_citations(answer: str) -> List[str]:
+    extractor = CitationExtractor()
+    extractor.feed(answer)
+    return extractor.citations
+
+
+# ===== 스트리밍 =====
+STREAM_ATTEMPTS = 3
+STREAM_BACKOFF_MAX = 10  # 초
+
+
+async def stream_completion(
+    messages: List[Dict[str, str]],
+    max_tokens: int = None,
+    temperature: float = 0.7,
+    **options
+) -> AsyncIterator[str]:
+    """
+    OpenAI stream=True 텍스트 조각
+    - 첫 조각을 보내기 전 실패는 재시도 (generate_chat_response 와 같은 3회, 지수 백오프)
+    - 일부를 이미 보낸 뒤의 실패는 재시도하지 않고 전파 (중복/끊긴 문장 방지)
+    """
+    for attempt in range(1, STREAM_ATTEMPTS + 1):
+        started = False
+        try:
+            stream = await get_openai_client().chat.completions.create(
+                model=settings.OPENAI_MODEL,
+                messages=messages,
+                max_tokens=max_tokens or settings.OPENAI_MAX_TOKENS,
+                temperature=temperature,
+                stream=True,
+                **options
+            )
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    started = True
+                    yield chunk.choices[0].delta.content
+            return
+        except Exception as e:
+            if started or attempt == STREAM_ATTEMPTS:
+                raise
+            print(f"[WARNING] OpenAI stream failed before first token (attempt {attempt}): {e}")
+            await asyncio.sleep(min(2 ** attempt, STREAM_BACKOFF_MAX))
+
+
+async def stream_answer(
+    messages: List[Dict[str, str]],
+    cached: Callable[..., Awaitable[str]] = None,
+    cache_args: Tuple = ()
+) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Q&A 스트림 이벤트
+    - delta: 텍스트 조각
+    - citations: 본문에서 추출한 출처 (마지막에 한 번)
+    - done: 생성 시각, 캐시 적중 여부
+    - cached: 같은 질문의 비스트리밍 함수 (generate_chat_response / generate_summary_answer)
+      → 캐시 적중 시 저장된 답변을 한 번에 보내고, 미스면 완료 후 같은 항목에 저장
+    """
+    answer = await cached.cache_lookup(*cache_args) if cached else None
+    if answer is not None:
+        yield "delta", {"content": answer}
+        yield "citations", {"citations": extract_citations(answer)}
+        yield "done", {"created_at": datetime.utcnow(), "cached": True}
+        return
     
+    extractor = CitationExtractor()
+    parts = []
+    async for text in stream_completion(messages):
+        extractor.feed(text)
+        parts.append(text)
+        yield "delta", {"content": text}
+    yield "citations", {"citations": extractor.citations}
+    if cached:
+        await cached.cache_store("".join(parts), *cache_args)
+    yield "done", {"created_at": datetime.utcnow(), "cached": False}
+
+
+PROBLEM_LEVELS = {
+    "basic": "초급 (기본 개념)",
+    "intermediate": "중급 (실전 응용)",
+    "advanced": "고급 (심화 분석)"
+}
+
+PROBLEM_TOPICS = {
+    "macro": "거시경제 (GDP, 인플레이션, 실업 등)",
+    "finance": "금융 (금리, 환율, 주식, 채권 등)",
+    "trade": "국제무역 (수출입, 환율, 관세 등)",
+    "stats": "경제통계 (지표 해석, 분석 방법)"
+}
+
+
+def build_problem_prompt(
+    level: str,
+    topic: str,
+    count: int,
+    style: str,
+    part: Optional[Tuple[int, int]] = None
+) -> str:
     style_desc = "4지선다형 객관식" if style == "mcq" else "서술형"
     
-    prompt = f"""다음 조건에 맞는 경제 문제를 {count}개 생성하세요:
+    return f"""다음 조건에 맞는 경제 문제를 {count}개 생성하세요:
 
-- 난이도: {level_map.get(level, level)}
-- 주제: {topic_map.get(topic, topic)}
+- 난이도: {PROBLEM_LEVELS.get(level, level)}
+- 주제: {PROBLEM_TOPICS.get(topic, topic)}
 - 형식: {style_desc}
-
+{_part_hint(part)}
 각 문제는 다음 JSON 형식으로 작성:
 {{
   "question": "문제 내용",
@@ -115,142 +259,293 @@ async def generate_problems(
   "explain": "해설 (왜 그런지 설명)"
 }}
 
-전체를 JSON 배열로 반환하세요. 반드시 유효한 JSON 형식이어야 합니다."""
+{{"problems": [...]}} 형태의 JSON 으로 반환하세요. 반드시 유효한 JSON 형식이어야 합니다."""
+
+
+def to_problem(item: Dict[str, Any], style: str) -> ProblemItem:
+    return ProblemItem(
+        question=str(item.get("question", "")),
+        options=item.get("options") if style == "mcq" else None,
+        answer=str(item.get("answer", "")),
+        explain=str(item.get("explain", ""))
+    )
+
+
+def dummy_problems(topic: str, count: int, style: str) -> List[ProblemItem]:
+    """파싱 가능한 문제가 하나도 없을 때의 대체 데이터"""
+    return [
+        ProblemItem(
+            question=f"{topic} 관련 문제 {i+1}",
+            options=["1번", "2번", "3번", "4번"] if style == "mcq" else None,
+            answer="정답 예시",
+            explain="해설이 여기에 표시됩니다."
+        )
+        for i in range(count)
+    ]
+
+
+# ===== 대량 생성: 청크 분할 + 동시 요청 =====
+# 항목 수에 비례해 길어지는 한 번의 응답 대신, 청크별 요청을 동시에 보내고 합친 뒤 근사 중복 제거
+
+def split_count(count: int, chunk_size: int = None) -> List[int]:
+    """count 를 chunk_size 이하의 고른 크기로 분할 (예: 12, 5 → [4, 4, 4])"""
+    chunk_size = max(1, chunk_size or settings.GENERATION_CHUNK_SIZE)
+    chunks = max(1, -(-count // chunk_size))
+    return [count // chunks + (1 if i < count % chunks else 0) for i in range(chunks)]
+
+
+def _part_hint(part: Optional[Tuple[int, int]]) -> str:
+    """청크 요청끼리 내용이 겹치지 않도록 하는 안내 (단일 요청이면 빈 문자열)"""
+    if not part or part[1] <= 1:
+        return ""
+    index, total = part
+    return f"- 전체 {total}개 묶음 중 {index}번째 묶음입니다. 다른 묶음과 겹치지 않도록 서로 다른 세부 개념을 다루세요.\n"
+
+
+async def gather_chunks(
+    sizes: List[int],
+    make: Callable[[int, int], Awaitable[List[T]]],
+    concurrency: int = None,
+) -> List[List[T]]:
+    """
+    청크별 make(index, size) 를 최대 concurrency 개씩 동시에 실행, 청크 순서대로 반환
+    - 일부 청크 실패는 경고 후 제외, 모두 실패하면 첫 예외 전파
+    """
+    semaphore = asyncio.Semaphore(concurrency or settings.GENERATION_CONCURRENCY)
     
-    response = await client.chat.completions.create(
-        model=settings.OPENAI_MODEL,
-        messages=[
-            {"role": "system", "content": SYSTEM_PROMPT_BASE},
-            {"role": "user", "content": prompt}
-        ],
+    async def run(index: int, size: int) -> List[T]:
+        async with semaphore:
+            return await make(index, size)
+    
+    results = await asyncio.gather(*(run(i, size) for i, size in enumerate(sizes)), return_exceptions=True)
+    failures = [result for result in results if isinstance(result, BaseException)]
+    if failures and len(failures) == len(results):
+        raise failures[0]
+    for failure in failures:
+        print(f"[WARNING] Generation chunk failed: {failure}")
+    return [result for result in results if not isinstance(result, BaseException)]
+
+
+async def merge_streams(streams: List[AsyncIterator[T]], concurrency: int = None) -> AsyncIterator[T]:
+    """
+    여러 스트림을 최대 concurrency 개씩 동시에 소비하며 도착 순서대로 합침
+    - 일부 스트림 실패는 경고 후 무시, 모두 실패하면 첫 예외 전파
+    """
+    if len(streams) == 1:
+        async with aclosing(streams[0]):
+            async for item in streams[0]:
+                yield item
+        return
+    
+    semaphore = asyncio.Semaphore(concurrency or settings.GENERATION_CONCURRENCY)
+    queue: asyncio.Queue = asyncio.Queue()
+    finished = object()
+    errors: List[BaseException] = []
+    
+    async def pump(stream: AsyncIterator[T]) -> None:
+        try:
+            async with semaphore, aclosing(stream):
+                async for item in stream:
+                    await queue.put(item)
+        except Exception as e:
+            print(f"[WARNING] Generation chunk failed: {e}")
+            errors.append(e)
+        finally:
+            await queue.put(finished)
+    
+    tasks = [asyncio.create_task(pump(stream)) for stream in streams]
+    try:
+        remaining = len(tasks)
+        while remaining:
+            item = await queue.get()
+            if item is finished:
+                remaining -= 1
+                continue
+            yield item
+        if len(errors) == len(streams):
+            raise errors[0]
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def _stream_problem_chunk(
+    level: str,
+    topic: str,
+    count: int,
+    style: str,
+    part: Optional[Tuple[int, int]] = None
+) -> AsyncIterator[ProblemItem]:
+    """
+    단일 요청 문제 스트림
+    - 토큰 스트림을 증분 파싱해 배열 원소 객체가 닫히는 즉시 ProblemItem 으로 반환
+    """
+    messages = [
+        {"role": "system", "content": SYSTEM_PROMPT_BASE},
+        {"role": "user", "content": build_problem_prompt(level, topic, count, style, part)}
+    ]
+    parser = ArrayItemParser()
+    produced = 0
+    texts = stream_completion(
+        messages,
         max_tokens=3000,
         temperature=0.8,
         response_format={"type": "json_object"}
     )
+    # 필요한 개수를 채우면 남은 토큰은 받지 않고 스트림을 닫음
+    async with aclosing(texts):
+        async for text in texts:
+            for item in parser.feed(text):
+                if not isinstance(item, dict) or produced >= count:
+                    continue
+                produced += 1
+                yield to_problem(item, style)
+            if parser.done or produced >= count:
+                break
+
+
+async def stream_problems(
+    level: str,
+    topic: str,
+    count: int,
+    style: str
+) -> AsyncIterator[ProblemItem]:
+    """
+    경제 문제 스트리밍 생성
+    - 청크 크기를 넘으면 청크별 요청을 동시에 보내고, 완성되는 순서대로 반환
+    - 이미 보낸 문제와 근사 중복이면 건너뜀
+    - 꼬리가 깨지면 마지막 문제만 잃고, 하나도 못 얻으면 더미 데이터
+    """
+    sizes = split_count(count)
+    merged = merge_streams([
+        _stream_problem_chunk(level, topic, size, style, (i + 1, len(sizes)))
+        for i, size in enumerate(sizes)
+    ])
+    seen = []
+    async with aclosing(merged):
+        async for problem in merged:
+            signature = textsim.shingles(problem.question)
+            if any(textsim.jaccard(signature, other) >= settings.GENERATION_DEDUPE_THRESHOLD for other in seen):
+                continue
+            seen.append(signature)
+            yield problem
+            if len(seen) >= count:
+                break
     
-    content = response.choices[0].message.content
+    if not seen:
+        for problem in dummy_problems(topic, count, style):
+            yield problem
+
+
+async def generate_unique_problems(
+    level: str,
+    topic: str,
+    count: int,
+    style: str
+) -> List[ProblemItem]:
+    """
+    청크별 동시 요청 → 청크 순서대로 합치고 근사 중복 제거 (순서 고정)
+    - 더미 대체 없음 (파싱 가능한 문제가 없으면 빈 목록, 문제 은행 보충용)
+    """
+    sizes = split_count(count)
     
-    try:
-        # JSON 파싱
-        data = json.loads(content)
-        
-        # 배열 추출 (키가 다를 수 있음)
-        if isinstance(data, list):
-            items_data = data
-        elif "problems" in data:
-            items_data = data["problems"]
-        elif "items" in data:
-            items_data = data["items"]
-        else:
-            # 첫 번째 배열 찾기
-            items_data = next((v for v in data.values() if isinstance(v, list)), [])
-        
-        problems = []
-        for item in items_data[:count]:
-            problems.append(ProblemItem(
-                question=item.get("question", ""),
-                options=item.get("options") if style == "mcq" else None,
-                answer=item.get("answer", ""),
-                explain=item.get("explain", "")
-            ))
-        
-        return problems
+    async def make(index: int, size: int) -> List[ProblemItem]:
+        chunk = _stream_problem_chunk(level, topic, size, style, (index + 1, len(sizes)))
+        return [problem async for problem in chunk]
     
-    except json.JSONDecodeError:
-        # JSON 파싱 실패 시 더미 데이터 반환
-        return [
-            ProblemItem(
-                question=f"{topic} 관련 문제 {i+1}",
-                options=["1번", "2번", "3번", "4번"] if style == "mcq" else None,
-                answer="정답 예시",
-                explain="해설이 여기에 표시됩니다."
-            )
-            for i in range(count)
-        ]
+    chunks = await gather_chunks(sizes, make)
+    problems = textsim.dedupe(
+        (problem for chunk in chunks for problem in chunk),
+        key=lambda problem: problem.question,
+        threshold=settings.GENERATION_DEDUPE_THRESHOLD,
+    )
+    return problems[:count]
 
 
-async def generate_recommendations(
-    topic: str,
+async def generate_problems(
     level: str,
-    purpose: str
-) -> List[RecommendItem]:
+    topic: str,
+    count: int,
+    style: str
+) -> List[ProblemItem]:
     """
-    경제 자료 추천
+    경제 문제 생성 (하나도 얻지 못하면 더미 데이터)
     """
-    purpose_map = {
-        "report": "리포트 작성용 (통계, 보고서)",
-        "study": "학습용 (교재, 강의)",
-        "data": "데이터 분석용 (CSV, 데이터셋)",
-        "api": "API 연동용 (오픈 API)"
-    }
-    
-    prompt = f"""다음 조건에 맞는 경제 자료/리소스를 6개 추천하세요:
+    return await generate_unique_problems(level, topic, count, style) or dummy_problems(topic, count, style)
+
+
+RECOMMEND_PURPOSES = {
+    "report": "리포트 작성용 (통계, 보고서)",
+    "study": "학습용 (교재, 강의)",
+    "data": "데이터 분석용 (CSV, 데이터셋)",
+    "api": "API 연동용 (오픈 API)"
+}
+
+RECOMMEND_LEVELS = {
+    "beginner": "입문",
+    "intermediate": "중급",
+    "advanced": "고급"
+}
+
+
+@llm_cached("recommend", List[int])
+async def _rerank_recommendations(
+    topic: str,
+    level: str,
+    purpose: str,
+    candidates: List[str]
+) -> List[int]:
+    """후보 자료 (제목 - 요약) 를 조건에 맞는 순서로 재정렬한 번호 목록"""
+    numbered = "\n".join(f"{i}. {candidate}" for i, candidate in enumerate(candidates))
+    prompt = f"""다음 경제 자료 후보를 조건에 가장 알맞은 순서로 정렬하세요:
 
 - 주제: {topic}
-- 수준: {level}
-- 목적: {purpose_map.get(purpose, purpose)}
+- 수준: {RECOMMEND_LEVELS.get(level, level)}
+- 목적: {RECOMMEND_PURPOSES.get(purpose, purpose)}
 
-각 추천은 다음 JSON 형식:
-{{
-  "title": "자료명",
-  "summary": "2-3줄 설명",
-  "url": "링크 (실제 존재하는 공식 사이트)",
-  "tags": ["무료", "공식", "데이터", "API" 등]
-}}
+후보:
+{numbered}
 
-전체를 JSON 배열로 반환. 반드시 유효한 JSON."""
+{{"order": [후보 번호, ...]}} 형태의 JSON 으로 반환하세요. 반드시 유효한 JSON 형식이어야 합니다."""
     
-    response = await client.chat.completions.create(
+    response = await get_openai_client().chat.completions.create(
         model=settings.OPENAI_MODEL,
         messages=[
             {"role": "system", "content": SYSTEM_PROMPT_BASE},
             {"role": "user", "content": prompt}
         ],
-        max_tokens=2000,
-        temperature=0.7,
+        max_tokens=200,
+        temperature=0,
         response_format={"type": "json_object"}
     )
     
-    content = response.choices[0].message.content
+    order = json.loads(response.choices[0].message.content).get("order", [])
+    return [i for i in dict.fromkeys(order) if isinstance(i, int) and 0 <= i < len(candidates)]
+
+
+async def generate_recommendations(
+    topic: str,
+    level: str,
+    purpose: str,
+    count: int = 6
+) -> List[RecommendItem]:
+    """
+    경제 자료 추천
+    - 로컬 카탈로그 BM25 순위 (LLM 호출 없음, 결정적)
+    - RECOMMEND_LLM_RERANK 사용 시 상위 후보만 LLM 으로 재정렬 (실패하면 BM25 순서 유지)
+    """
+    if not (settings.RECOMMEND_LLM_RERANK and settings.OPENAI_API_KEY):
+        return catalog.search(topic, level, purpose, count)
     
+    candidates = catalog.search(topic, level, purpose, max(count, settings.RECOMMEND_RERANK_CANDIDATES))
     try:
-        data = json.loads(content)
-        
-        # 배열 추출
-        if isinstance(data, list):
-            items_data = data
-        elif "recommendations" in data:
-            items_data = data["recommendations"]
-        elif "items" in data:
-            items_data = data["items"]
-        else:
-            items_data = next((v for v in data.values() if isinstance(v, list)), [])
-        
-        recommendations = []
-        for item in items_data[:6]:
-            recommendations.append(RecommendItem(
-                title=item.get("title", ""),
-                summary=item.get("summary", ""),
-                url=item.get("url", "https://example.com"),
-                tags=item.get("tags", [])
-            ))
-        
-        return recommendations
-    
-    except json.JSONDecodeError:
-        # 기본 추천 데이터
-        return [
-            RecommendItem(
-                title="한국은행 경제통계시스템",
-                summary="국내 주요 경제지표와 통계 데이터를 제공하는 공식 시스템",
-                url="https://ecos.bok.or.kr",
-                tags=["무료", "공식", "데이터", "API"]
-            ),
-            RecommendItem(
-                title="통계청 KOSIS",
-                summary="국가통계포털, 국내 모든 공식 통계 제공",
-                url="https://kosis.kr",
-                tags=["무료", "공식", "데이터"]
-            )
-        ]
-
+        order = await _rerank_recommendations(
+            topic, level, purpose, [f"{item.title} - {item.summary}" for item in candidates]
+        )
+    except Exception as e:
+        print(f"[WARNING] Recommendation rerank failed: {e}")
+        order = []
+    chosen = set(order)
+    ranked = [candidates[i] for i in order]
+    ranked += [item for i, item in enumerate(candidates) if i not in chosen]
+    return ranked[:count]
@@ -0,0 +1,242 @@
+"""경제 문제 은행 (사전 생성 + 백그라운드 보충)
+
+문제 생성은 가장 느린 엔드포인트라, (난이도, 주제, 형식) 버킷별로 미리 만들어 둔 문제를
+MongoDB problem_bank 컬렉션에서 바로 꺼내 줍니다.
+- 출제: 적게 출제된 순 → 오래전에 출제된 순으로 한 문제씩 find_one_and_update 로 선점하며 출제 횟수/시각 갱신
+  (동시 요청도 서로 다른 문제를 받아 같은 문제 반복 최소화)
+- 교체: PROBLEM_BANK_MAX_SERVES 번 출제된 문제는 폐기
+- 보충: 백그라운드 작업이 버킷 문제 수가 PROBLEM_BANK_LOW_WATERMARK 미만이면 PROBLEM_BANK_TARGET 까지 생성
+  (한 번에 가장 부족한 PROBLEM_BANK_REFILL_BUCKETS 개 버킷만, 나머지는 다음 주기)
+- 중복: 정규화한 질문 해시를 _id 로 쓰고, 버킷 내 근사 중복 (textsim) 은 저장하지 않음
+- 은행이 꺼져 있거나 (PROBLEM_BANK_ENABLED) 시작 시 인덱스 준비에 실패했거나,
+  MongoDB/OpenAI 가 없거나 출제가 PROBLEM_BANK_MONGO_TIMEOUT 안에 끝나지 않으면
+  은행은 비어 있는 것으로 보고 호출자가 즉시 생성으로 대체
+"""
+import asyncio
+import hashlib
+import random
+from datetime import datetime
+from itertools import product
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from pymongo import ASCENDING, ReturnDocument
+from pymongo.errors import DuplicateKeyError
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.db.mongo import get_database
+from app.models.common import ProblemItem
+from app.services import textsim
+from app.services.openai_svc import PROBLEM_LEVELS, PROBLEM_TOPICS, generate_unique_problems
+
+
+COLLECTION = "problem_bank"
+PROBLEM_STYLES = ("mcq", "free")
+
+
+def bucket_key(level: str, topic: str, style: str) -> str:
+    return f"{level}:{topic}:{style}"
+
+
+def all_buckets() -> List[Tuple[str, str, str]]:
+    return list(product(PROBLEM_LEVELS, PROBLEM_TOPICS, PROBLEM_STYLES))
+
+
+def problem_id(problem: ProblemItem) -> str:
+    """정규화한 질문 해시 (공백/문장부호만 다른 같은 문제는 같은 ID)"""
+    return hashlib.blake2b(textsim.normalize(problem.question).encode(), digest_size=12).hexdigest()
+
+
+class ProblemBank:
+    """MongoDB 문제 은행"""
+
+    def __init__(self, database: Callable[[], Any] = get_database):
+        self._database = database
+        # ensure_indexes 가 성공해야 출제 (시작 시 준비되지 않은 은행은 조회하지 않음)
+        self.ready = False
+
+    def _collection(self):
+        try:
+            return self._database()[COLLECTION]
+        except Exception:
+            return None
+
+    async def ensure_indexes(self) -> None:
+        collection = self._collection()
+        if collection is not None:
+            await collection.create_index([("bucket", ASCENDING), ("served", ASCENDING), ("last_served_at", ASCENDING)])
+            self.ready = True
+
+    async def draw(self, level: str, topic: str, style: str, count: int) -> List[ProblemItem]:
+        """버킷에서 최대 count 개 출제 (부족하면 있는 만큼, 은행이 꺼져 있거나 MongoDB 가 없거나 응답이 늦으면 빈 목록)"""
+        if not settings.PROBLEM_BANK_ENABLED or not self.ready or count <= 0:
+            return []
+        collection = self._collection()
+        if collection is None:
+            return []
+        docs: List[Dict[str, Any]] = []
+        failed = False
+        try:
+            await asyncio.wait_for(
+                self._claim(collection, bucket_key(level, topic, style), count, docs),
+                timeout=settings.PROBLEM_BANK_MONGO_TIMEOUT,
+            )
+        except Exception as e:
+            # MongoDB 장애/지연 시 요청을 막지 않음 (이미 선점한 문제만 출제, 나머지는 즉시 생성)
+            print(f"[WARNING] Problem bank draw failed: {e!r}")
+            metrics.incr("problem_bank.errors")
+            failed = True
+        metrics.incr("problem_bank.served", len(docs))
+        metrics.incr("problem_bank.shortfall", count - len(docs))
+        if len(docs) < count and not failed:
+            refill_worker.wake()
+
+        problems = [
+            ProblemItem(question=doc["question"], options=doc.get("options"), answer=doc["answer"], explain=doc["explain"])
+            for doc in docs
+        ]
+        # 출제 순서가 매번 같지 않도록
+        random.shuffle(problems)
+        return problems
+
+    async def _claim(self, collection, bucket: str, count: int, docs: List[Dict[str, Any]]) -> None:
+        """한 문제씩 원자적으로 선점 (출제 횟수 증가와 동시에 꺼내므로 동시 요청끼리 겹치지 않음)"""
+        now = datetime.utcnow()
+        while len(docs) < count:
+            doc = await collection.find_one_and_update(
+                {
+                    "bucket": bucket,
+                    "served": {"$lt": settings.PROBLEM_BANK_MAX_SERVES},
+                    "_id": {"$nin": [claimed["_id"] for claimed in docs]},
+                },
+                {"$inc": {"served": 1}, "$set": {"last_served_at": now}},
+                sort=[("served", ASCENDING), ("last_served_at", ASCENDING)],
+                return_document=ReturnDocument.AFTER,
+            )
+            if doc is None:
+                break
+            docs.append(doc)
+
+    async def add(self, level: str, topic: str, style: str, problems: List[ProblemItem]) -> int:
+        """버킷에 저장 (기존 문제/서로 간 근사 중복 제외), 저장한 개수"""
+        collection = self._collection()
+        if collection is None:
+            return 0
+        bucket = bucket_key(level, topic, style)
+        existing = await collection.find({"bucket": bucket}, {"question": 1}).to_list(None)
+        seen = [textsim.shingles(doc["question"]) for doc in existing]
+
+        added = 0
+        now = datetime.utcnow()
+        for problem in problems:
+            signature = textsim.shingles(problem.question)
+            if not problem.question or any(
+                textsim.jaccard(signature, other) >= settings.GENERATION_DEDUPE_THRESHOLD for other in seen
+            ):
+                metrics.incr("problem_bank.duplicates")
+                continue
+            try:
+                await collection.insert_one({
+                    "_id": problem_id(problem),
+                    "bucket": bucket,
+                    **problem.model_dump(),
+                    "served": 0,
+                    "last_served_at": None,
+                    "created_at": now,
+                })
+            except DuplicateKeyError:
+                metrics.incr("problem_bank.duplicates")
+                continue
+            seen.append(signature)
+            added += 1
+        metrics.incr("problem_bank.added", added)
+        return added
+
+    async def size(self, level: str, topic: str, style: str) -> int:
+        collection = self._collection()
+        if collection is None:
+            return 0
+        return await collection.count_documents({
+            "bucket": bucket_key(level, topic, style),
+            "served": {"$lt": settings.PROBLEM_BANK_MAX_SERVES},
+        })
+
+    async def retire(self) -> int:
+        """출제 한도에 도달한 문제 폐기"""
+        collection = self._collection()
+        if collection is None:
+            return 0
+        result = await collection.delete_many({"served": {"$gte": settings.PROBLEM_BANK_MAX_SERVES}})
+        metrics.incr("problem_bank.retired", result.deleted_count)
+        return result.deleted_count
+
+    async def refill(self, buckets: Optional[List[Tuple[str, str, str]]] = None) -> Dict[str, int]:
+        """
+        워터마크 미만 버킷을 목표 개수까지 생성 (버킷별 추가 개수)
+        - 한 번에 가장 부족한 PROBLEM_BANK_REFILL_BUCKETS 개 버킷만 생성 (나머지는 다음 주기)
+        """
+        if self._collection() is None:
+            return {}
+        await self.retire()
+        low = []
+        for bucket in buckets or all_buckets():
+            size = await self.size(*bucket)
+            if size < settings.PROBLEM_BANK_LOW_WATERMARK:
+                low.append((size, bucket))
+        low.sort(key=lambda item: item[0])
+        limit = max(1, settings.PROBLEM_BANK_REFILL_BUCKETS)
+        metrics.incr("problem_bank.refill_deferred", max(0, len(low) - limit))
+
+        added = {}
+        for size, (level, topic, style) in low[:limit]:
+            try:
+                problems = await generate_unique_problems(level, topic, settings.PROBLEM_BANK_TARGET - size, style)
+            except Exception as e:
+                print(f"[WARNING] Problem bank refill failed ({bucket_key(level, topic, style)}): {e}")
+                continue
+            added[bucket_key(level, topic, style)] = await self.add(level, topic, style, problems)
+        return added
+
+
+class RefillWorker:
+    """주기적으로 (또는 출제 부족 시 즉시) 문제 은행을 보충하는 백그라운드 작업"""
+
+    def __init__(self, bank: ProblemBank):
+        self.bank = bank
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup = asyncio.Event()
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+
+    def wake(self) -> None:
+        if self._task is not None and not self._task.done():
+            self._wakeup.set()
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            self._wakeup.clear()
+            try:
+                added = await self.bank.refill()
+                if added:
+                    print(f"[OK] Problem Bank Refilled: {sum(added.values())} problems in {len(added)} buckets")
+            except Exception as e:
+                print(f"[WARNING] Problem bank refill failed: {e}")
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=settings.PROBLEM_BANK_REFILL_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+
+
+# 프로세스 공유 인스턴스
+problem_bank = ProblemBank()
+refill_worker = RefillWorker(problem_bank)
@@ -0,0 +1,266 @@
+"""템플릿 기반 계산 문제 (LLM 미사용)
+
+금리차, 실질금리, 전년 대비 변화율처럼 숫자로 답이 정해지는 객관식 문제는
+시계열 저장소의 실제 값으로 템플릿을 채우고 정답을 직접 계산합니다.
+- 오답 보기는 흔한 실수로 만든 값 (부호 반대, 기준 시점 혼동, 단위 착오, 근원/헤드라인 혼동 등)
+- 기준 시점은 최근 관측치 중에서 무작위로 골라 같은 템플릿이라도 문제가 달라짐
+- 생성은 마이크로초 단위이며 정답은 항상 계산 결과와 일치
+/problems 는 객관식 요청의 PROBLEM_TEMPLATE_SHARE 비율을 여기서 채우고 나머지만 문제 은행/LLM 으로 보냅니다.
+"""
+import random
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import numpy as np
+from app.core.config import settings
+from app.models.common import ProblemItem
+from app.services.series_store import SeriesStore, store as default_store
+
+
+# 기준 시점을 고르는 최근 관측치 범위 (주기별 관측치 수, 일별은 약 3개월 / 그 밖에는 약 2년)
+RECENT_OBSERVATIONS = {"D": 60, "M": 24, "Q": 8, "A": 2}
+OPTION_COUNT = 4
+
+
+def _observation(store: SeriesStore, metric: str, rng: random.Random, lag: int = 0, ndigits: int = 2):
+    """
+    최근 관측치 (주기별 RECENT_OBSERVATIONS 개) 중 무작위 시점 i 의 (라벨, 값) 목록 [i, i-1, ..., i-lag]
+    - 값은 문제에 표시하는 자릿수로 반올림 (정답도 표시된 값으로 계산)
+    """
+    series = store.ensure(metric)
+    recent = RECENT_OBSERVATIONS.get(series.freq, RECENT_OBSERVATIONS["M"])
+    last = len(series) - 1
+    i = rng.randint(max(lag, last - recent + 1), last)
+    picks = [i - k for k in range(lag + 1)]
+    labels = series.labels(series.dates[picks])
+    return [(label, round(float(series.values[j]), ndigits)) for label, j in zip(labels, picks)]
+
+
+def _value_at(store: SeriesStore, metric: str, label: str, ndigits: int = 2) -> float:
+    """라벨 시점 (또는 그 이전 가장 가까운 시점) 의 값"""
+    series = store.ensure(metric)
+    i = int(np.searchsorted(series.dates, np.datetime64(label, "D"), side="right")) - 1
+    return round(float(series.values[max(i, 0)]), ndigits)
+
+
+def _options(
+    answer: float,
+    distractors: List[float],
+    fmt: Callable[[float], str],
+    step: float,
+    rng: random.Random,
+) -> Tuple[List[str], str]:
+    """정답 + 서로 다른 오답 3개를 섞은 보기 (표기가 겹치면 정답 ± step 으로 보충)"""
+    correct = fmt(answer)
+    options = [correct]
+    for value in distractors:
+        text = fmt(value)
+        if text not in options:
+            options.append(text)
+    k = 1
+    while len(options) < OPTION_COUNT:
+        for value in (answer + step * k, answer - step * k):
+            text = fmt(value)
+            if text not in options and len(options) < OPTION_COUNT:
+                options.append(text)
+        k += 1
+    options = options[:OPTION_COUNT]
+    rng.shuffle(options)
+    return options, correct
+
+
+def _pct(value: float) -> str:
+    return f"{value:.1f}%"
+
+
+def _pp(value: float) -> str:
+    return f"{value:.2f}%p"
+
+
+def _num(value: float) -> str:
+    return f"{value:.2f}"
+
+
+def _bp(value: float) -> str:
+    return f"{value:.0f}bp"
+
+
+def _change_rate(
+    store: SeriesStore,
+    rng: random.Random,
+    metric: str,
+    name: str,
+    unit: str,
+    lag: int,
+    period: str,
+) -> ProblemItem:
+    """전년 동기 대비 변화율"""
+    points = _observation(store, metric, rng, lag, ndigits=1)
+    (label, now), (previous_label, previous) = points[0], points[lag]
+    before = points[1][1]
+    answer = (now / previous - 1) * 100
+    options, correct = _options(
+        answer,
+        [
+            now - previous,  # 변화량을 변화율로 착각
+            (now - previous) / now * 100,  # 기준 시점 혼동 (비교 시점을 분모로)
+            (now / before - 1) * 100,  # 직전 기간 대비로 계산
+        ],
+        _pct,
+        0.1,
+        rng,
+    )
+    return ProblemItem(
+        question=(
+            f"{name}: {previous_label} {previous:,.1f}{unit} → {label} {now:,.1f}{unit}. "
+            f"{period} 대비 변화율은? (소수점 둘째 자리에서 반올림)"
+        ),
+        options=options,
+        answer=correct,
+        explain=(
+            f"변화율 = (현재 ÷ 비교 시점 - 1) × 100 = ({now:,.1f} ÷ {previous:,.1f} - 1) × 100 ≈ {correct}. "
+            f"분모는 비교 시점({previous_label}) 값이며, 단순 차이({now - previous:,.1f}{unit})는 변화량입니다."
+        ),
+    )
+
+
+def cpi_yoy(store: SeriesStore, rng: random.Random) -> ProblemItem:
+    return _change_rate(store, rng, "CPI", "소비자물가지수", "", 12, "전년 동월")
+
+
+def core_cpi_yoy(store: SeriesStore, rng: random.Random) -> ProblemItem:
+    return _change_rate(store, rng, "CORE_CPI", "근원물가지수", "", 12, "전년 동월")
+
+
+def gdp_yoy(store: SeriesStore, rng: random.Random) -> ProblemItem:
+    return _change_rate(store, rng, "GDP", "실질 GDP", "조원", 4, "전년 동기")
+
+
+def usdkrw_yoy(store: SeriesStore, rng: random.Random) -> ProblemItem:
+    return _change_rate(store, rng, "USD_KRW", "원/달러 월평균 환율", "원", 12, "전년 동월")
+
+
+def real_rate(store: SeriesStore, rng: random.Random) -> ProblemItem:
+    """피셔 근사 실질금리 = 명목금리 - 물가상승률"""
+    (label, rate), = _observation(store, "POLICY_RATE", rng)
+    inflation = _value_at(store, "CPI_YOY", label)
+    core = _value_at(store, "CORE_CPI_YOY", label)
+    answer = rate - inflation
+    options, correct = _options(
+        answer,
+        [rate + inflation, inflation - rate, rate - core],  # 더함 / 부호 반대 / 근원물가 사용
+        _pp,
+        0.25,
+        rng,
+    )
+    return ProblemItem(
+        question=(
+            f"{label} 기준금리는 {rate:.2f}%, 소비자물가 상승률(전년 동월 대비)은 {inflation:.2f}%, "
+            f"근원물가 상승률은 {core:.2f}% 입니다. 피셔 방정식으로 근사한 실질 기준금리는?"
+        ),
+        options=options,
+        answer=correct,
+        explain=(
+            f"실질금리 ≈ 명목금리 - 물가상승률 = {rate:.2f} - {inflation:.2f} = {correct}. "
+            "헤드라인 물가를 쓰며, 음수이면 실질적으로 완화적인 금리 수준입니다."
+        ),
+    )
+
+
+def yield_spread(store: SeriesStore, rng: random.Random) -> ProblemItem:
+    """장단기 금리차 (국고채 10년 - 3년)"""
+    (label, long_rate), = _observation(store, "KR10YT", rng)
+    short_rate = _value_at(store, "KR3YT", label)
+    answer = (long_rate - short_rate) * 100
+    options, correct = _options(
+        answer,
+        [-answer, answer / 10, (long_rate + short_rate) * 100],  # 순서 반대 / 단위 착오 / 더함
+        _bp,
+        5,
+        rng,
+    )
+    return ProblemItem(
+        question=(
+            f"{label} 국고채 10년물 금리는 {long_rate:.2f}%, 3년물 금리는 {short_rate:.2f}% 입니다. "
+            "장단기 금리차(10년 - 3년)는 몇 bp 입니까?"
+        ),
+        options=options,
+        answer=correct,
+        explain=(
+            f"금리차 = ({long_rate:.2f} - {short_rate:.2f})%p × 100 = {correct} (1%p = 100bp). "
+            "음수이면 장단기 금리 역전으로, 경기 둔화 신호로 해석되곤 합니다."
+        ),
+    )
+
+
+def misery_index(store: SeriesStore, rng: random.Random) -> ProblemItem:
+    """경제고통지수 = 물가상승률 + 실업률"""
+    (label, inflation), = _observation(store, "CPI_YOY", rng)
+    unemployment = _value_at(store, "UNEMPLOYMENT", label)
+    answer = inflation + unemployment
+    options, correct = _options(
+        answer,
+        [abs(inflation - unemployment), inflation * unemployment, unemployment],
+        _num,
+        0.5,
+        rng,
+    )
+    return ProblemItem(
+        question=(
+            f"{label} 소비자물가 상승률은 {inflation:.2f}%, 실업률은 {unemployment:.2f}% 입니다. "
+            "오쿤이 고안한 경제고통지수는?"
+        ),
+        options=options,
+        answer=correct,
+        explain=(
+            f"경제고통지수 = 물가상승률 + 실업률 = {inflation:.2f} + {unemployment:.2f} = {correct}. "
+            "두 비율을 더한 지수이므로 단위 없이 읽습니다."
+        ),
+    )
+
+
+# 템플릿: (생성 함수, 주제, 난이도)
+TEMPLATES: List[Dict[str, Any]] = [
+    {"build": cpi_yoy, "topics": ("stats", "macro"), "levels": ("basic", "intermediate")},
+    {"build": core_cpi_yoy, "topics": ("stats",), "levels": ("intermediate", "advanced")},
+    {"build": gdp_yoy, "topics": ("stats", "macro"), "levels": ("basic", "intermediate")},
+    {"build": usdkrw_yoy, "topics": ("trade", "finance"), "levels": ("basic", "intermediate")},
+    {"build": real_rate, "topics": ("finance", "macro"), "levels": ("intermediate", "advanced")},
+    {"build": yield_spread, "topics": ("finance",), "levels": ("intermediate", "advanced")},
+    {"build": misery_index, "topics": ("macro", "stats"), "levels": ("basic",)},
+]
+
+
+def templates_for(level: str, topic: str) -> List[Callable[[SeriesStore, random.Random], ProblemItem]]:
+    return [t["build"] for t in TEMPLATES if topic in t["topics"] and level in t["levels"]]
+
+
+def template_count(count: int, style: str, share: Optional[float] = None) -> int:
+    """요청 count 중 템플릿으로 채울 개수 (객관식만)"""
+    if style != "mcq":
+        return 0
+    share = settings.PROBLEM_TEMPLATE_SHARE if share is None else share
+    return int(count * min(max(share, 0.0), 1.0))
+
+
+def generate_template_problems(
+    level: str,
+    topic: str,
+    count: int,
+    rng: Optional[random.Random] = None,
+    store: SeriesStore = default_store,
+) -> List[ProblemItem]:
+    """(난이도, 주제) 에 맞는 템플릿 문제 최대 count 개 (같은 질문 제외, 템플릿이 없으면 빈 목록)"""
+    builders = templates_for(level, topic)
+    if not builders or count <= 0:
+        return []
+    rng = rng or random.Random()
+    problems: List[ProblemItem] = []
+    seen = set()
+    for _ in range(count * 4):
+        problem = rng.choice(builders)(store, rng)
+        if problem.question in seen:
+            continue
+        seen.add(problem.question)
+        problems.append(problem)
+        if len(problems) >= count:
+            break
+    return problems
@@ -0,0 +1,160 @@
+"""구간 최고/최저 인덱스 (sparse table)
+
+티커 일별 시계열마다 최솟값/최댓값 sparse table 을 두어 임의 조회 구간
+(1W, 1M, 3M, 52W, YTD, 사용자 지정 등)의 high/low 를 O(1) 로 응답합니다.
+구간 시작 인덱스는 날짜 이진 탐색, first/last 는 인덱스 접근입니다.
+관측치가 append 되면 각 레벨의 꼬리 항목만 계산해 이어 붙입니다.
+"""
+import re
+from typing import Dict, Any, List, Optional
+import numpy as np
+from app.services.series_store import Series, SeriesStore, store
+from app.services.derived import shift_months
+
+
+WINDOW_PATTERN = re.compile(r"^(\d{1,4})([DWMY])$")
+
+
+class SparseTable:
+    """결합 가능한 연산(fmin/fmax)의 구간 질의용 sparse table (append 지원)"""
+
+    def __init__(self, values: np.ndarray, op):
+        self.op = op
+        self.n = 0
+        # 레벨 j 의 항목 i = op(values[i : i + 2^j]), 용량은 2배씩 늘림
+        self._levels: List[np.ndarray] = []
+        self.extend(values)
+
+    def _reserve(self, level: int, size: int) -> np.ndarray:
+        if level == len(self._levels):
+            self._levels.append(np.empty(max(size, 16)))
+        buffer = self._levels[level]
+        if len(buffer) < size:
+            grown = np.empty(max(size, len(buffer) * 2))
+            grown[:len(buffer)] = buffer
+            self._levels[level] = buffer = grown
+        return buffer
+
+    def extend(self, values: np.ndarray) -> None:
+        values = np.asarray(values, dtype=np.float64)
+        old, n = self.n, self.n + len(values)
+        if not len(values):
+            return
+        self._reserve(0, n)[old:n] = values
+        level = 1
+        while (1 << level) <= n:
+            half = 1 << (level - 1)
+            prev = self._levels[level - 1]
+            # 새 관측치를 포함하는 항목만 계산
+            lo = max(old - (1 << level) + 1, 0)
+            hi = n - (1 << level) + 1
+            self._reserve(level, hi)[lo:hi] = self.op(prev[lo:hi], prev[lo + half:hi + half])
+            level += 1
+        self.n = n
+
+    def query(self, lo: int, hi: int) -> float:
+        """values[lo:hi] 구간 결과 (hi > lo)"""
+        level = (hi - lo).bit_length() - 1
+        table = self._levels[level]
+        return float(self.op(table[lo], table[hi - (1 << level)]))
+
+
+def window_start(last: np.datetime64, window: str) -> Optional[np.datetime64]:
+    """조회 구간 시작일 (MAX 는 None = 전체)"""
+    window = window.strip().upper()
+    if window == "MAX":
+        return None
+    if window == "YTD":
+        return last.astype("datetime64[Y]").astype("datetime64[D]")
+    match = WINDOW_PATTERN.match(window)
+    if not match:
+        raise ValueError(f"지원하지 않는 구간: {window} (예: 1W, 3M, 52W, 5Y, YTD, MAX)")
+    k, unit = int(match.group(1)), match.group(2)
+    if k == 0:
+        raise ValueError(f"구간 길이는 1 이상이어야 합니다: {window}")
+    if unit == "D":
+        return last - np.timedelta64(k, "D")
+    if unit == "W":
+        return last - np.timedelta64(k * 7, "D")
+    months = k if unit == "M" else k * 12
+    return shift_months(np.array([last]), months)[0]
+
+
+def parse_windows(windows: Optional[str]) -> List[str]:
+    """쉼표 구분 구간 문자열 검증 (잘못된 구간은 ValueError)"""
+    if not windows:
+        return []
+    parsed = [window.strip().upper() for window in windows.split(",") if window.strip()]
+    for window in parsed:
+        window_start(np.datetime64("2000-01-01"), window)
+    return list(dict.fromkeys(parsed))
+
+
+class RangeIndex:
+    """단일 시계열의 min/max sparse table"""
+
+    def __init__(self, series: Series):
+        self.series = series
+        self.low = SparseTable(series.values, np.fmin)
+        self.high = SparseTable(series.values, np.fmax)
+
+    def sync(self) -> None:
+        """append 된 꼬리만 반영"""
+        n = len(self.series)
+        if n > self.low.n:
+            tail = self.series.values[self.low.n:n]
+            self.low.extend(tail)
+            self.high.extend(tail)
+
+    def window(self, window: str, ndigits: int = 2) -> Optional[Dict[str, Any]]:
+        """구간 high/low/first/last (관측치가 없으면 None)"""
+        series = self.series
+        n = self.low.n
+        if not n:
+            return None
+        start = window_start(series.dates[n - 1], window)
+        lo = 0 if start is None else int(np.searchsorted(series.dates[:n], start, side="left"))
+        if lo >= n:
+            return None
+        first, last = float(series.values[lo]), float(series.values[n - 1])
+        return {
+            "window": window,
+            "start": series.labels(series.dates[lo:lo + 1])[0],
+            "high": round(self.high.query(lo, n), ndigits),
+            "low": round(self.low.query(lo, n), ndigits),
+            "first": round(first, ndigits),
+            "last": round(last, ndigits),
+            "change_pct": round((last / first - 1.0) * 100.0, ndigits) if first else None,
+        }
+
+
+class RangeIndexStore:
+    """심볼별 구간 인덱스 (시계열 교체 시 재구성, append 시 증분 갱신)"""
+
+    def __init__(self, source: SeriesStore = store):
+        self.source = source
+        self._indexes: Dict[str, RangeIndex] = {}
+        self.builds = 0
+
+    def get(self, symbol: str) -> RangeIndex:
+        series = self.source.ensure(symbol)
+        index = self._indexes.get(symbol)
+        if index is None or index.series is not series:
+            index = self._indexes[symbol] = RangeIndex(series)
+            self.builds += 1
+        else:
+            index.sync()
+        return index
+
+    def ranges(self, symbol: str, windows: List[str]) -> Dict[str, Dict[str, Any]]:
+        index = self.get(symbol)
+        result = {}
+        for window in windows:
+            entry = index.window(window)
+            if entry is not None:
+                result[window] = entry
+        return result
+
+
+# 프로세스 공유 인덱스
+ranges = RangeIndexStore()
@@ -0,0 +1,432 @@
+"""경제 자료 카탈로그 (로컬 BM25 검색)
+
+엄선한 자료 목록을 MongoDB resources 컬렉션에 두고, 메모리의 역색인으로 (주제, 수준, 목적)에 맞춰 순위를 매깁니다.
+- 색인 필드: 제목/태그 (가중치 2), 요약/키워드 (가중치 1)
+- 토큰: 어절 (조사/어미 제거) + 한글 어절의 2글자 조각 ("기준금리" 로 "금리" 자료도 검색)
+- 점수: 주제 BM25 × (1 + 목적 일치 0.5 + 수준 일치 0.25), 동점은 목적/수준 일치 → 카탈로그 순서
+- 주제와 겹치는 단어가 없어도 목적/수준에 맞는 자료를 돌려주므로 결과가 비지 않음
+같은 요청에는 항상 같은 결과 (결정적) 이며, 조회 비용은 질의 단어의 색인 목록 길이에만 비례합니다.
+"""
+import math
+from typing import Any, Dict, Iterable, List, Tuple
+from pymongo import UpdateOne
+from app.models.common import RecommendItem
+from app.services.textsim import tokens
+
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+FIELD_WEIGHTS = {"title": 2, "tags": 2, "summary": 1, "keywords": 1}
+PURPOSE_BOOST = 0.5
+LEVEL_BOOST = 0.25
+
+ALL_LEVELS = ["beginner", "intermediate", "advanced"]
+
+# 시드 자료: 제목, 요약, URL, 태그, 수준, 목적, 검색 키워드
+SEED_RESOURCES: List[Dict[str, Any]] = [
+    {
+        "title": "한국은행 경제통계시스템 (ECOS)",
+        "summary": "기준금리, 통화량, 물가, 국민계정, 국제수지 등 한국은행 공식 통계를 조회하고 내려받을 수 있는 시스템",
+        "url": "https://ecos.bok.or.kr",
+        "tags": ["무료", "공식", "데이터", "API"],
+        "levels": ALL_LEVELS,
+        "purposes": ["data", "api", "report"],
+        "keywords": "금리 통화 물가 CPI GDP 국민소득 국제수지 환율 통계",
+    },
+    {
+        "title": "통계청 국가통계포털 (KOSIS)",
+        "summary": "고용, 물가, 인구, 산업활동 등 국내 공식 통계를 주제별로 제공하는 국가통계포털",
+        "url": "https://kosis.kr",
+        "tags": ["무료", "공식", "데이터"],
+        "levels": ALL_LEVELS,
+        "purposes": ["data", "report"],
+        "keywords": "실업률 고용 물가 소비자물가 인구 산업생산 소매판매 통계",
+    },
+    {
+        "title": "KOSIS 공유서비스 OpenAPI",
+        "summary": "KOSIS 통계표를 프로그램에서 직접 불러올 수 있는 오픈 API (인증키 발급 후 사용)",
+        "url": "https://kosis.kr/openapi",
+        "tags": ["무료", "공식", "API"],
+        "levels": ["intermediate", "advanced"],
+        "purposes": ["api", "data"],
+        "keywords": "통계 오픈API 고용 물가 인구 자동화",
+    },
+    {
+        "title": "공공데이터포털",
+        "summary": "정부 부처와 공공기관이 개방한 데이터셋과 오픈 API 를 한곳에서 검색하는 포털",
+        "url": "https://www.data.go.kr",
+        "tags": ["무료", "공식", "데이터", "API"],
+        "levels": ALL_LEVELS,
+        "purposes": ["api", "data"],
+        "keywords": "공공데이터 오픈API 데이터셋 CSV 부동산 무역 재정",
+    },
+    {
+        "title": "e-나라지표",
+        "summary": "정부가 관리하는 핵심 국가지표를 추이 그래프와 해설과 함께 제공",
+        "url": "https://www.index.go.kr",
+        "tags": ["무료", "공식", "데이터"],
+        "levels": ["beginner", "intermediate"],
+        "purposes": ["report", "data", "study"],
+        "keywords": "국가지표 성장률 물가 고용 재정 지표 해설",
+    },
+    {
+        "title": "한국은행 경제교육",
+        "summary": "한국은행이 제공하는 경제 교육 자료, 알기 쉬운 경제지표 해설과 통화정책 안내",
+        "url": "https://www.bok.or.kr/portal/main/main.do",
+        "tags": ["무료", "공식", "교육"],
+        "levels": ["beginner", "intermediate"],
+        "purposes": ["study"],
+        "keywords": "경제지표 해설 통화정책 기준금리 물가안정 입문 교육",
+    },
+    {
+        "title": "한국은행 통화신용정책보고서",
+        "summary": "통화정책 운영 여건과 물가, 성장 전망을 정리한 한국은행 정기 보고서",
+        "url": "https://www.bok.or.kr/portal/bbs/B0000156/list.do?menuNo=200420",
+        "tags": ["무료", "공식", "보고서"],
+        "levels": ["intermediate", "advanced"],
+        "purposes": ["report"],
+        "keywords": "통화정책 기준금리 물가 전망 인플레이션 금융시장",
+    },
+    {
+        "title": "한국은행 금융안정보고서",
+        "summary": "가계부채, 부동산, 금융기관 건전성 등 금융시스템 위험 요인을 점검하는 보고서",
+        "url": "https://www.bok.or.kr/portal/bbs/B0000159/list.do?menuNo=200761",
+        "tags": ["무료", "공식", "보고서"],
+        "levels": ["intermediate", "advanced"],
+        "purposes": ["report"],
+        "keywords": "금융안정 가계부채 부동산 은행 건전성 금융위험",
+    },
+    {
+        "title": "KDI 경제전망",
+        "summary": "한국개발연구원의 연 2회 국내 경제 성장, 물가, 고용 전망과 정책 제언",
+        "url": "https://www.kdi.re.kr",
+        "tags": ["무료", "연구기관", "보고서"],
+        "levels": ["intermediate", "advanced"],
+        "purposes": ["report"],
+        "keywords": "경제전망 성장률 GDP 물가 고용 거시경제 정책",
+    },
+    {
+        "title": "KDI 경제정보센터",
+        "summary": "경제 용어 해설, 시사 경제 콘텐츠, 경제 교육 자료를 제공하는 KDI 경제 정보 포털",
+        "url": "https://eiec.kdi.re.kr",
+        "tags": ["무료", "교육"],
+        "levels": ["beginner", "intermediate"],
+        "purposes": ["study"],
+        "keywords": "경제용어 시사경제 교육 입문 거시경제 미시경제",
+    },
+    {
+        "title": "기획재정부 경제동향 (그린북)",
+        "summary": "매월 발간하는 최근 경제동향 자료로 생산, 소비, 투자, 고용, 물가 흐름을 요약",
+        "url": "https://www.moef.go.kr",
+        "tags": ["무료", "공식", "보고서"],
+        "levels": ["intermediate", "advanced"],
+        "purposes": ["report"],
+        "keywords": "경제동향 그린북 재정 생산 소비 투자 고용 물가",
+    },
+    {
+        "title": "금융감독원 전자공시시스템 (DART)",
+        "summary": "상장사 사업보고서, 재무제표, 주요 공시를 조회하는 금융감독원 공시 시스템",
+        "url": "https://dart.fss.or.kr",
+        "tags": ["무료", "공식", "데이터"],
+        "levels": ["intermediate", "advanced"],
+        "purposes": ["data", "report"],
+        "keywords": "공시 재무제표 기업 주식 사업보고서 실적",
+    },
+    {
+        "title": "Open DART API",
+        "summary": "공시 목록, 재무제표, 주요사항 보고서를 JSON/XML 로 제공하는 전자공시 오픈 API",
+        "url": "https://opendart.fss.or.kr",
+        "tags": ["무료", "공식", "API"],
+        "levels": ["advanced"],
+        "purposes": ["api", "data"],
+        "keywords": "공시 재무제표 기업 주식 오픈API 자동화",
+    },
+    {
+        "title": "KRX 정보데이터시스템",
+        "summary": "한국거래소의 주식, 채권, 파생상품, 지수 시세와 통계를 조회하고 CSV 로 내려받는 시스템",
+        "url": "https://data.krx.co.kr",
+        "tags": ["무료", "공식", "데이터"],
+        "levels": ALL_LEVELS,
+        "purposes": ["data"],
+        "keywords": "주식 KOSPI 코스피 지수 채권 파생상품 시세 거래량 금융시장",
+    },
+    {
+        "title": "금융투자협회 채권정보센터",
+        "summary": "국고채, 회사채 금리와 채권 발행/유통 정보를 제공하는 채권 시장 정보 사이트",
+        "url": "https://www.kofiabond.or.kr",
+        "tags": ["무료", "데이터"],
+        "levels": ["intermediate", "advanced"],
+        "purposes": ["data"],
+        "keywords": "채권 국고채 회사채 금리 수익률 금융",
+    },
+    {
+        "title": "관세청 수출입무역통계",
+        "summary": "품목별, 국가별 수출입 실적과 무역수지를 제공하는 관세청 무역 통계",
+        "url": "https://unipass.customs.go.kr/ets",
+        "tags": ["무료", "공식", "데이터"],
+        "levels": ALL_LEVELS,
+        "purposes": ["data", "report"],
+        "keywords": "무역 수출 수입 무역수지 관세 품목 국가별 국제무역",
+    },
+    {
+        "title": "한국무역협회 K-stat",
+        "summary": "수출입 통계와 국가별 무역 동향, 품목 분석 리포트를 제공하는 무역 통계 서비스",
+        "url": "https://stat.kita.net",
+        "tags": ["무료", "데이터"],
+        "levels": ["intermediate", "advanced"],
+        "purposes": ["data", "report"],
+        "keywords": "무역 수출 수입 국제무역 품목 시장 동향",
+    },
+    {
+        "title": "대외경제정책연구원 (KIEP)",
+        "summary": "국제무역, 통상 정책, 세계 경제 동향에 대한 국책 연구 보고서",
+        "url": "https://www.kiep.go.kr",
+        "tags": ["무료", "연구기관", "보고서"],
+        "levels": ["intermediate", "advanced"],
+        "purposes": ["report"],
+        "keywords": "국제무역 통상 관세 세계경제 환율 FTA",
+    },
+    {
+        "title": "자본시장연구원",
+        "summary": "주식, 채권, 자산운용 등 자본시장과 금융 정책에 관한 연구 보고서",
+        "url": "https://www.kcmi.re.kr",
+        "tags": ["무료", "연구기관", "보고서"],
+        "levels": ["advanced"],
+        "purposes": ["report"],
+        "keywords": "금융 자본시장 주식 채권 자산운용 금융정책",
+    },
+    {
+        "title": "FRED (St. Louis Fed)",
+        "summary": "미국 연준이 운영하는 80만 개 이상의 경제 시계열 데이터베이스, 차트와 CSV 다운로드 지원",
+        "url": "https://fred.stlouisfed.org",
+        "tags": ["무료", "데이터", "API"],
+        "levels": ALL_LEVELS,
+        "purposes": ["data", "report"],
+        "keywords": "미국 금리 물가 CPI 실업률 GDP 환율 시계열 해외",
+    },
+    {
+        "title": "FRED API",
+        "summary": "FRED 시계열을 프로그램으로 조회하는 무료 REST API (API 키 필요)",
+        "url": "https://fred.stlouisfed.org/docs/api/fred/",
+        "tags": ["무료", "API"],
+        "levels": ["intermediate", "advanced"],
+        "purposes": ["api"],
+        "keywords": "미국 시계열 금리 물가 오픈API 자동화 해외",
+    },
+    {
+        "title": "World Bank Open Data",
+        "summary": "국가별 GDP, 인구, 무역, 빈곤 등 개발 지표를 무료로 제공하는 세계은행 데이터",
+        "url": "https://data.worldbank.org",
+        "tags": ["무료", "공식", "데이터", "API"],
+        "levels": ALL_LEVELS,
+        "purposes": ["data", "api", "report"],
+        "keywords": "국가비교 GDP 성장률 인구 무역 개발 세계경제 해외",
+    },
+    {
+        "title": "IMF Data",
+        "summary": "국제수지, 환율, 정부 재정, 국제금융통계 (IFS) 등 IMF 통계 데이터베이스",
+        "url": "https://data.imf.org",
+        "tags": ["무료", "공식", "데이터"],
+        "levels": ["intermediate", "advanced"],
+        "purposes": ["data"],
+        "keywords": "국제수지 환율 재정 국제금융 외환보유액 세계경제 해외",
+    },
+    {
+        "title": "IMF 세계경제전망 (World Economic Outlook)",
+        "summary": "연 2회 발간되는 IMF 의 세계 및 국가별 성장, 물가 전망 보고서",
+        "url": "https://www.imf.org/en/Publications/WEO",
+        "tags": ["무료", "공식", "보고서"],
+        "levels": ["intermediate", "advanced"],
+        "purposes": ["report"],
+        "keywords": "세계경제 전망 성장률 물가 인플레이션 해외",
+    },
+    {
+        "title": "OECD Data Explorer",
+        "summary": "OECD 회원국의 경제, 고용, 교육, 재정 통계를 비교하는 데이터 탐색 도구",
+        "url": "https://data-explorer.oecd.org",
+        "tags": ["무료", "공식", "데이터", "API"],
+        "levels": ["intermediate", "advanced"],
+        "purposes": ["data", "api"],
+        "keywords": "국가비교 OECD 고용 실업률 재정 물가 생산성 해외",
+    },
+    {
+        "title": "OECD 경제전망 (Economic Outlook)",
+        "summary": "OECD 회원국과 주요국의 성장, 물가, 고용 전망과 정책 권고",
+        "url": "https://www.oecd.org/economic-outlook/",
+        "tags": ["무료", "공식", "보고서"],
+        "levels": ["intermediate", "advanced"],
+        "purposes": ["report"],
+        "keywords": "경제전망 세계경제 성장률 물가 고용 해외",
+    },
+    {
+        "title": "BIS 통계",
+        "summary": "국제결제은행의 신용, 부채, 부동산 가격, 실효환율, 정책금리 국제 비교 통계",
+        "url": "https://data.bis.org",
+        "tags": ["무료", "공식", "데이터"],
+        "levels": ["advanced"],
+        "purposes": ["data"],
+        "keywords": "정책금리 신용 부채 부동산 실효환율 금융 국제비교",
+    },
+    {
+        "title": "Khan Academy 거시경제학",
+        "summary": "GDP, 인플레이션, 통화정책, 재정정책을 짧은 강의와 연습 문제로 익히는 무료 강좌",
+        "url": "https://www.khanacademy.org/economics-finance-domain/macroeconomics",
+        "tags": ["무료", "강의", "교육"],
+        "levels": ["beginner"],
+        "purposes": ["study"],
+        "keywords": "거시경제 입문 GDP 인플레이션 물가 통화정책 재정정책 강의",
+    },
+    {
+        "title": "MIT OCW 14.02 거시경제학 원론",
+        "summary": "MIT 공개 강의, 강의 노트와 과제로 거시경제 모형 (IS-LM, 총수요-총공급) 을 학습",
+        "url": "https://ocw.mit.edu/courses/14-02-principles-of-macroeconomics-spring-2014/",
+        "tags": ["무료", "강의", "교육"],
+        "levels": ["intermediate", "advanced"],
+        "purposes": ["study"],
+        "keywords": "거시경제 IS-LM 총수요 총공급 통화정책 환율 강의",
+    },
+    {
+        "title": "K-MOOC 경제학 강좌",
+        "summary": "국내 대학의 경제학, 금융, 통계 온라인 공개 강좌 (한국어)",
+        "url": "https://www.kmooc.kr",
+        "tags": ["무료", "강의", "교육"],
+        "levels": ["beginner", "intermediate"],
+        "purposes": ["study"],
+        "keywords": "경제학 금융 통계 강의 입문 한국어",
+    },
+    {
+        "title": "QuantEcon",
+        "summary": "Python/Julia 로 경제 모형과 계량 분석을 실습하는 오픈소스 강의 노트",
+        "url": "https://quantecon.org",
+        "tags": ["무료", "강의", "코드"],
+        "levels": ["advanced"],
+        "purposes": ["study", "data"],
+        "keywords": "계량경제 Python 시계열 모형 데이터 분석 통계 코드",
+    },
+]
+
+
+def index_terms(text: str) -> List[str]:
+    """어절 + 한글 어절의 2글자 조각"""
+    terms = []
+    for token in tokens(text):
+        terms.append(token)
+        if len(token) > 2 and "가" <= token[0] <= "힣":
+            terms.extend(token[i:i + 2] for i in range(len(token) - 1))
+    return terms
+
+
+def normalize_resource(resource: Dict[str, Any]) -> Dict[str, Any]:
+    resource = {key: value for key, value in resource.items() if key != "_id"}
+    resource["tags"] = list(resource.get("tags") or [])
+    resource["levels"] = list(resource.get("levels") or ALL_LEVELS)
+    resource["purposes"] = list(resource.get("purposes") or [])
+    resource["keywords"] = resource.get("keywords") or ""
+    return resource
+
+
+class ResourceCatalog:
+    """자료 목록 + BM25 역색인"""
+
+    def __init__(self):
+        self._resources: List[Dict[str, Any]] = []
+        # 단어 → [(자료 번호, 가중 빈도)]
+        self._postings: Dict[str, List[Tuple[int, int]]] = {}
+        self._lengths: List[int] = []
+        self._average_length = 0.0
+        self.loaded = False
+
+    def __len__(self) -> int:
+        return len(self._resources)
+
+    def load(self, resources: Iterable[Dict[str, Any]]) -> int:
+        """색인 재구성 (URL 기준 중복 제거, 입력 순서 유지)"""
+        by_url: Dict[str, Dict[str, Any]] = {}
+        for resource in resources:
+            by_url.setdefault(resource["url"], normalize_resource(resource))
+        self._resources = list(by_url.values())
+
+        postings: Dict[str, List[Tuple[int, int]]] = {}
+        self._lengths = []
+        for index, resource in enumerate(self._resources):
+            frequencies: Dict[str, int] = {}
+            for field, weight in FIELD_WEIGHTS.items():
+                value = resource.get(field) or ""
+                text = " ".join(value) if isinstance(value, list) else value
+                for term in index_terms(text):
+                    frequencies[term] = frequencies.get(term, 0) + weight
+            for term, frequency in frequencies.items():
+                postings.setdefault(term, []).append((index, frequency))
+            self._lengths.append(sum(frequencies.values()))
+        self._postings = postings
+        self._average_length = sum(self._lengths) / len(self._lengths) if self._lengths else 0.0
+        self.loaded = True
+        return len(self._resources)
+
+    def ensure(self) -> "ResourceCatalog":
+        """비어 있으면 시드 자료로 색인 (DB 없이 실행되는 경우)"""
+        if not self.loaded:
+            self.load(SEED_RESOURCES)
+        return self
+
+    def _bm25(self, query: str) -> Dict[int, float]:
+        scores: Dict[int, float] = {}
+        total = len(self._resources)
+        for term in set(index_terms(query)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (total - len(postings) + 0.5) / (len(postings) + 0.5))
+            for index, frequency in postings:
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * self._lengths[index] / self._average_length)
+                scores[index] = scores.get(index, 0.0) + idf * frequency * (BM25_K1 + 1) / (frequency + norm)
+        return scores
+
+    def search(self, topic: str, level: str, purpose: str, count: int) -> List[RecommendItem]:
+        """(주제, 수준, 목적) 에 맞는 자료 상위 count 개"""
+        self.ensure()
+        scores = self._bm25(topic)
+
+        def rank(index: int):
+            resource = self._resources[index]
+            purpose_match = purpose in resource["purposes"]
+            level_match = level in resource["levels"]
+            boost = 1 + PURPOSE_BOOST * purpose_match + LEVEL_BOOST * level_match
+            return (-scores.get(index, 0.0) * boost, not purpose_match, not level_match, index)
+
+        ranked = sorted(range(len(self._resources)), key=rank)[:count]
+        return [
+            RecommendItem(
+                title=self._resources[index]["title"],
+                summary=self._resources[index]["summary"],
+                url=self._resources[index]["url"],
+                tags=self._resources[index]["tags"],
+            )
+            for index in ranked
+        ]
+
+
+async def load_catalog(db, target: "ResourceCatalog") -> int:
+    """MongoDB 에서 자료를 읽어 색인 구성 (비어 있으면 시드 후 저장)"""
+    collection = db.resources
+    await collection.create_index("url", unique=True)
+
+    resources = [resource async for resource in collection.find({}, {"_id": 0})]
+    if not resources:
+        resources = SEED_RESOURCES
+        await save_resources(db, resources)
+    return target.load(resources)
+
+
+async def save_resources(db, resources: List[Dict[str, Any]]) -> int:
+    """자료 upsert (URL 기준)"""
+    normalized = [normalize_resource(resource) for resource in resources]
+    result = await db.resources.bulk_write(
+        [UpdateOne({"url": resource["url"]}, {"$set": resource}, upsert=True) for resource in normalized],
+        ordered=False,
+    )
+    return result.upserted_count + result.modified_count
+
+
+# 프로세스 공유 카탈로그
+catalog = ResourceCatalog()
@@ -0,0 +1,234 @@
+"""롤링 통계 엔진 (이동평균, 변동성, z-score, 낙폭, 상관계수)
+
+저장소 시계열 위에서 누적합 기반 O(n) 슬라이딩 윈도우로 계산하고
+(지표, 통계, 윈도우[, 비교 지표])별로 결과 배열을 캐시합니다.
+윈도우 단위는 관측치 개수이며, 윈도우가 다 차지 않은 앞부분은 NaN 입니다.
+"""
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
+import numpy as np
+from app.services.series_store import Series, SeriesStore, DateLike, store, points, to_day
+from app.services.downsample import DEFAULT_BUDGET, downsample
+
+
+STATS = ("sma", "ema", "std", "zscore", "drawdown", "corr")
+
+# 기본/최대 윈도우 (drawdown 은 전체 구간 누적 고점 기준이라 윈도우 무시)
+DEFAULT_WINDOW = 20
+MAX_WINDOW = 2520
+
+# 캐시하는 (지표, 통계, 윈도우[, 비교 지표]) 조합 수
+CACHE_SIZE = 256
+
+
+def _window_sums(values: np.ndarray, window: int) -> Tuple[np.ndarray, np.ndarray]:
+    """윈도우별 (합계, 유효 관측치 수) - NaN 은 0 으로 보고 개수에서 제외"""
+    valid = ~np.isnan(values)
+    csum = np.r_[0.0, np.cumsum(np.where(valid, values, 0.0))]
+    ccount = np.r_[0, np.cumsum(valid)]
+    sums = np.full(len(values), np.nan)
+    counts = np.zeros(len(values), dtype=np.int64)
+    if len(values) >= window:
+        sums[window - 1:] = csum[window:] - csum[:-window]
+        counts[window - 1:] = ccount[window:] - ccount[:-window]
+    return sums, counts
+
+
+def rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """단순 이동평균 (윈도우 내 결측이 있으면 NaN)"""
+    sums, counts = _window_sums(values, window)
+    return np.where(counts == window, sums / window, np.nan)
+
+
+def ema(values: np.ndarray, window: int) -> np.ndarray:
+    """지수 이동평균 (alpha = 2 / (window + 1), 첫 window 개 SMA 로 시작)"""
+    result = np.full(len(values), np.nan)
+    if len(values) < window:
+        return result
+    alpha = 2.0 / (window + 1)
+    seed = rolling_mean(values[:window], window)[-1]
+    result[window - 1] = seed
+    prev = seed
+    for i, value in enumerate(values[window:].tolist(), start=window):
+        if value == value:  # NaN 은 직전 값 유지
+            prev = prev + alpha * (value - prev)
+        result[i] = prev
+    return result
+
+
+def rolling_std(values: np.ndarray, window: int, ddof: int = 1) -> np.ndarray:
+    """이동 표준편차 (평균을 빼고 제곱합을 누적해 상쇄 오차를 줄임)"""
+    if window <= ddof:
+        raise ValueError("window 는 ddof 보다 커야 합니다.")
+    centered = values - np.nanmean(values) if len(values) else values
+    sums, counts = _window_sums(centered, window)
+    squares, _ = _window_sums(centered * centered, window)
+    variance = (squares - sums * sums / window) / (window - ddof)
+    return np.where(counts == window, np.sqrt(np.maximum(variance, 0.0)), np.nan)
+
+
+def rolling_zscore(values: np.ndarray, window: int) -> np.ndarray:
+    """(현재 값 - 이동평균) / 이동 표준편차"""
+    std = rolling_std(values, window)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = (values - rolling_mean(values, window)) / std
+    result[~np.isfinite(result)] = np.nan
+    return result
+
+
+def drawdown(values: np.ndarray) -> np.ndarray:
+    """누적 고점 대비 낙폭 (%)"""
+    peak = np.fmax.accumulate(values)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = (values / peak - 1.0) * 100.0
+    result[~np.isfinite(result)] = np.nan
+    return result
+
+
+def rolling_corr(a: np.ndarray, b: np.ndarray, window: int) -> np.ndarray:
+    """두 배열(같은 날짜축)의 이동 피어슨 상관계수"""
+    a = a - np.nanmean(a) if len(a) else a
+    b = b - np.nanmean(b) if len(b) else b
+    both = np.isnan(a) | np.isnan(b)
+    a, b = np.where(both, np.nan, a), np.where(both, np.nan, b)
+    sa, counts = _window_sums(a, window)
+    sb, _ = _window_sums(b, window)
+    sab, _ = _window_sums(a * b, window)
+    saa, _ = _window_sums(a * a, window)
+    sbb, _ = _window_sums(b * b, window)
+    cov = sab - sa * sb / window
+    var_a = saa - sa * sa / window
+    var_b = sbb - sb * sb / window
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = cov / np.sqrt(var_a * var_b)
+    result[(counts < window) | ~np.isfinite(result)] = np.nan
+    return np.clip(result, -1.0, 1.0)
+
+
+def align_pair(left: Series, right: Series) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """두 시계열의 공통 날짜 (dates, left 값, right 값)"""
+    dates, li, ri = np.intersect1d(left.dates, right.dates, assume_unique=True, return_indices=True)
+    return dates, left.values[li], right.values[ri]
+
+
+class RollingEngine:
+    """(지표, 통계, 윈도우[, 비교 지표])별 롤링 통계 캐시"""
+
+    def __init__(self, source: SeriesStore = store, size: int = CACHE_SIZE):
+        self.source = source
+        self.size = size
+        # key → (시계열들, 길이들, 날짜, 결과 배열), LRU
+        self._cache: "OrderedDict[tuple, Tuple[tuple, tuple, np.ndarray, np.ndarray]]" = OrderedDict()
+        self.computes = 0
+
+    def _series(self, metric: str) -> Series:
+        """등록된 지표만 조회 (없는 지표로 Mock 시계열을 만들지 않음)"""
+        if not self.source.known(metric):
+            raise LookupError(f"알 수 없는 지표: {metric}")
+        return self.source.ensure(metric)
+
+    def compute(
+        self,
+        metric: str,
+        stat: str,
+        window: int = DEFAULT_WINDOW,
+        other: Optional[str] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """(날짜, 통계 배열) - 시계열이 바뀌거나 늘어나면 다시 계산"""
+        if stat not in STATS:
+            raise ValueError(f"지원하지 않는 통계: {stat} (가능: {', '.join(STATS)})")
+        if not 2 <= window <= MAX_WINDOW:
+            raise ValueError(f"window 는 2 ~ {MAX_WINDOW} 사이여야 합니다.")
+        if stat == "corr" and not other:
+            raise ValueError("corr 은 비교 지표(other)가 필요합니다.")
+        if stat == "drawdown":
+            window = 0
+
+        series = [self._series(metric)]
+        if stat == "corr":
+            series.append(self._series(other))
+        key = (metric, stat, window, other if stat == "corr" else None)
+        lengths = tuple(len(s) for s in series)
+        cached = self._cache.get(key)
+        if (
+            cached is not None
+            and all(a is b for a, b in zip(cached[0], series))
+            and cached[1] == lengths
+        ):
+            self._cache.move_to_end(key)
+            return cached[2], cached[3]
+
+        base = series[0]
+        dates, values = base.dates, base.values
+        if stat == "sma":
+            result = rolling_mean(values, window)
+        elif stat == "ema":
+            result = ema(values, window)
+        elif stat == "std":
+            result = rolling_std(values, window)
+        elif stat == "zscore":
+            result = rolling_zscore(values, window)
+        elif stat == "drawdown":
+            result = drawdown(values)
+        else:
+            dates, left, right = align_pair(base, series[1])
+            result = rolling_corr(left, right, window)
+
+        self.computes += 1
+        self._cache[key] = (tuple(series), lengths, dates, result)
+        self._cache.move_to_end(key)
+        if len(self._cache) > self.size:
+            self._cache.popitem(last=False)
+        return dates, result
+
+    def latest(
+        self,
+        metric: str,
+        stat: str,
+        window: int = DEFAULT_WINDOW,
+        other: Optional[str] = None,
+        ndigits: int = 4,
+    ) -> Optional[float]:
+        _, result = self.compute(metric, stat, window, other)
+        if not len(result) or np.isnan(result[-1]):
+            return None
+        return round(float(result[-1]), ndigits)
+
+    def summary(
+        self,
+        metric: str,
+        stats: List[str],
+        window: int = DEFAULT_WINDOW,
+        other: Optional[str] = None,
+        start: DateLike = None,
+        end: DateLike = None,
+        budget: int = DEFAULT_BUDGET,
+    ) -> Dict[str, Any]:
+        """
+        통계별 최근 값 + 구간 시계열 (API/툴 응답용, 포인트 예산으로 축약)
+
+        Returns:
+            {metric, window, other, latest: {stat: value}, series: {stat: [{date, value}]}, source}
+        """
+        base = self._series(metric)
+        latest = {}
+        series = {}
+        for stat in stats:
+            dates, result = self.compute(metric, stat, window, other)
+            latest[stat] = self.latest(metric, stat, window, other)
+            lo = 0 if start is None else int(np.searchsorted(dates, to_day(start), side="left"))
+            hi = len(dates) if end is None else int(np.searchsorted(dates, to_day(end), side="right"))
+            sampled_dates, sampled = downsample(dates[lo:hi], result[lo:hi], budget)
+            series[stat] = points(base.labels(sampled_dates), sampled, ndigits=4)
+        return {
+            "metric": metric,
+            "window": window,
+            "other": other,
+            "latest": latest,
+            "series": series,
+            "source": base.source,
+        }
+
+
+# 프로세스 공유 엔진
+engine = RollingEngine()
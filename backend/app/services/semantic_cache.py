@@ -0,0 +1,255 @@
+"""Q&A 의미 캐시 (MinHash + LSH, 오프라인)
+
+정확 일치 캐시가 놓치는 바꿔 말한 질문 ("기준금리 왜 올라?" / "기준금리 오른 이유는?") 을
+글자 n-gram MinHash 로 비교해 저장된 답변을 재사용합니다. 임베딩 API 는 쓰지 않습니다.
+- 정규화: textsim.tokens (어절별 조사/어미 제거 + 질문어 동의어/활용형 통일, "오르는 이유" → "오르", "왜")
+- 서명: 어절 + 어절 내 글자 n-gram 해시에 무작위 선형 순열 PERMUTATIONS 개를 적용한 최솟값 (numpy)
+- 색인: 서명을 BANDS 개 밴드로 나눈 LSH 버킷 → 조회는 저장 개수와 무관하게 버킷 몇 개만 확인
+- 판정: 후보의 n-gram 집합 Jaccard 유사도가 SEMANTIC_CACHE_THRESHOLD 이상이고
+  내용어(질문어를 뺀 어간과 부호 포함 숫자) 집합이 같을 때
+  (서명 일치율은 추정치라 후보 선별에만 쓰고, 판정은 저장해 둔 n-gram 해시로 정확히 계산)
+  → "인상/인하", "상승/하락", "미국/한국" 처럼 한 단어만 다른 반대 질문은 유사도가 높아도 재사용하지 않음
+- 군집: 대표 질문별로 재사용된 횟수와 최근 바꿔 말한 질문 몇 개를 보관 (관리자 화면)
+- 지표: semantic_cache.<엔드포인트>.hits / misses / stores / evictions / bypass
+"""
+import time
+import zlib
+from collections import OrderedDict, deque
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+import numpy as np
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.services.textsim import tokens
+
+
+# 2^32 보다 큰 소수 (계수 a < 2^31 이면 a * x + b 가 uint64 에서 넘치지 않음)
+_PRIME = np.uint64(4294967311)
+_SEED = 20240501
+# 이보다 n-gram 이 적은 짧은 질문은 의미 캐시에 넣지 않음 (추정치가 불안정)
+MIN_SHINGLES = 4
+# 조회당 서명을 비교하는 최대 후보 수 (버킷 충돌 수가 많은 순)
+MAX_CANDIDATES = 64
+# 군집별로 보관하는 바꿔 말한 질문 수
+PARAPHRASE_SAMPLES = 5
+
+# 내용어 비교에서 빼는 질문어/요청어
+QUESTION_WORDS = frozenset(
+    """왜 뭐 어떻게 어떤 언제 어디 얼마 무슨 좀 알려줘 알려주세요 설명해줘 설명해주세요 궁금해""".split()
+)
+
+
+def content_words(question: str) -> FrozenSet[str]:
+    """질문어를 뺀 어간 + 숫자 (같은 질문으로 보려면 이 집합이 같아야 함)"""
+    return frozenset(token for token in tokens(question) if token not in QUESTION_WORDS)
+
+
+def shingles(question: str, ngram: int) -> FrozenSet[str]:
+    """어절 자체 + 어절 내 글자 n-gram (어순이 바뀌어도 같은 집합)"""
+    result = set()
+    for token in tokens(question):
+        result.add(token)
+        result.update(token[i:i + ngram] for i in range(len(token) - ngram + 1))
+    return frozenset(result)
+
+
+class MinHasher:
+    """글자 n-gram 집합 → MinHash 서명"""
+
+    def __init__(self, permutations: int, ngram: int, seed: int = _SEED):
+        rng = np.random.default_rng(seed)
+        self.ngram = ngram
+        self._a = rng.integers(1, 1 << 31, size=permutations, dtype=np.uint64)
+        self._b = rng.integers(0, 1 << 31, size=permutations, dtype=np.uint64)
+
+    def shingles(self, text: str) -> FrozenSet[str]:
+        return shingles(text, self.ngram)
+
+    def hashes(self, shingle_set: FrozenSet[str]) -> np.ndarray:
+        """n-gram 해시 (정렬된 uint32, 정확한 Jaccard 계산용)"""
+        return np.unique(np.fromiter(
+            (zlib.crc32(shingle.encode()) for shingle in shingle_set),
+            dtype=np.uint32,
+            count=len(shingle_set),
+        ))
+
+    def signature(self, hashes: np.ndarray) -> np.ndarray:
+        permuted = (np.outer(hashes.astype(np.uint64), self._a) + self._b) % _PRIME
+        return permuted.min(axis=0)
+
+
+def similarity(a: np.ndarray, b: np.ndarray) -> float:
+    """정렬된 해시 집합의 Jaccard 유사도"""
+    common = len(np.intersect1d(a, b, assume_unique=True))
+    return common / (len(a) + len(b) - common)
+
+
+class _Entry:
+    __slots__ = ("id", "question", "content", "hashes", "bands", "value", "expires_at", "hits", "paraphrases")
+
+    def __init__(self, id, question, content, hashes, bands, value, expires_at):
+        self.id = id
+        self.question = question
+        self.content = content
+        self.hashes = hashes
+        self.bands = bands
+        self.value = value
+        self.expires_at = expires_at
+        self.hits = 0
+        self.paraphrases = deque(maxlen=PARAPHRASE_SAMPLES)
+
+
+class SemanticCache:
+    """엔드포인트 하나의 질문 → 답변 의미 캐시 (LRU + LSH 버킷)"""
+
+    def __init__(
+        self,
+        endpoint: str,
+        threshold: float = None,
+        permutations: int = None,
+        bands: int = None,
+        ngram: int = None,
+        max_entries: int = None,
+    ):
+        self.endpoint = endpoint
+        self.threshold = threshold or settings.SEMANTIC_CACHE_THRESHOLD
+        permutations = permutations or settings.SEMANTIC_CACHE_PERMUTATIONS
+        self.bands = bands or settings.SEMANTIC_CACHE_BANDS
+        if permutations % self.bands:
+            raise ValueError("SEMANTIC_CACHE_PERMUTATIONS 는 SEMANTIC_CACHE_BANDS 의 배수여야 합니다.")
+        self.rows = permutations // self.bands
+        self.max_entries = max_entries or settings.SEMANTIC_CACHE_MAX_ENTRIES
+        self.hasher = MinHasher(permutations, ngram or settings.SEMANTIC_CACHE_NGRAM)
+        self._entries: "OrderedDict[int, _Entry]" = OrderedDict()
+        # 버킷 대부분은 항목 1개라 set 대신 list (메모리 약 1/3)
+        self._buckets: Dict[int, List[int]] = {}
+        self._next_id = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _sketch(self, question: str) -> Optional[Tuple[np.ndarray, Tuple[int, ...], int]]:
+        """(n-gram 해시, 밴드 버킷 키, 내용어 집합 해시) — 너무 짧은 질문은 None"""
+        shingle_set = self.hasher.shingles(question)
+        if len(shingle_set) < MIN_SHINGLES:
+            return None
+        hashes = self.hasher.hashes(shingle_set)
+        signature = self.hasher.signature(hashes)
+        bands = tuple(
+            hash((band, signature[band * self.rows:(band + 1) * self.rows].tobytes()))
+            for band in range(self.bands)
+        )
+        return hashes, bands, hash(content_words(question))
+
+    def _remove(self, entry: _Entry) -> None:
+        del self._entries[entry.id]
+        for band in entry.bands:
+            bucket = self._buckets.get(band)
+            if bucket is not None and entry.id in bucket:
+                bucket.remove(entry.id)
+                if not bucket:
+                    del self._buckets[band]
+
+    def _nearest(self, hashes, bands, content) -> Optional[Tuple[_Entry, float]]:
+        collisions: Dict[int, int] = {}
+        for band in bands:
+            for entry_id in self._buckets.get(band, ()):
+                collisions[entry_id] = collisions.get(entry_id, 0) + 1
+        candidates = sorted(collisions, key=collisions.get, reverse=True)[:MAX_CANDIDATES]
+
+        now = time.time()
+        best = None
+        for entry_id in candidates:
+            entry = self._entries[entry_id]
+            if entry.expires_at <= now:
+                self._remove(entry)
+                continue
+            if entry.content != content:
+                # "금리 인상" / "금리 인하", "금리 2%" / "금리 3%" 처럼 내용어가 다르면 다른 질문
+                continue
+            score = similarity(hashes, entry.hashes)
+            if score >= self.threshold and (best is None or score > best[1]):
+                best = (entry, score)
+        return best
+
+    def lookup(self, question: str) -> Optional[Any]:
+        """유사한 질문의 저장된 답변 (없으면 None)"""
+        sketch = self._sketch(question)
+        if sketch is None:
+            return None
+        found = self._nearest(*sketch)
+        if found is None:
+            metrics.incr(f"semantic_cache.{self.endpoint}.misses")
+            return None
+        entry, _ = found
+        entry.hits += 1
+        if question != entry.question and question not in entry.paraphrases:
+            entry.paraphrases.append(question)
+        self._entries.move_to_end(entry.id)
+        metrics.incr(f"semantic_cache.{self.endpoint}.hits")
+        return entry.value
+
+    def store(self, question: str, value: Any, ttl: int) -> None:
+        """질문/답변 저장 (이미 같은 군집이 있으면 답변만 갱신)"""
+        sketch = self._sketch(question)
+        if sketch is None:
+            return
+        hashes, bands, content = sketch
+        found = self._nearest(hashes, bands, content)
+        if found is not None:
+            entry = found[0]
+            entry.value = value
+            entry.expires_at = time.time() + ttl
+            self._entries.move_to_end(entry.id)
+            return
+
+        entry = _Entry(self._next_id, question, content, hashes, bands, value, time.time() + ttl)
+        self._next_id += 1
+        self._entries[entry.id] = entry
+        for band in bands:
+            self._buckets.setdefault(band, []).append(entry.id)
+        metrics.incr(f"semantic_cache.{self.endpoint}.stores")
+
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries.values())))
+            metrics.incr(f"semantic_cache.{self.endpoint}.evictions")
+
+    def clusters(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """재사용이 많은 순 군집 (크기 = 대표 질문 1 + 캐시 적중 수)"""
+        entries = sorted(self._entries.values(), key=lambda entry: entry.hits, reverse=True)[:limit]
+        return [
+            {
+                "question": entry.question,
+                "size": entry.hits + 1,
+                "paraphrases": list(entry.paraphrases),
+                "expires_in": max(0, round(entry.expires_at - time.time())),
+            }
+            for entry in entries
+        ]
+
+    def stats(self) -> Dict[str, Any]:
+        sizes = [entry.hits + 1 for entry in self._entries.values()]
+        return {
+            "entries": len(sizes),
+            "buckets": len(self._buckets),
+            "reused_clusters": sum(1 for size in sizes if size > 1),
+            "largest_cluster": max(sizes, default=0),
+        }
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._buckets.clear()
+
+
+# 엔드포인트별 인덱스
+_indexes: Dict[str, SemanticCache] = {}
+
+
+def semantic_index(endpoint: str) -> SemanticCache:
+    index = _indexes.get(endpoint)
+    if index is None:
+        index = _indexes[endpoint] = SemanticCache(endpoint)
+    return index
+
+
+def semantic_indexes() -> Dict[str, SemanticCache]:
+    return dict(_indexes)
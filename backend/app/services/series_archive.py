@@ -0,0 +1,255 @@
+"""시계열 바이너리 아카이브 (append-only + memory-map)
+
+지표별로 두 개의 파일을 둡니다.
+- <METRIC>.<revision>.bin: 고정폭 레코드 (date: datetime64[D], value: float64) = 16바이트
+- <METRIC>.idx.json: 사이드카 인덱스 (데이터 파일 이름, 커밋된 레코드 수, 주기, 출처, 블록별 첫 날짜)
+
+데이터를 먼저 기록하고 fsync 한 뒤 인덱스를 원자적으로 교체하므로,
+읽는 쪽은 인덱스의 count 까지만 매핑하여 쓰기 중인 레코드를 보지 않습니다.
+전체 재작성(write_series)은 새 리비전 파일에 기록한 뒤 인덱스 교체로 한 번에 커밋하므로,
+인덱스와 데이터 파일이 서로 다른 버전을 가리키는 순간이 없습니다.
+모든 uvicorn 워커가 같은 파일을 read-only 로 매핑하므로 페이지 캐시를 공유합니다.
+"""
+import json
+import os
+import re
+from bisect import bisect_right
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+
+from app.services.series_store import Series, SeriesStore, DateLike, to_day
+
+
+RECORD_DTYPE = np.dtype([("date", "<M8[D]"), ("value", "<f8")])
+
+# 사이드카 블록 인덱스 간격 (레코드 수, 16B * 256 = 4KiB 페이지)
+BLOCK_SIZE = 256
+
+INDEX_VERSION = 1
+
+
+def _safe_name(metric: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_.-]", "_", metric)
+
+
+def archive_paths(root: str, metric: str, meta: Optional[Dict[str, Any]] = None) -> Tuple[str, str]:
+    """(데이터 파일, 인덱스 파일) 경로 (인덱스가 가리키는 리비전 파일, 없으면 <METRIC>.bin)"""
+    name = _safe_name(metric)
+    data_name = (meta or {}).get("data") or f"{name}.bin"
+    return os.path.join(root, data_name), os.path.join(root, f"{name}.idx.json")
+
+
+def _to_records(dates, values) -> np.ndarray:
+    records = np.empty(len(dates), dtype=RECORD_DTYPE)
+    records["date"] = np.asarray(dates, dtype="datetime64[D]")
+    records["value"] = np.asarray(values, dtype=np.float64)
+    return records
+
+
+def _block_index(dates: np.ndarray, offset: int = 0, blocks: Optional[List[int]] = None) -> List[int]:
+    """BLOCK_SIZE 레코드마다 첫 날짜 (epoch day 정수)"""
+    blocks = list(blocks or [])
+    first = len(blocks) * BLOCK_SIZE - offset
+    return blocks + dates[first::BLOCK_SIZE].astype(np.int64).tolist()
+
+
+def _write_index(index_path: str, meta: Dict[str, Any]) -> None:
+    tmp_path = f"{index_path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, index_path)
+
+
+def read_index(root: str, metric: str) -> Optional[Dict[str, Any]]:
+    _, index_path = archive_paths(root, metric)
+    if not os.path.exists(index_path):
+        return None
+    with open(index_path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def write_series(
+    root: str,
+    metric: str,
+    dates,
+    values,
+    freq: str = "M",
+    source: str = "Mock",
+) -> Dict[str, Any]:
+    """시계열 전체 기록 (리비전 반영 등 재작성이 필요할 때)"""
+    os.makedirs(root, exist_ok=True)
+    records = _to_records(dates, values)
+    if len(records) > 1 and not np.all(records["date"][1:] > records["date"][:-1]):
+        raise ValueError(f"{metric}: 날짜가 오름차순이 아닙니다.")
+
+    previous = read_index(root, metric)
+    revision = (previous["revision"] + 1) if previous else 0
+    # 새 리비전 파일에 기록 (기존 인덱스/매핑은 이전 파일을 계속 가리킴)
+    data_name = f"{_safe_name(metric)}.{revision}.bin"
+    data_path = os.path.join(root, data_name)
+    _, index_path = archive_paths(root, metric)
+    tmp_path = f"{data_path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(records.tobytes())
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, data_path)
+
+    meta = {
+        "version": INDEX_VERSION,
+        "metric": metric,
+        "freq": freq,
+        "source": source,
+        "data": data_name,
+        "count": len(records),
+        "revision": revision,
+        "blocks": _block_index(records["date"]),
+    }
+    # 인덱스 교체가 커밋 시점
+    _write_index(index_path, meta)
+    if previous is not None:
+        old_path, _ = archive_paths(root, metric, previous)
+        if old_path != data_path:
+            try:
+                os.remove(old_path)  # 이미 매핑한 읽기 쪽은 그대로 유지됨 (POSIX)
+            except OSError:
+                pass
+    return meta
+
+
+def append(root: str, metric: str, dates, values) -> Dict[str, Any]:
+    """레코드 추가 (기존 마지막 날짜 이후만 허용)"""
+    meta = read_index(root, metric)
+    if meta is None:
+        raise FileNotFoundError(f"{metric}: 아카이브가 없습니다. write_series 로 먼저 생성하세요.")
+    records = _to_records(dates, values)
+    if not len(records):
+        return meta
+
+    data_path, index_path = archive_paths(root, metric, meta)
+    count = meta["count"]
+    if count:
+        last = np.fromfile(data_path, dtype=RECORD_DTYPE, count=1, offset=(count - 1) * RECORD_DTYPE.itemsize)
+        if records["date"][0] <= last["date"][0]:
+            raise ValueError(f"{metric}: append 는 마지막 날짜({last['date'][0]}) 이후만 가능합니다.")
+    if len(records) > 1 and not np.all(records["date"][1:] > records["date"][:-1]):
+        raise ValueError(f"{metric}: 날짜가 오름차순이 아닙니다.")
+
+    with open(data_path, "r+b") as f:
+        # 커밋되지 않은 꼬리(이전 실패한 쓰기)는 덮어씀
+        f.seek(count * RECORD_DTYPE.itemsize)
+        f.write(records.tobytes())
+        f.truncate()
+        f.flush()
+        os.fsync(f.fileno())
+
+    meta["count"] = count + len(records)
+    meta["blocks"] = _block_index(records["date"], offset=count, blocks=meta["blocks"])
+    _write_index(index_path, meta)
+    return meta
+
+
+class ArchivedSeries(Series):
+    """memory-map 된 아카이브 시계열 (dates/values 는 매핑의 view)"""
+
+    def __init__(self, metric: str, records: np.ndarray, meta: Dict[str, Any], root: Optional[str] = None):
+        super().__init__(
+            metric,
+            records["date"],
+            records["value"],
+            freq=meta.get("freq", "M"),
+            source=meta.get("source", "Mock"),
+        )
+        self.revision = meta.get("revision", 0)
+        self.root = root
+        self._records = records
+        self._blocks = meta.get("blocks", [])
+
+    def append(self, dates, values) -> int:
+        """
+        아카이브 파일에 추가한 뒤 다시 매핑 (기존 레코드를 메모리로 복사하지 않음)
+        - 파일 없이 구성된 경우 (root 없음) 만 메모리 상에서 추가
+        """
+        if self.root is None:
+            added = super().append(dates, values)
+            if added:
+                self._blocks = _block_index(self.dates)
+            return added
+        dates = np.atleast_1d(np.asarray(dates, dtype="datetime64[D]"))
+        values = np.atleast_1d(np.asarray(values, dtype=np.float64))
+        if len(dates) != len(values):
+            raise ValueError(f"{self.metric}: 날짜와 값의 길이가 다릅니다.")
+        if not len(dates):
+            return 0
+        meta = append(self.root, self.metric, dates, values)
+        data_path, _ = archive_paths(self.root, self.metric, meta)
+        self._remap(np.memmap(data_path, dtype=RECORD_DTYPE, mode="r", shape=(meta["count"],)), meta)
+        return len(dates)
+
+    def _remap(self, records: np.ndarray, meta: Dict[str, Any]) -> None:
+        self._records = records
+        self.dates = records["date"]
+        self.values = records["value"]
+        self._blocks = meta["blocks"]
+
+    def _search(self, day: np.datetime64, side: str) -> int:
+        """블록 인덱스로 구간을 좁힌 뒤 해당 블록만 탐색 (1~2 페이지 접근)"""
+        key = int(day.astype(np.int64))
+        block = max(bisect_right(self._blocks, key) - 1, 0)
+        lo = block * BLOCK_SIZE
+        hi = min(lo + BLOCK_SIZE + 1, len(self.dates))
+        return lo + int(np.searchsorted(self.dates[lo:hi], day, side=side))
+
+    def bounds(self, start: DateLike = None, end: DateLike = None) -> Tuple[int, int]:
+        lo = 0 if start is None else self._search(to_day(start), "left")
+        hi = len(self.dates) if end is None else self._search(to_day(end), "right")
+        return lo, max(lo, hi)
+
+
+def open_series(root: str, metric: str) -> Optional[ArchivedSeries]:
+    """아카이브를 read-only 로 매핑 (인덱스에 커밋된 레코드까지만)"""
+    meta = read_index(root, metric)
+    if meta is None:
+        return None
+    data_path, _ = archive_paths(root, metric, meta)
+    available = os.path.getsize(data_path) // RECORD_DTYPE.itemsize if os.path.exists(data_path) else 0
+    if meta["count"] > available:
+        raise ValueError(f"{metric}: 인덱스 레코드 수({meta['count']})가 데이터 파일({available})보다 큽니다.")
+    if meta["count"] == 0:
+        records = np.empty(0, dtype=RECORD_DTYPE)
+    else:
+        records = np.memmap(data_path, dtype=RECORD_DTYPE, mode="r", shape=(meta["count"],))
+    return ArchivedSeries(meta.get("metric", metric), records, meta, root=root)
+
+
+def load_archive(root: str, target: SeriesStore) -> int:
+    """디렉토리의 모든 아카이브를 저장소에 연결, 연결된 지표 수 반환"""
+    if not root or not os.path.isdir(root):
+        return 0
+    loaded = 0
+    for filename in sorted(os.listdir(root)):
+        if not filename.endswith(".idx.json"):
+            continue
+        with open(os.path.join(root, filename), encoding="utf-8") as f:
+            metric = json.load(f)["metric"]
+        try:
+            series = open_series(root, metric)
+        except ValueError as e:
+            print(f"[WARNING] Series Archive Skipped: {e}")
+            continue
+        if series is not None:
+            target.attach(series)
+            loaded += 1
+    return loaded
+
+
+def dump_store(root: str, source: SeriesStore, metrics: Optional[List[str]] = None) -> int:
+    """저장소의 시계열을 아카이브로 기록 (초기 부트스트랩용)"""
+    metrics = metrics or source.metrics()
+    for metric in metrics:
+        series = source.ensure(metric)
+        write_series(root, metric, series.dates, series.values, freq=series.freq, source=series.source)
+    return len(metrics)
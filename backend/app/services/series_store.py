@@ -0,0 +1,301 @@
+"""시계열 저장소 (NumPy 컬럼형)
+
+지표별로 날짜 배열(datetime64[D])과 값 배열(float64)을 연속 메모리로 보관하고,
+start/end 범위 조회는 np.searchsorted 로 O(log n) 슬라이싱합니다.
+실제 환경에서는 ECOS, KOSIS 적재 데이터로 교체되며, 현재는 프로세스 시작 시
+결정적(seed 고정) Mock 히스토리를 한 번만 생성합니다.
+"""
+from datetime import date, datetime
+from typing import Dict, Any, List, Optional, Tuple, Union
+import itertools
+import zlib
+
+import numpy as np
+
+
+DateLike = Union[str, date, datetime, np.datetime64, None]
+
+# Mock 히스토리 시작 시점
+SEED_START = "1990-01"
+
+# 주기별 문자열 포맷 단위 (np.datetime_as_string unit)
+FREQ_UNITS = {"D": "D", "M": "M", "Q": "M"}
+
+# 지표별 Mock 스펙
+# - level: 최근 관측치 값, trend: 연간 추세, vol: 변동 폭, step: 반올림 단위, freq: D/M/Q
+METRIC_SPECS: Dict[str, Dict[str, Any]] = {
+    "CPI_YOY": {"level": 2.3, "vol": 0.8, "source": "통계청"},
+    "CORE_CPI_YOY": {"level": 2.0, "vol": 0.5, "source": "통계청"},
+    "POLICY_RATE": {"level": 3.5, "vol": 1.2, "step": 0.25, "source": "한국은행"},
+    "UNEMPLOYMENT": {"level": 3.4, "vol": 0.4, "source": "통계청"},
+    "GDP_YOY": {"level": 2.2, "vol": 1.0, "freq": "Q", "source": "한국은행"},
+    "GDP": {"level": 560.0, "trend": 11.0, "vol": 3.0, "freq": "Q", "source": "한국은행"},  # 실질 GDP (조원)
+    "USD_KRW": {"level": 1335.5, "trend": 8.0, "vol": 40.0, "source": "서울외환중개"},  # 월평균
+    "CPI": {"level": 110.5, "trend": 2.2, "vol": 0.4, "source": "통계청"},
+    "CORE_CPI": {"level": 108.2, "trend": 1.9, "vol": 0.3, "source": "통계청"},
+    "PMI_MANUFACTURING": {"level": 51.2, "vol": 1.5, "source": "S&P Global"},
+    "RETAIL_SALES": {"level": 3.8, "vol": 1.0, "source": "통계청"},
+    # 일별 시세 (영업일)
+    "USD/KRW": {"level": 1335.5, "trend": 8.0, "vol": 40.0, "freq": "D", "source": "서울외환중개"},
+    "JPY/KRW": {"level": 898.2, "trend": -3.0, "vol": 40.0, "freq": "D", "source": "서울외환중개"},
+    "KOSPI": {"level": 2655.2, "trend": 60.0, "vol": 120.0, "freq": "D", "source": "한국거래소"},
+    "SPX": {"level": 4783.45, "trend": 140.0, "vol": 150.0, "freq": "D", "source": "S&P Global"},
+    "GOLD": {"level": 2045.3, "trend": 50.0, "vol": 80.0, "freq": "D", "source": "COMEX"},
+    "WTI": {"level": 78.45, "trend": 1.0, "vol": 10.0, "freq": "D", "source": "NYMEX"},
+    "KR3YT": {"level": 3.42, "vol": 0.6, "freq": "D", "source": "한국거래소"},
+    "KR10YT": {"level": 3.68, "vol": 0.5, "freq": "D", "source": "한국거래소"},
+}
+
+DEFAULT_SPEC: Dict[str, Any] = {"level": 100.0, "vol": 0.3, "source": "Mock"}
+
+# 시계열 객체 고유 번호 (캐시 키용, 교체되면 새 번호)
+_series_ids = itertools.count(1)
+
+
+def to_day(value: DateLike) -> Optional[np.datetime64]:
+    """문자열/date/datetime 을 datetime64[D] 로 변환 (YYYY, YYYY-MM, YYYY-MM-DD 허용)"""
+    if value is None or value == "":
+        return None
+    if isinstance(value, datetime):
+        value = value.date()
+    return np.datetime64(value).astype("datetime64[D]")
+
+
+class Series:
+    """단일 지표 시계열 (연속 날짜/값 배열)"""
+
+    def __init__(
+        self,
+        metric: str,
+        dates: np.ndarray,
+        values: np.ndarray,
+        freq: str = "M",
+        source: str = "Mock",
+    ):
+        self.metric = metric
+        self.dates = np.asarray(dates, dtype="datetime64[D]")
+        self.values = np.asarray(values, dtype=np.float64)
+        self.freq = freq
+        self.source = source
+        # 기존 관측치가 바뀌면 증가 (append 는 길이만 증가)
+        self.revision = 0
+        self.uid = next(_series_ids)
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def append(self, dates, values) -> int:
+        """
+        마지막 날짜 이후 관측치 추가 (revision 유지)
+        - 파생 지표 등은 늘어난 꼬리만 다시 계산할 수 있습니다.
+        """
+        dates = np.atleast_1d(np.asarray(dates, dtype="datetime64[D]"))
+        values = np.atleast_1d(np.asarray(values, dtype=np.float64))
+        if len(dates) != len(values):
+            raise ValueError(f"{self.metric}: 날짜와 값의 길이가 다릅니다.")
+        if not len(dates):
+            return 0
+        if (len(self.dates) and dates[0] <= self.dates[-1]) or np.any(dates[1:] <= dates[:-1]):
+            raise ValueError(f"{self.metric}: append 는 마지막 날짜 이후, 오름차순만 가능합니다.")
+        self.dates = np.concatenate([self.dates, dates])
+        self.values = np.concatenate([self.values, values])
+        return len(dates)
+
+    def bounds(self, start: DateLike = None, end: DateLike = None) -> Tuple[int, int]:
+        """[start, end] 구간의 인덱스 범위 (O(log n))"""
+        lo = 0 if start is None else int(np.searchsorted(self.dates, to_day(start), side="left"))
+        hi = len(self.dates) if end is None else int(np.searchsorted(self.dates, to_day(end), side="right"))
+        return lo, max(lo, hi)
+
+    def slice(self, start: DateLike = None, end: DateLike = None) -> Tuple[np.ndarray, np.ndarray]:
+        """[start, end] 구간 (복사 없는 view)"""
+        lo, hi = self.bounds(start, end)
+        return self.dates[lo:hi], self.values[lo:hi]
+
+    def tail(self, n: int) -> Tuple[np.ndarray, np.ndarray]:
+        """최근 n개 관측치 (view)"""
+        n = max(0, min(n, len(self.dates)))
+        return self.dates[len(self.dates) - n:], self.values[len(self.values) - n:]
+
+    def labels(self, dates: np.ndarray) -> List[str]:
+        """주기에 맞는 날짜 문자열 (예: 월별 → YYYY-MM)"""
+        return np.datetime_as_string(dates, unit=FREQ_UNITS.get(self.freq, "D")).tolist()
+
+
+class SeriesStore:
+    """프로세스 공유 시계열 저장소"""
+
+    def __init__(self):
+        self._series: Dict[str, Series] = {}
+        # 저장소 전체 데이터 버전 (어떤 시계열이든 바뀌면 증가)
+        self.version = 0
+
+    def __contains__(self, metric: str) -> bool:
+        return metric in self._series
+
+    def metrics(self) -> List[str]:
+        return sorted(self._series)
+
+    def put(
+        self,
+        metric: str,
+        dates: np.ndarray,
+        values: np.ndarray,
+        freq: str = "M",
+        source: str = "Mock",
+    ) -> Series:
+        """시계열 등록/교체 (날짜 오름차순 정렬 보장)"""
+        dates = np.asarray(dates, dtype="datetime64[D]")
+        values = np.asarray(values, dtype=np.float64)
+        if len(dates) != len(values):
+            raise ValueError(f"{metric}: 날짜와 값의 길이가 다릅니다.")
+        if len(dates) > 1 and not np.all(dates[1:] > dates[:-1]):
+            order = np.argsort(dates, kind="stable")
+            dates, values = dates[order], values[order]
+
+        previous = self._series.get(metric)
+        series = Series(metric, dates, values, freq=freq, source=source)
+        if previous is not None:
+            series.revision = previous.revision + 1
+        self._series[metric] = series
+        self.version += 1
+        return series
+
+    def merge(
+        self,
+        metric: str,
+        dates: np.ndarray,
+        values: np.ndarray,
+        freq: Optional[str] = None,
+        source: Optional[str] = None,
+    ) -> Series:
+        """기존 시계열과 병합 (같은 날짜는 새 값이 우선 = 리비전 반영)"""
+        previous = self._series.get(metric)
+        if previous is None:
+            return self.put(metric, dates, values, freq=freq or "M", source=source or "Mock")
+        dates, values = merge_arrays(previous.dates, previous.values, dates, values)
+        return self.put(
+            metric, dates, values,
+            freq=freq or previous.freq,
+            source=source or previous.source,
+        )
+
+    def append(self, metric: str, dates, values) -> Series:
+        """새 관측치 추가 (기존 값 변경은 merge/put 사용)"""
+        series = self.ensure(metric)
+        if series.append(dates, values):
+            self.version += 1
+        return series
+
+    def attach(self, series: Series) -> Series:
+        """이미 구성된 시계열(예: 아카이브 매핑) 등록"""
+        self._series[series.metric] = series
+        self.version += 1
+        return series
+
+    def get(self, metric: str) -> Optional[Series]:
+        return self._series.get(metric)
+
+    def known(self, metric: str) -> bool:
+        """등록되어 있거나 Mock 스펙이 있는 지표인지 (ensure 로 임의 지표가 생기지 않도록 확인용)"""
+        return metric in self._series or metric in METRIC_SPECS
+
+    def ensure(self, metric: str) -> Series:
+        """등록된 시계열 반환, 없으면 Mock 히스토리 생성"""
+        series = self._series.get(metric)
+        if series is None:
+            series = self.put(metric, *generate_mock_history(metric), **_spec_meta(metric))
+        return series
+
+    def slice(
+        self, metric: str, start: DateLike = None, end: DateLike = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        return self.ensure(metric).slice(start, end)
+
+    def to_points(
+        self, metric: str, start: DateLike = None, end: DateLike = None
+    ) -> List[Dict[str, Any]]:
+        """[{date, value}, ...] 형식으로 변환 (API 응답용)"""
+        series = self.ensure(metric)
+        dates, values = series.slice(start, end)
+        return points(series.labels(dates), values)
+
+    def tail_points(self, metric: str, n: int) -> List[Dict[str, Any]]:
+        series = self.ensure(metric)
+        dates, values = series.tail(n)
+        return points(series.labels(dates), values)
+
+
+def points(labels: List[str], values: np.ndarray, ndigits: int = 2) -> List[Dict[str, Any]]:
+    """날짜 라벨과 값 배열을 [{date, value}] 로 변환"""
+    return [
+        {"date": label, "value": value}
+        for label, value in zip(labels, np.round(values, ndigits).tolist())
+    ]
+
+
+def dedupe_last(dates: np.ndarray, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """날짜 오름차순 정렬 + 중복 날짜는 마지막(가장 나중에 들어온) 값 유지"""
+    dates = np.asarray(dates, dtype="datetime64[D]")
+    values = np.asarray(values, dtype=np.float64)
+    # 역순에서 첫 번째 = 원래 순서의 마지막
+    unique, index = np.unique(dates[::-1], return_index=True)
+    return unique, values[::-1][index]
+
+
+def merge_arrays(
+    old_dates: np.ndarray, old_values: np.ndarray, new_dates: np.ndarray, new_values: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """두 시계열 병합 (겹치는 날짜는 new 우선)"""
+    return dedupe_last(
+        np.concatenate([old_dates, np.asarray(new_dates, dtype="datetime64[D]")]),
+        np.concatenate([old_values, np.asarray(new_values, dtype=np.float64)]),
+    )
+
+
+def _spec_meta(metric: str) -> Dict[str, str]:
+    spec = METRIC_SPECS.get(metric, DEFAULT_SPEC)
+    return {"freq": spec.get("freq", "M"), "source": spec.get("source", "Mock")}
+
+
+def generate_mock_history(metric: str, end: DateLike = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    지표별 결정적 Mock 히스토리 생성
+    - 지표명으로 seed 를 고정하여 모든 워커가 같은 데이터를 갖습니다.
+    - 마지막 관측치는 스펙의 level 과 같습니다.
+    - 일별(D) 시세는 월별 사이클을 영업일로 보간한 뒤 일간 노이즈를 더합니다.
+    """
+    spec = METRIC_SPECS.get(metric, DEFAULT_SPEC)
+    freq = spec.get("freq", "M")
+
+    end_day = to_day(end) or np.datetime64(datetime.now().date(), "D")
+    months = np.arange(np.datetime64(SEED_START, "M"), end_day.astype("datetime64[M]") + 1)
+    if freq == "Q":
+        months = months[months.astype(np.int64) % 3 == 0]
+    month_days = months.astype("datetime64[D]")
+
+    rng = np.random.default_rng(zlib.crc32(metric.encode("utf-8")))
+    n = len(months)
+    years_to_end = (n - 1 - np.arange(n)) / (4 if freq == "Q" else 12)
+
+    # 평활화된 노이즈로 완만한 사이클 표현
+    window = 6
+    noise = rng.standard_normal(n + window - 1)
+    smooth = np.convolve(noise, np.ones(window) / np.sqrt(window), mode="valid")
+    values = spec.get("trend", 0.0) * -years_to_end + spec["vol"] * 0.5 * smooth
+
+    dates = month_days
+    if freq == "D":
+        dates = np.arange(month_days[0], end_day + 1)
+        dates = dates[np.is_busday(dates)]
+        daily = np.interp(dates.astype(np.int64), month_days.astype(np.int64), values)
+        values = daily + spec["vol"] * 0.02 * rng.standard_normal(len(dates))
+
+    values = values - values[-1] + spec["level"]
+    if spec.get("step"):
+        values = np.maximum(np.round(values / spec["step"]) * spec["step"], 0.0)
+    return dates, values
+
+
+# 프로세스 공유 저장소
+store = SeriesStore()
@@ -0,0 +1,125 @@
+"""시장 데이터 스냅샷 캐시 (직렬화된 응답 바이트 재사용)
+
+시장 데이터는 하루에 몇 번만 바뀌므로, 각 payload 를 데이터 버전마다 한 번만
+Pydantic 모델로 조립하고 orjson 으로 인코딩한 바이트를 보관합니다.
+라우터는 이 바이트를 그대로 Response 로 돌려주어 response_model 검증과
+JSON 인코딩을 요청마다 반복하지 않습니다.
+
+데이터 버전 = 시계열 저장소 버전 + 캘린더 버전 (+ 실시간 소스 내용 해시)
+"""
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Callable, Dict, Hashable, Optional, Union
+import orjson
+from fastapi import Request, Response
+from pydantic import BaseModel
+from app.core.config import settings
+from app.core.compression import compress, negotiate
+from app.core.http_cache import conditional_response, make_etag
+from app.core.metrics import metrics
+from app.services.series_store import store
+from app.services.calendar_store import calendar
+from app.services.live_adapters import LiveSnapshot
+
+
+def data_version(live: Optional[LiveSnapshot] = None) -> str:
+    """현재 데이터 버전 문자열"""
+    version = f"s{store.version}.c{calendar.version}"
+    fingerprint = live.fingerprint() if live else ""
+    return f"{version}.l{fingerprint}" if fingerprint else version
+
+
+# 데이터 버전 문자열, 또는 조립 후 다시 읽을 수 있도록 버전을 계산하는 함수
+Version = Union[str, Callable[[], str]]
+
+
+def encode(payload: Any) -> bytes:
+    """모델/딕셔너리를 JSON 바이트로 인코딩 (datetime 은 ISO 8601, 그 밖의 타입은 문자열)"""
+    if isinstance(payload, BaseModel):
+        payload = payload.model_dump()
+    return orjson.dumps(payload, default=str, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+class Snapshot:
+    """한 데이터 버전의 인코딩된 payload (+ 조건부 요청용 ETag/수정 시각, 압축본)"""
+
+    __slots__ = ("body", "version", "etag", "last_modified", "variants")
+
+    def __init__(self, body: bytes, version: str, last_modified: Optional[datetime] = None):
+        self.body = body
+        self.version = version
+        self.etag = make_etag(body)
+        self.last_modified = last_modified or datetime.utcnow()
+        # 인코딩 → 압축된 바이트 (처음 요청될 때 한 번만 압축)
+        self.variants: Dict[str, bytes] = {}
+
+    def variant(self, encoding: str) -> bytes:
+        cached = self.variants.get(encoding)
+        if cached is not None:
+            metrics.incr(f"compression.{encoding}.precompressed_hits")
+            return cached
+        self.variants[encoding] = compressed = compress(self.body, encoding)
+        return compressed
+
+
+class SnapshotCache:
+    """(리소스 키, 데이터 버전)별 스냅샷 LRU"""
+
+    def __init__(self, max_entries: int = settings.SNAPSHOT_MAX_ENTRIES, enabled: bool = settings.SNAPSHOT_CACHE_ENABLED):
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self._entries: "OrderedDict[Hashable, Snapshot]" = OrderedDict()
+        self.hits = 0
+        self.builds = 0
+
+    def get(self, key: Hashable, version: Version, build: Callable[[], Any]) -> Snapshot:
+        """
+        버전이 같으면 저장된 스냅샷, 아니면 build() 결과를 인코딩해 교체
+        - version 이 함수면 build() 뒤에 다시 읽어 저장 (build 중 store.ensure 등으로
+          버전이 올라가도 다음 요청에서 한 번 더 조립하지 않도록)
+        """
+        current = version() if callable(version) else version
+        cached = self._entries.get(key) if self.enabled else None
+        if cached is not None and cached.version == current:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            metrics.incr("snapshot.hits")
+            return cached
+
+        payload = build()
+        if callable(version):
+            current = version()
+        snapshot = Snapshot(encode(payload), current)
+        if cached is not None and cached.etag == snapshot.etag:
+            # 버전만 바뀌고 내용이 같으면 수정 시각 유지 (If-Modified-Since 304 유지)
+            snapshot.last_modified = cached.last_modified
+        self.builds += 1
+        metrics.incr("snapshot.builds")
+        if self.enabled:
+            self._entries[key] = snapshot
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return snapshot
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+def snapshot_response(request: Request, snapshot: Snapshot, resource: str) -> Response:
+    """스냅샷 바이트(또는 저장된 압축본)를 그대로 응답 (조건부 요청이면 304)"""
+    encoding = None
+    if len(snapshot.body) >= settings.COMPRESSION_MIN_SIZE:
+        encoding = negotiate(request.headers.get("accept-encoding"))
+    return conditional_response(
+        request,
+        snapshot.variant(encoding) if encoding else snapshot.body,
+        resource,
+        etag=snapshot.etag,
+        last_modified=snapshot.last_modified,
+        encoding=encoding,
+    )
+
+
+# 프로세스 공유 캐시
+snapshots = SnapshotCache()
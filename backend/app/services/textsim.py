@@ -0,0 +1,99 @@
+"""짧은 텍스트 유사도 (근사 중복 판정)
+
+병렬로 나눠 생성한 문제를 합치거나 문제 은행에 넣을 때 표현만 조금 다른 중복을 걸러냅니다.
+한국어는 띄어쓰기와 조사가 흔들리므로 공백/문장부호를 지운 글자 n-gram 의 Jaccard 유사도를 씁니다.
+어절 단위 토큰화 (tokens) 는 의미 캐시와 자료 카탈로그 검색이 함께 씁니다.
+"""
+import re
+import unicodedata
+from typing import Callable, FrozenSet, Iterable, List, TypeVar
+
+T = TypeVar("T")
+
+SHINGLE_SIZE = 3
+DEFAULT_THRESHOLD = 0.8
+
+_NOISE = re.compile(r"[\s\W_]+", re.UNICODE)
+_TOKEN = re.compile(r"[-+]?\d+(?:[.,]\d+)*%?|[^\W\d_]+", re.UNICODE)
+
+# 어절 끝에서 떼어내는 조사/어미 (긴 것부터, 남는 어간이 2글자 이상일 때만)
+SUFFIXES = sorted(
+    """은 는 이 가 을 를 에 에서 의 로 으로 와 과 도 만 란 이란 요 나요 까요 인가요 인가 는가
+    어 아 야 냐 니 죠 지 입니까 습니까 합니다 해요 에요 예요 이에요""".split(),
+    key=len,
+    reverse=True,
+)
+# 질문어 동의어 + 자주 쓰는 용언 활용형 → 어간
+SYNONYMS = {
+    "이유": "왜",
+    "무엇": "뭐",
+    "무엇인가요": "뭐",
+    "뭐야": "뭐",
+    "뭔가요": "뭐",
+    "뭐예요": "뭐",
+    "올라": "오르",
+    "올랐": "오르",
+    "오른": "오르",
+    "오를": "오르",
+    "내려": "내리",
+    "내렸": "내리",
+    "내린": "내리",
+    "내릴": "내리",
+}
+
+
+def normalize(text: str) -> str:
+    """소문자 + 공백/문장부호 제거"""
+    return _NOISE.sub("", text.lower())
+
+
+def tokens(text: str) -> List[str]:
+    """어절 토큰 (NFKC + 소문자, 숫자는 부호/소수점/% 포함, 조사/어미 제거, 동의어 통일)"""
+    result = []
+    for token in _TOKEN.findall(unicodedata.normalize("NFKC", text).lower()):
+        token = SYNONYMS.get(token, token)
+        if token[0].isalpha():
+            for suffix in SUFFIXES:
+                if token.endswith(suffix) and len(token) - len(suffix) >= 2:
+                    token = token[:-len(suffix)]
+                    break
+        result.append(SYNONYMS.get(token, token))
+    return result
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> FrozenSet[str]:
+    """정규화한 텍스트의 글자 n-gram 집합 (n 보다 짧으면 텍스트 자체)"""
+    text = normalize(text)
+    if len(text) <= size:
+        return frozenset([text]) if text else frozenset()
+    return frozenset(text[i:i + size] for i in range(len(text) - size + 1))
+
+
+def jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def similarity(a: str, b: str) -> float:
+    return jaccard(shingles(a), shingles(b))
+
+
+def dedupe(
+    items: Iterable[T],
+    key: Callable[[T], str],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> List[T]:
+    """
+    근사 중복 제거 (입력 순서 유지, 먼저 나온 항목을 남김)
+    - key(item) 텍스트의 유사도가 threshold 이상이면 중복
+    """
+    kept: List[T] = []
+    seen: List[FrozenSet[str]] = []
+    for item in items:
+        signature = shingles(key(item))
+        if any(jaccard(signature, other) >= threshold for other in seen):
+            continue
+        kept.append(item)
+        seen.append(signature)
+    return kept
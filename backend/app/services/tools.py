@@ -1,7 +1,9 @@
 """OpenAI Function Calling 툴 구현"""
 from typing import Dict, Any, List
 from datetime import datetime, timedelta
-import random
+from app.services.series_store import store
+from app.services.calendar_store import calendar
+from app.services.rolling import STATS, DEFAULT_WINDOW, engine as rolling_engine
 
 
 # ===== Tool 1: get_series =====
@@ -24,55 +26,15 @@ async def get_series(
             ...
         }
     """
-    # Mock 데이터 생성
-    result = {}
-    
     # 기본 기간 설정
-    if not end:
-        end_date = datetime.now()
-    else:
-        end_date = datetime.strptime(end, "%Y-%m-%d")
+    end_date = datetime.strptime(end, "%Y-%m-%d") if end else datetime.now()
+    start_date = datetime.strptime(start, "%Y-%m-%d") if start else end_date - timedelta(days=365 * 3)  # 3년
     
-    if not start:
-        start_date = end_date - timedelta(days=365 * 3)  # 3년
-    else:
-        start_date = datetime.strptime(start, "%Y-%m-%d")
-    
-    # 각 지표별 데이터 생성
-    for metric in metrics:
-        series = []
-        current = start_date
-        
-        # 지표별 기본값 설정
-        base_values = {
-            "CPI_YOY": 2.0,
-            "CORE_CPI_YOY": 1.8,
-            "POLICY_RATE": 2.5,
-            "UNEMPLOYMENT": 3.5,
-            "GDP_YOY": 2.5,
-            "USD_KRW": 1300,
-        }
-        
-        base = base_values.get(metric, 100.0)
-        
-        while current <= end_date:
-            # 약간의 트렌드와 노이즈 추가
-            trend = (current - start_date).days / 365 * 0.2
-            noise = random.uniform(-0.3, 0.3)
-            value = base + trend + noise
-            
-            series.append({
-                "date": current.strftime("%Y-%m"),
-                "value": round(value, 2)
-            })
-            
-            # 다음 달로
-            if current.month == 12:
-                current = datetime(current.year + 1, 1, 1)
-            else:
-                current = datetime(current.year, current.month + 1, 1)
-        
-        result[metric] = series
+    # 각 지표는 공유 저장소의 배열 슬라이스로 조회
+    result = {
+        metric: store.to_points(metric, start_date, end_date)
+        for metric in metrics
+    }
     
     return {
         "data": result,
@@ -91,7 +53,10 @@ def make_chart(spec: Dict[str, Any]) -> Dict[str, Any]:
             type: "line" | "area" | "bar" | "combo",
             series: ["CPI_YOY", "POLICY_RATE"],
             y2: ["POLICY_RATE"],  # 우측 축
-            annotations: ["TARGET_2PCT"]  # 주석
+            annotations: ["TARGET_2PCT"],  # 주석
+            freq: "M",  # 공통 달력 주기 (선택, 기본: 가장 촘촘한 주기)
+            resample: "last" | "mean" | "sum",  # 기간 집계 (선택)
+            fill: "ffill" | "interpolate"  # 결측 처리 (선택)
         }
     
     Returns:
@@ -113,14 +78,20 @@ def make_chart(spec: Dict[str, Any]) -> Dict[str, Any]:
                 "color": "#C8A96A"
             })
     
+    chart_spec = {
+        "chart_type": chart_type,
+        "series": series,
+        "y2_axis": y2_series,
+        "annotations": annotation_configs
+    }
+    # 정렬 옵션은 지정된 경우만 전달
+    for key in ("freq", "resample", "fill"):
+        if spec.get(key):
+            chart_spec[key] = spec[key]
+    
     return {
         "type": "chart",
-        "spec": {
-            "chart_type": chart_type,
-            "series": series,
-            "y2_axis": y2_series,
-            "annotations": annotation_configs
-        },
+        "spec": chart_spec,
         "meta": {
             "created_at": datetime.now().isoformat(),
             "tool": "make_chart"
@@ -143,36 +114,26 @@ async def get_calendar(
         country: 국가 코드
     
     Returns:
-        발표 일정 리스트
+        발표 일정 리스트 (시간순 최대 50건) + 전체 건수
     """
-    # Mock 캘린더
-    today = datetime.now()
-    events = []
+    if from_date is None and to_date is None:
+        from_date = datetime.now().strftime("%Y-%m-%d")
+        to_date = (datetime.now() + timedelta(days=7)).strftime("%Y-%m-%d")
     
-    indicators = [
-        ("CPI", "소비자물가지수", "high"),
-        ("Unemployment", "실업률", "medium"),
-        ("GDP", "GDP 성장률", "high"),
-        ("Retail Sales", "소매판매", "medium"),
-        ("Policy Rate", "기준금리 결정", "high"),
-    ]
-    
-    for i, (code, name, importance) in enumerate(indicators):
-        event_date = today + timedelta(days=i + 1)
-        events.append({
-            "datetime": event_date.strftime("%Y-%m-%d %H:%M"),
-            "indicator": name,
-            "code": code,
-            "consensus": None,
-            "previous": None,
-            "importance": importance,
-            "country": country,
-            "source": "Mock Calendar"
-        })
+    try:
+        events, total = calendar.query(
+            from_date,
+            to_date,
+            countries=[country] if country else None,
+            page_size=50,
+        )
+    except ValueError as e:
+        return {"error": f"잘못된 날짜 형식: {e}"}
     
     return {
         "events": events,
-        "period": f"{from_date or 'now'} ~ {to_date or '+7days'}"
+        "total": total,
+        "period": f"{from_date or '처음'} ~ {to_date or '끝'}"
     }
 
 
@@ -226,6 +187,39 @@ def calc_whatif(formula: str, inputs: Dict[str, float]) -> Dict[str, Any]:
     return result
 
 
+# ===== Tool 4-1: rolling_stats =====
+def rolling_stats(
+    metric: str,
+    stats: List[str],
+    window: int = DEFAULT_WINDOW,
+    other: str = None,
+    start: str = None,
+    end: str = None
+) -> Dict[str, Any]:
+    """
+    롤링 통계 (이동평균, 변동성, z-score, 낙폭, 상관계수)
+    
+    Args:
+        metric: 지표
+        stats: 통계 리스트 (sma, ema, std, zscore, drawdown, corr)
+        window: 윈도우 (관측치 개수)
+        other: corr 비교 지표
+        start: 시작일 (기본: 최근 1년)
+        end: 종료일
+    
+    Returns:
+        통계별 최근 값 + 구간 시계열
+    """
+    if start is None:
+        start = (datetime.now() - timedelta(days=365)).strftime("%Y-%m-%d")
+    try:
+        result = rolling_engine.summary(metric, stats, window, other, start, end, budget=60)
+    except (ValueError, LookupError) as e:
+        return {"success": False, "error": str(e)}
+    result["success"] = True
+    return result
+
+
 # ===== Tool 5: save_bookmark =====
 async def save_bookmark(title: str, widget_id: str, db_client=None) -> Dict[str, Any]:
     """
@@ -338,6 +332,21 @@ TOOL_DEFINITIONS = [
                                 "type": "array",
                                 "items": {"type": "string"},
                                 "description": "차트 주석 (예: ['TARGET_2PCT'])"
+                            },
+                            "freq": {
+                                "type": "string",
+                                "enum": ["D", "M", "Q", "A"],
+                                "description": "공통 달력 주기 (선택사항, 기본: 가장 촘촘한 주기)"
+                            },
+                            "resample": {
+                                "type": "string",
+                                "enum": ["last", "mean", "sum"],
+                                "description": "기간 집계 방식 (선택사항, 기본: last)"
+                            },
+                            "fill": {
+                                "type": "string",
+                                "enum": ["ffill", "interpolate"],
+                                "description": "결측 처리 (선택사항, 기본: ffill)"
                             }
                         },
                         "required": ["type", "series"]
@@ -355,9 +364,9 @@ TOOL_DEFINITIONS = [
             "parameters": {
                 "type": "object",
                 "properties": {
-                    "from_date": {"type": "string", "description": "시작일 (선택사항)"},
-                    "to_date": {"type": "string", "description": "종료일 (선택사항)"},
-                    "country": {"type": "string", "description": "국가 코드 (기본값: KR)"}
+                    "from_date": {"type": "string", "description": "시작일 (YYYY-MM-DD, 선택사항, 기본: 오늘)"},
+                    "to_date": {"type": "string", "description": "종료일 (YYYY-MM-DD, 선택사항, 기본: 7일 후)"},
+                    "country": {"type": "string", "description": "국가 코드 (KR, US, EU, JP, CN / 기본값: KR)"}
                 }
             }
         }
@@ -383,6 +392,29 @@ TOOL_DEFINITIONS = [
             }
         }
     },
+    {
+        "type": "function",
+        "function": {
+            "name": "rolling_stats",
+            "description": "저장된 시계열의 롤링 통계(이동평균, 지수이동평균, 변동성, z-score, 고점 대비 낙폭, 이동 상관계수)를 계산합니다.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "metric": {"type": "string", "description": "지표 (예: 'KOSPI', 'USD/KRW', 'CPI')"},
+                    "stats": {
+                        "type": "array",
+                        "items": {"type": "string", "enum": list(STATS)},
+                        "description": "계산할 통계 리스트"
+                    },
+                    "window": {"type": "integer", "description": "윈도우 (관측치 개수, 기본값: 20)"},
+                    "other": {"type": "string", "description": "corr 비교 지표 (corr 사용 시 필수)"},
+                    "start": {"type": "string", "description": "시작일 (YYYY-MM-DD, 기본: 최근 1년)"},
+                    "end": {"type": "string", "description": "종료일 (YYYY-MM-DD, 선택사항)"}
+                },
+                "required": ["metric", "stats"]
+            }
+        }
+    },
     {
         "type": "function",
         "function": {
@@ -431,6 +463,8 @@ async def execute_tool(tool_name: str, arguments: Dict[str, Any]) -> Dict[str, A
         return await get_calendar(**arguments)
     elif tool_name == "calc_whatif":
         return calc_whatif(**arguments)
+    elif tool_name == "rolling_stats":
+        return rolling_stats(**arguments)
     elif tool_name == "save_bookmark":
         return await save_bookmark(**arguments)
     elif tool_name == "render_report":
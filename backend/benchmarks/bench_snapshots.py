@@ -0,0 +1,77 @@
+"""시장 데이터 스냅샷 캐시 벤치마크
+
+이전 방식(요청마다 모델 조립 + response_model 검증 + JSON 인코딩)과
+스냅샷 방식(데이터 버전별 인코딩 바이트 재사용)의 초당 요청 수를 비교합니다.
+실시간 소스 없이(Mock) 인프로세스 TestClient 로 측정하므로 네트워크 비용은 제외됩니다.
+
+실행:
+    cd backend && python -m benchmarks.bench_snapshots --requests 300
+"""
+import argparse
+import os
+import time
+
+os.environ.setdefault("OPENAI_API_KEY", "bench")
+
+from fastapi import FastAPI  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.main import app  # noqa: E402
+from app.models.common import KPIData, TrendsData, NewsResponse  # noqa: E402
+from app.models.advanced import ExtendedKPIData, CalendarResponse, TickersResponse  # noqa: E402
+from app.services.market_adapters import generate_mock_kpis, generate_mock_trends, generate_mock_news  # noqa: E402
+from app.services.advanced_adapters import (  # noqa: E402
+    generate_extended_kpis, generate_calendar_events, generate_market_tickers,
+)
+from app.services.snapshot import snapshots  # noqa: E402
+
+
+ENDPOINTS = [
+    "/api/market/kpis",
+    "/api/market/trends",
+    "/api/market/news",
+    "/api/market/kpis/extended",
+    "/api/market/calendar",
+    "/api/market/tickers",
+]
+
+
+def legacy_app() -> FastAPI:
+    """스냅샷 도입 전과 같은 방식으로 응답하는 비교용 앱"""
+    legacy = FastAPI()
+    legacy.get("/api/market/kpis", response_model=KPIData)(lambda: generate_mock_kpis())
+    legacy.get("/api/market/trends", response_model=TrendsData)(lambda: generate_mock_trends())
+    legacy.get("/api/market/news", response_model=NewsResponse)(lambda: NewsResponse(items=generate_mock_news()))
+    legacy.get("/api/market/kpis/extended", response_model=ExtendedKPIData)(lambda: generate_extended_kpis())
+    legacy.get("/api/market/calendar", response_model=CalendarResponse)(lambda: generate_calendar_events())
+    legacy.get("/api/market/tickers", response_model=TickersResponse)(lambda: generate_market_tickers())
+    return legacy
+
+
+def measure(client: TestClient, path: str, requests: int) -> float:
+    client.get(path)  # 워밍업 (Mock 히스토리 생성, 첫 스냅샷 빌드)
+    started = time.perf_counter()
+    for _ in range(requests):
+        response = client.get(path)
+        assert response.status_code == 200, response.text
+    return requests / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="스냅샷 캐시 전/후 초당 요청 수 비교")
+    parser.add_argument("--requests", type=int, default=300)
+    args = parser.parse_args()
+
+    before = TestClient(legacy_app())
+    after = TestClient(app)
+
+    print(f"{'endpoint':<28}{'before req/s':>14}{'after req/s':>14}{'speedup':>10}")
+    for path in ENDPOINTS:
+        old = measure(before, path, args.requests)
+        new = measure(after, path, args.requests)
+        print(f"{path:<28}{old:>14.0f}{new:>14.0f}{new / old:>9.1f}x")
+    print(f"snapshot hits={snapshots.hits} builds={snapshots.builds}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,12 @@
+import pytest
+from app.services.llm_cache import llm_cache
+from app.services.semantic_cache import semantic_indexes
+
+
+@pytest.fixture(autouse=True)
+def _clear_llm_cache():
+    # 테스트 간 LLM 응답 캐시 (정확 일치 / 의미) 공유 방지
+    yield
+    llm_cache.clear()
+    for index in semantic_indexes().values():
+        index.clear()
@@ -0,0 +1,33 @@
+"""다중 시계열 정렬 테스트"""
+import numpy as np
+from app.services.alignment import align, resample
+from app.services.chat_service import build_chart_widget
+
+
+def test_align_monthly_and_quarterly_series():
+    """월별 + 분기별 시계열을 월별 달력으로 outer join 후 ffill"""
+    months = np.arange(np.datetime64("2024-01"), np.datetime64("2024-07")).astype("datetime64[D]")
+    quarters = np.array(["2024-01-01", "2024-04-01"], dtype="datetime64[D]")
+    calendar, names, matrix = align(
+        {"CPI": (months, np.arange(6.0)), "GDP": (quarters, np.array([1.0, 2.0]))},
+        freq="M",
+        fill="ffill",
+    )
+    assert len(calendar) == 6 and names == ["CPI", "GDP"]
+    assert matrix[:, 1].tolist() == [1.0, 1.0, 1.0, 2.0, 2.0, 2.0]
+
+    periods, values = resample(months, np.arange(6.0), "Q", how="mean")
+    assert values.tolist() == [1.0, 4.0]
+
+
+def test_chart_widget_merges_all_series_results():
+    """여러 번의 get_series 결과를 모두 모아 차트 시리즈만 정렬"""
+    tool_results = {
+        "a": {"data": {"CPI_YOY": [{"date": "2024-01", "value": 2.0}, {"date": "2024-02", "value": 2.1}]}, "source": "ECOS"},
+        "b": {"data": {"GDP_YOY": [{"date": "2024-01", "value": 1.0}]}, "source": "ECOS"},
+    }
+    chart = {"spec": {"chart_type": "combo", "series": ["CPI_YOY", "GDP_YOY"]}}
+    widget = build_chart_widget(chart, tool_results)
+    assert list(widget["data"]) == ["CPI_YOY", "GDP_YOY"]
+    assert widget["aligned"]["values"] == [[2.0, 1.0], [2.1, 1.0]]
+    assert widget["source"] == "ECOS"
@@ -0,0 +1,112 @@
+"""시계열 분석 엔진 테스트 (다운샘플, 롤링 통계, 구간 인덱스)"""
+import numpy as np
+import pytest
+from app.services.downsample import DownsampleCache, lttb_indices, minmax_indices
+from app.services.range_index import RangeIndexStore, SparseTable, window_start
+from app.services.rolling import RollingEngine, rolling_corr, rolling_std
+from app.services.series_store import SeriesStore
+
+
+def _monthly_store():
+    target = SeriesStore()
+    dates = np.arange(np.datetime64("2020-01"), np.datetime64("2022-01")).astype("datetime64[D]")
+    target.put("IDX", dates, 100.0 + np.arange(24.0))
+    target.put("RATE", dates, np.r_[np.full(12, 1.0), np.full(12, 1.5)])
+    return target
+
+
+def test_lttb_keeps_endpoints_and_spike():
+    x = np.arange(5000.0)
+    y = np.sin(x / 200.0)
+    y[3210] = 25.0
+    index = lttb_indices(x, y, 300)
+    assert len(index) == 300
+    assert index[0] == 0 and index[-1] == 4999
+    assert np.all(np.diff(index) > 0)
+    assert 3210 in index
+    # minmax 엔벨로프는 버킷 극값을 모두 보존
+    envelope = minmax_indices(y, 100)
+    assert 3210 in envelope and np.argmin(y) in envelope
+
+
+def test_downsample_cache_follows_appends():
+    target = SeriesStore()
+    dates = np.arange(np.datetime64("2010-01-01"), np.datetime64("2020-01-01"))
+    target.put("DAILY", dates, np.cumsum(np.ones(len(dates))), freq="D")
+    cache = DownsampleCache(target)
+    first = cache.get("DAILY", budget=200)
+    assert len(first[0]) == 200
+    assert cache.get("DAILY", budget=200) is first
+    assert cache.hits == 1
+
+    target.append("DAILY", ["2020-01-01"], [-1.0])
+    dates, values = cache.get("DAILY", budget=200)
+    assert dates[-1] == np.datetime64("2020-01-01") and values[-1] == -1.0
+    assert cache.misses == 2
+
+
+def test_rolling_stats_match_naive_windows():
+    rng = np.random.default_rng(7)
+    values = 1000.0 + np.cumsum(rng.normal(size=300))
+    naive = np.array([values[i - 19:i + 1].std(ddof=1) for i in range(19, 300)])
+    assert np.allclose(rolling_std(values, 20)[19:], naive)
+    assert np.isnan(rolling_std(values, 20)[:19]).all()
+
+    other = values * 2 + rng.normal(scale=0.01, size=300)
+    corr = rolling_corr(values, other, 30)
+    assert np.nanmin(corr) > 0.99
+
+
+def test_rolling_engine_caches_per_window():
+    target = _monthly_store()
+    rolling = RollingEngine(target)
+    dates, sma = rolling.compute("IDX", "sma", 3)
+    assert sma[2] == 101.0 and np.isnan(sma[1])
+    rolling.compute("IDX", "sma", 3)
+    rolling.compute("IDX", "sma", 6)
+    assert rolling.computes == 2
+    assert rolling.latest("IDX", "drawdown") == 0.0
+    target.append("IDX", ["2022-01-01"], [61.5])
+    assert rolling.latest("IDX", "drawdown") == -50.0
+    assert rolling.computes == 4
+
+
+def test_rolling_engine_is_bounded_and_rejects_unknown_metrics():
+    target = _monthly_store()
+    rolling = RollingEngine(target, size=2)
+    for window in (3, 4, 5):
+        rolling.compute("IDX", "sma", window)
+    assert len(rolling._cache) == 2
+    with pytest.raises(LookupError):
+        rolling.compute("NOT_A_METRIC", "sma", 3)
+    assert "NOT_A_METRIC" not in target
+
+
+def test_sparse_table_matches_scan_after_appends():
+    rng = np.random.default_rng(3)
+    values = rng.normal(size=1000)
+    table = SparseTable(values[:300], np.fmax)
+    table.extend(values[300:301])
+    table.extend(values[301:])
+    for lo, hi in [(0, 1000), (5, 6), (299, 302), (511, 1000), (123, 777)]:
+        assert table.query(lo, hi) == values[lo:hi].max()
+
+
+def test_range_index_windows_follow_appends():
+    target = SeriesStore()
+    dates = np.arange(np.datetime64("2023-01-01"), np.datetime64("2024-01-01"))
+    target.put("TICK", dates, np.arange(len(dates), dtype=float), freq="D")
+    index = RangeIndexStore(target)
+    ranges = index.ranges("TICK", ["1W", "YTD", "MAX"])
+    assert ranges["1W"] == {
+        "window": "1W", "start": "2023-12-24", "high": 364.0, "low": 357.0,
+        "first": 357.0, "last": 364.0, "change_pct": round((364 / 357 - 1) * 100, 2),
+    }
+    assert ranges["MAX"]["low"] == 0.0
+
+    target.append("TICK", ["2024-01-01"], [-5.0])
+    ranges = index.ranges("TICK", ["1W", "YTD"])
+    assert ranges["1W"]["low"] == -5.0
+    assert ranges["YTD"]["first"] == -5.0 and ranges["YTD"]["start"] == "2024-01-01"
+    assert index.builds == 1
+    assert window_start(np.datetime64("2024-03-31"), "1M") == np.datetime64("2024-02-29")
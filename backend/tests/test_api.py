@@ -1,4 +1,5 @@
 """API 테스트"""
+import asyncio
 import pytest
 from fastapi.testclient import TestClient
 from app.main import app
@@ -42,3 +43,82 @@ def test_news():
     assert "items" in data
     assert len(data["items"]) > 0
 
+
+def test_rolling_stats():
+    """롤링 통계 조회 테스트"""
+    response = client.get("/api/market/series/USD/KRW/rolling?stats=sma,zscore,drawdown&window=20&start=2024-01-01")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["metric"] == "USD/KRW"
+    assert set(data["latest"]) == {"sma", "zscore", "drawdown"}
+    assert data["series"]["sma"][0]["date"] >= "2024-01-01"
+
+    response = client.get("/api/market/series/KOSPI/rolling?stats=corr")
+    assert response.status_code == 400
+
+
+def test_rolling_stats_unknown_metric_is_404():
+    """없는 지표는 Mock 시계열을 만들지 않고 404 (스냅샷 버전 유지)"""
+    from app.services.series_store import store
+
+    store.ensure("KOSPI")
+    version = store.version
+    response = client.get("/api/market/series/NOPE/rolling")
+    assert response.status_code == 404
+    response = client.get("/api/market/series/KOSPI/rolling?stats=corr&other=NOPE")
+    assert response.status_code == 404
+    assert "NOPE" not in store and store.version == version
+
+
+def test_ticker_windows():
+    """티커 구간 조회 테스트"""
+    response = client.get("/api/market/tickers?windows=1w,3M,10D")
+    assert response.status_code == 200
+    ticker = response.json()["tickers"][0]
+    assert set(ticker["ranges"]) == {"1W", "3M", "10D"}
+    assert ticker["ranges"]["3M"]["low"] <= ticker["ranges"]["1W"]["low"]
+    assert ticker["range_52w_low"] <= ticker["ranges"]["3M"]["low"]
+
+    response = client.get("/api/market/tickers?windows=2X")
+    assert response.status_code == 400
+
+
+def test_calendar_range_query():
+    """캘린더 기간/필터 조회 테스트"""
+    response = client.get("/api/market/calendar?from=2020-01-01&to=2100-01-01&country=KR,US&importance=high&page_size=10")
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data["events"]) == 10 and data["total"] > 10
+    assert {e["country"] for e in data["events"]} <= {"KR", "US"}
+    assert all(e["importance"] == "high" for e in data["events"])
+
+    assert client.get("/api/market/calendar?from=yesterday").status_code == 400
+
+
+def test_dashboard_batch():
+    """대시보드 배치 조회 테스트 (파트별 오류 격리)"""
+    response = client.get("/api/dashboard?parts=kpis,news,tickers&windows=2X")
+    assert response.status_code == 200
+    data = response.json()
+    assert set(data["parts"]) == {"kpis", "news"}
+    assert data["parts"]["kpis"] == client.get("/api/market/kpis").json()
+    assert data["errors"]["tickers"]["status"] == 400
+
+    etag = client.get("/api/dashboard").headers["etag"]
+    assert client.get("/api/dashboard", headers={"If-None-Match": etag}).status_code == 304
+    assert client.get("/api/dashboard?parts=kpis,weather").status_code == 400
+
+
+def test_openai_client_is_lazy(monkeypatch):
+    """키 없이도 import/기동, AI 호출 시점에만 오류"""
+    from app.core import clients
+    monkeypatch.setattr(clients, "_openai_client", None)
+    monkeypatch.setattr(clients.settings, "OPENAI_API_KEY", "")
+    with pytest.raises(RuntimeError):
+        clients.get_openai_client()
+
+    monkeypatch.setattr(clients.settings, "OPENAI_API_KEY", "sk-test")
+    first = clients.get_openai_client()
+    assert clients.get_openai_client() is first
+    asyncio.run(clients.close_openai_client())
+    assert clients._openai_client is None
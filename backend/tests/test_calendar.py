@@ -0,0 +1,109 @@
+"""캘린더 저장소 테스트"""
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+from app.services.calendar_store import CalendarStore, generate_seed_events, persist_events
+
+
+def _event(stamp, country="KR", importance="high", code="CPI", **extra):
+    return {"datetime": stamp, "indicator": code, "code": code, "country": country,
+            "importance": importance, "source": "test", **extra}
+
+
+def test_query_filters_and_pages_in_time_order():
+    calendar = CalendarStore()
+    calendar.loaded = True
+    calendar.upsert([
+        _event("2024-01-03 08:00"),
+        _event("2024-01-02 22:30", country="us"),
+        _event("2024-01-05 10:00", importance="low", code="PMI"),
+        _event("2024-01-04 09:00", country="US", importance="medium", code="NFP"),
+        _event("2024-02-01 08:00"),
+    ])
+    events, total = calendar.query("2024-01-01", "2024-01-31")
+    assert total == 4
+    assert [e["datetime"] for e in events] == sorted(e["datetime"] for e in events)
+
+    events, total = calendar.query("2024-01-01", "2024-01-31", countries=["us"])
+    assert total == 2 and {e["country"] for e in events} == {"US"}
+
+    events, total = calendar.query(None, None, importances=["high"], page=2, page_size=2)
+    assert total == 3 and [e["datetime"] for e in events] == ["2024-02-01 08:00"]
+    # 종료일만 주면 그날 전체 포함
+    assert calendar.query("2024-01-05", "2024-01-05")[1] == 1
+
+
+def test_upsert_replaces_same_event():
+    calendar = CalendarStore()
+    calendar.loaded = True
+    calendar.upsert([_event("2024-01-03 08:00", consensus=2.4)])
+    calendar.upsert([_event("2024-01-03 08:00", consensus=2.4, actual=2.6)])
+    events, total = calendar.query()
+    assert total == 1 and len(calendar) == 1
+    assert events[0]["surprise"] == 0.2
+
+
+def test_seed_spans_countries_and_hides_future_actuals():
+    now = datetime(2024, 6, 15, 12, 0)
+    events = generate_seed_events(now)
+    assert len(events) > 500
+    assert {e["country"] for e in events} >= {"KR", "US", "EU", "JP", "CN"}
+    assert all(e["actual"] is None for e in events if e["datetime"] > "2024-06-15 12:00")
+    assert generate_seed_events(now) == events
+
+
+def test_apply_skips_malformed_live_events_and_persists_accepted():
+    """발표 시각/지표명이 없는 실시간 일정은 건너뛰고, 반영된 일정만 저장"""
+    calendar = CalendarStore()
+    calendar.loaded = True
+    applied = calendar.apply([
+        {"indicator": "CPI (YoY)", "country": "US"},
+        {"datetime": "2024-01-16T08:00:00", "country": "US"},
+        {"datetime": "not a date", "indicator": "PMI"},
+        "garbage",
+        {"datetime": "2024-01-16T08:00:00", "indicator": "CPI (YoY)", "country": "us"},
+    ])
+    assert len(applied) == 1 and applied[0]["datetime"] == "2024-01-16 08:00"
+    assert calendar.query("2024-01-16", "2024-01-16")[1] == 1
+
+    class FakeCollection:
+        def __init__(self):
+            self.ops = []
+
+        async def bulk_write(self, ops, ordered=True):
+            self.ops.extend(ops)
+            return SimpleNamespace(upserted_count=len(ops), modified_count=0)
+
+    db = SimpleNamespace(calendar_events=FakeCollection())
+    assert asyncio.run(persist_events(applied, database=lambda: db)) == 1
+    assert len(db.calendar_events.ops) == 1
+
+    def no_database():
+        raise RuntimeError("데이터베이스가 초기화되지 않았습니다.")
+
+    assert asyncio.run(persist_events(applied, database=no_database)) == 0
+
+
+def test_dashboard_applies_and_persists_live_events(monkeypatch):
+    """대시보드도 개별 캘린더 엔드포인트처럼 검증을 통과한 실시간 일정만 저장"""
+    from app.services import dashboard
+    from app.services.live_adapters import LiveSnapshot
+
+    live = LiveSnapshot()
+    live.events = [
+        {"datetime": "2024-01-17T08:00:00", "indicator": "PPI (YoY)", "country": "US"},
+        {"indicator": "PPI (YoY)", "country": "US"},
+    ]
+    saved = []
+
+    async def fake_fan_out():
+        return live
+
+    async def fake_persist(events):
+        saved.extend(events)
+        return len(events)
+
+    monkeypatch.setattr(dashboard, "fan_out", fake_fan_out)
+    monkeypatch.setattr(dashboard, "persist_events", fake_persist)
+    asyncio.run(dashboard.resolve_dashboard(["kpis"]))
+    assert [e["datetime"] for e in saved] == ["2024-01-17 08:00"]
@@ -0,0 +1,46 @@
+"""파생 지표 엔진 테스트"""
+import numpy as np
+from app.services.derived import DerivedEngine, compute_change, shift_months
+from app.services.series_store import SeriesStore
+
+
+def _monthly_store():
+    target = SeriesStore()
+    dates = np.arange(np.datetime64("2020-01"), np.datetime64("2022-01")).astype("datetime64[D]")
+    target.put("IDX", dates, 100.0 + np.arange(24.0))
+    target.put("RATE", dates, np.r_[np.full(12, 1.0), np.full(12, 1.5)])
+    return target
+
+
+def test_mom_yoy_pct_and_diff():
+    engine = DerivedEngine(_monthly_store())
+    assert engine.latest("IDX", "mom") == round(1 / 122 * 100, 2)
+    assert engine.latest("IDX", "yoy") == round(12 / 111 * 100, 2)
+    # 금리는 %p 차분
+    assert engine.latest("RATE", "yoy", "diff") == 0.5
+    # 비교 대상이 없는 앞부분은 NaN
+    assert np.isnan(engine.changes("IDX", "yoy")[:12]).all()
+
+
+def test_append_recomputes_only_tail():
+    target = _monthly_store()
+    engine = DerivedEngine(target)
+    before = engine.changes("IDX", "yoy").copy()
+    target.append("IDX", ["2022-01-01", "2022-02-01"], [130.0, 131.0])
+
+    after = engine.changes("IDX", "yoy")
+    assert engine.full_computes == 1 and engine.tail_computes == 1
+    np.testing.assert_array_equal(after[:24], before)
+    series = target.get("IDX")
+    np.testing.assert_allclose(after, compute_change(series.dates, series.values, ("M", 12)), equal_nan=True)
+
+    # 시계열 교체(리비전)는 전체 재계산
+    target.merge("IDX", ["2021-06-01"], [0.0])
+    engine.changes("IDX", "yoy")
+    assert engine.full_computes == 2
+
+
+def test_shift_months_clamps_month_end():
+    dates = np.array(["2024-03-31", "2024-01-15"], dtype="datetime64[D]")
+    assert shift_months(dates, 1).tolist()[0].isoformat() == "2024-02-29"
+    assert shift_months(dates, 12).tolist()[1].isoformat() == "2023-01-15"
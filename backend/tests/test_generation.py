@@ -0,0 +1,71 @@
+"""문제/추천 대량 생성 (청크 동시 요청 + 근사 중복 제거) 테스트"""
+import asyncio
+import json
+from types import SimpleNamespace
+from app.core import clients
+from app.services import openai_svc, textsim
+
+
+def test_near_duplicate_detection():
+    assert textsim.similarity("CPI 가 상승하면 금리는?", "CPI가 상승하면, 금리는?") == 1.0
+    assert textsim.similarity("CPI 가 상승하면 금리는?", "환율이 오르면 수출은?") < 0.2
+    kept = textsim.dedupe(["기준금리란 무엇인가?", "GDP 디플레이터란?", "기준 금리란 무엇인가요?"], key=str)
+    assert kept == ["기준금리란 무엇인가?", "GDP 디플레이터란?"]
+    assert openai_svc.split_count(12, 5) == [4, 4, 4]
+    assert openai_svc.split_count(3, 5) == [3]
+
+
+TERMS = ["기준금리", "소비자물가", "실업률", "경상수지", "국내총생산", "환율", "통화량", "재정적자",
+         "무역수지", "근원물가", "국채금리", "산업생산"]
+
+
+def _question(part, i):
+    return f"{TERMS[(part - 1) * 4 + i]}의 정의와 측정 방법을 설명하시오"
+
+
+class ChunkCompletions:
+    """청크 요청마다 지연 후 문제 배열 스트림 (1번 묶음 문제를 2번 묶음이 거의 그대로 반복)"""
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+
+    async def create(self, messages, **kwargs):
+        prompt = messages[-1]["content"]
+        part = int(prompt.split("묶음 중 ")[1][0])
+        count = int(prompt.split("문제를 ")[1].split("개")[0])
+        questions = [_question(part, i) for i in range(count)]
+        if part == 2:
+            questions[0] = _question(1, 0).replace("설명하시오", "설명하시오!")
+        body = json.dumps({"problems": [{"question": q, "answer": "a", "explain": "e"} for q in questions]})
+
+        async def stream():
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            # 나중 묶음이 먼저 끝나도록 지연
+            await asyncio.sleep(0.02 * (4 - part))
+            self.active -= 1
+            for i in range(0, len(body), 16):
+                delta = SimpleNamespace(content=body[i:i + 16], tool_calls=None)
+                yield SimpleNamespace(choices=[SimpleNamespace(delta=delta)])
+        return stream()
+
+
+def test_parallel_problem_generation(monkeypatch):
+    completions = ChunkCompletions()
+    monkeypatch.setattr(clients, "_openai_client", SimpleNamespace(chat=SimpleNamespace(completions=completions)))
+    monkeypatch.setattr(openai_svc.settings, "GENERATION_CHUNK_SIZE", 4)
+    monkeypatch.setattr(openai_svc.settings, "GENERATION_CONCURRENCY", 2)
+
+    problems = asyncio.run(openai_svc.generate_problems("basic", "macro", 12, "free"))
+    questions = [p.question for p in problems]
+    # 청크 순서 고정, 2번 묶음의 근사 중복 제거
+    assert questions[:4] == [_question(1, i) for i in range(4)]
+    assert questions[4] == _question(2, 1)
+    assert len(questions) == 11 and completions.peak == 2
+
+    async def collect():
+        return [p.question async for p in openai_svc.stream_problems("basic", "macro", 12, "free")]
+    streamed = asyncio.run(collect())
+    # 스트림은 먼저 끝난 묶음부터 (근사 중복은 먼저 도착한 쪽을 남김)
+    assert streamed[0].endswith("!") and _question(1, 0) not in streamed and len(streamed) == 11
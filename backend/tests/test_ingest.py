@@ -0,0 +1,88 @@
+"""적재 파이프라인 / 증분 JSON 파서 테스트"""
+import json
+import numpy as np
+from app.services.json_stream import ArrayItemParser
+from app.services.ingest import IngestPipeline, parse_period, run
+from app.services import series_archive
+from app.services.series_store import SeriesStore
+
+
+def test_array_item_parser_handles_split_chunks():
+    """청크 경계가 문자열/객체 중간에 걸려도 원소가 닫히는 즉시 반환"""
+    text = json.dumps({"meta": "[not array]", "row": [{"a": "x}"}, {"a": 2}]})
+    parser = ArrayItemParser()
+    items = []
+    for i in range(0, len(text), 3):
+        items.extend(parser.feed(text[i:i + 3]))
+    assert items == [{"a": "x}"}, {"a": 2}]
+    assert parser.done
+
+
+def test_array_item_parser_keeps_items_before_broken_tail():
+    parser = ArrayItemParser()
+    items = parser.feed('{"problems": [{"q": 1}, {"q": 2}, {"q": ')
+    assert items == [{"q": 1}, {"q": 2}]
+    assert not parser.done
+
+
+def test_parse_period_formats():
+    assert parse_period("20240115") == (np.datetime64("2024-01-15"), "D")
+    assert parse_period("2024.03") == (np.datetime64("2024-03-01"), "M")
+    assert parse_period("2024Q3") == (np.datetime64("2024-07-01"), "Q")
+    assert parse_period("2024") == (np.datetime64("2024-01-01"), "A")
+
+
+def test_ingest_dedupes_revisions_and_scales_units(tmp_path):
+    """KOSIS 최종수정일 기준 최신 리비전 유지 + 단위 환산"""
+    path = tmp_path / "kosis.csv"
+    path.write_text(
+        "TBL_ID,ITM_ID,C1,PRD_DE,DT,UNIT_NM,LST_CHN_DE\n"
+        "DT_1,T1,0,202401,10,천원,2024-03-01\n"
+        "DT_1,T1,0,202401,9,천원,2024-02-01\n"
+        "DT_1,T1,0,202402,11,천원,2024-03-01\n",
+        encoding="utf-8",
+    )
+    target = SeriesStore()
+    pipeline, resolved = run([str(path)], "kosis", chunk_size=1, target=target, report=lambda _: None)
+    dates, values, freq = resolved["DT_1:T1:0"]
+    assert freq == "M"
+    assert values.tolist() == [10_000.0, 11_000.0]
+    assert pipeline.rows_read == 3
+    assert target.get("DT_1:T1:0").source == "통계청 KOSIS"
+
+
+def test_ingest_applies_each_chunk_and_keeps_latest_period_value(tmp_path):
+    """청크마다 저장소/아카이브에 바로 반영, 월 변환 시 늦게 읽은 이전 날짜가 덮어쓰지 않음"""
+    target = SeriesStore()
+    pipeline = IngestPipeline("krx", target=target, target_freq="M", archive_dir=str(tmp_path))
+    first = pipeline.feed([{"IDX_NM": "코스피", "BAS_DD": "20240131", "CLSPRC_IDX": "2,500.0"}])
+    assert first["KOSPI"][1].tolist() == [2500.0]
+    assert target.get("KOSPI").values.tolist() == [2500.0]
+
+    assert pipeline.feed([{"IDX_NM": "코스피", "BAS_DD": "20240115", "CLSPRC_IDX": "2,400.0"}]) == {}
+    pipeline.feed([{"IDX_NM": "코스피", "BAS_DD": "20240201", "CLSPRC_IDX": "2,600.0"}])
+    assert target.get("KOSPI").values.tolist() == [2500.0, 2600.0]
+
+    archived = series_archive.open_series(str(tmp_path), "KOSPI")
+    assert archived.values.tolist() == [2500.0, 2600.0]
+    dates, values, freq = pipeline.finish()["KOSPI"]
+    assert freq == "M" and values.tolist() == [2500.0, 2600.0]
+
+
+def test_ingest_keeps_archive_history_across_runs(tmp_path):
+    """두 번째 실행은 기존 아카이브를 이어받아 append / 병합 (히스토리를 지우지 않음)"""
+    root = str(tmp_path / "archive")
+    first = IngestPipeline("krx", target=SeriesStore(), archive_dir=root)
+    first.feed([
+        {"IDX_NM": "코스피", "BAS_DD": "20240102", "CLSPRC_IDX": "2,600.0"},
+        {"IDX_NM": "코스피", "BAS_DD": "20240103", "CLSPRC_IDX": "2,610.0"},
+    ])
+
+    target = SeriesStore()
+    second = IngestPipeline("krx", target=target, archive_dir=root)
+    second.feed([{"IDX_NM": "코스피", "BAS_DD": "20240104", "CLSPRC_IDX": "2,620.0"}])
+    assert series_archive.open_series(root, "KOSPI").values.tolist() == [2600.0, 2610.0, 2620.0]
+
+    second.feed([{"IDX_NM": "코스피", "BAS_DD": "20240103", "CLSPRC_IDX": "2,615.0"}])
+    assert series_archive.open_series(root, "KOSPI").values.tolist() == [2600.0, 2615.0, 2620.0]
+    assert target.get("KOSPI").values.tolist() == [2600.0, 2615.0, 2620.0]
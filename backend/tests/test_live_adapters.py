@@ -0,0 +1,73 @@
+"""실시간 소스 fan-out 테스트 (로컬 스텁 HTTP 서버)"""
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from app.services.live_adapters import HTTPJSONSource, fan_out
+from app.services.advanced_adapters import generate_extended_kpis
+
+
+PAYLOADS = {
+    "/fast": {"source": "한국거래소", "updated_at": "2024-01-15T09:00:00", "quotes": {"KOSPI": 2700.5}},
+    "/slow": {"source": "S&P", "quotes": {"SPX": 5000.0}},
+}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path == "/slow":
+            time.sleep(1.0)
+        if self.path == "/broken":
+            self.send_response(500)
+            self.end_headers()
+            return
+        body = json.dumps(PAYLOADS[self.path]).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def stub_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+def test_fan_out_returns_partial_result_within_deadline(stub_url):
+    """느린 소스는 timeout 처리되고 나머지 소스 결과로 조립"""
+    sources = [
+        HTTPJSONSource("krx", f"{stub_url}/fast", timeout=0.5),
+        HTTPJSONSource("sp", f"{stub_url}/slow", timeout=0.2),
+        HTTPJSONSource("bad", f"{stub_url}/broken", timeout=0.5),
+    ]
+
+    async def run():
+        async with httpx.AsyncClient() as client:
+            started = time.perf_counter()
+            snapshot = await fan_out(sources, client)
+            return snapshot, time.perf_counter() - started
+
+    snapshot, elapsed = asyncio.run(run())
+    assert elapsed < 0.8
+    assert snapshot.status == {"krx": "ok", "sp": "timeout", "bad": "error"}
+    assert snapshot.quote("KOSPI")["value"] == 2700.5
+    assert snapshot.quote("SPX") is None
+
+    data = generate_extended_kpis(snapshot)
+    assert data.kospi.value == 2700.5
+    assert data.kospi.source == "한국거래소"
+    assert data.kospi.updated_at.isoformat() == "2024-01-15T09:00:00"
+    assert data.spx.source == "S&P"
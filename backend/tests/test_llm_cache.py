@@ -0,0 +1,135 @@
+"""LLM 응답 캐시 테스트 (MongoDB 미연결 → 메모리 단계만 사용)"""
+import asyncio
+import json
+from types import SimpleNamespace
+from fastapi.testclient import TestClient
+from app.main import app
+from app.core import clients
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.services import ai_advanced
+from app.services.llm_cache import make_key, normalize_prompt
+from app.services.semantic_cache import SemanticCache
+
+client = TestClient(app)
+
+
+class CountingCompletions:
+    """호출 수를 세는 가짜 OpenAI (stream 여부에 맞춰 응답)"""
+
+    def __init__(self, content):
+        self.content = content
+        self.calls = 0
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        if isinstance(self.content, Exception):
+            raise self.content
+        if not kwargs.get("stream"):
+            message = SimpleNamespace(content=self.content)
+            return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+        async def stream():
+            for part in (self.content[:5], self.content[5:]):
+                yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=part))])
+        return stream()
+
+
+def _use(monkeypatch, completions):
+    monkeypatch.setattr(clients, "_openai_client", SimpleNamespace(chat=SimpleNamespace(completions=completions)))
+
+
+def test_prompt_normalization():
+    assert normalize_prompt("CPI 가 뭐야?") == normalize_prompt("cpi가  뭐야 !")
+    assert normalize_prompt("ＣＰＩ　2.5%") == normalize_prompt("cpi 2.5%")
+    assert normalize_prompt("1 2") != normalize_prompt("12")
+    assert make_key("whatif", {"question": "기준금리를 -1% 인하하면?"}) != make_key("whatif", {"question": "기준금리를 +1% 인하하면?"})
+    assert normalize_prompt("기준금리를 -1%") != normalize_prompt("기준금리를 1%")
+    assert len({normalize_prompt(text) for text in ("1/2", "1-2", "1 2", "1*2")}) == 4
+    assert make_key("qa_chat", {"question": "금리 전망?"}) == make_key("qa_chat", {"question": "금리  전망"})
+    assert make_key("qa_chat", {"question": "금리"}) != make_key("qa_summary", {"question": "금리"})
+
+
+def test_stream_and_plain_share_entry(monkeypatch):
+    completions = CountingCompletions("- 물가 상승 [출처: 통계청]")
+    _use(monkeypatch, completions)
+    before = metrics.get("llm_cache.qa_summary.memory_hits")
+
+    lines = client.post("/api/qa/summary/stream?format=ndjson", json={"question": "물가 요약"}).text.splitlines()
+    assert json.loads(lines[-1])["data"]["cached"] is False
+
+    # 공백/문장부호만 다른 같은 질문은 OpenAI 호출 없이 캐시 응답
+    response = client.post("/api/qa/summary", json={"question": "물가  요약?"})
+    assert response.json()["citations"] == ["통계청"]
+    lines = client.post("/api/qa/summary/stream?format=ndjson", json={"question": "물가 요약"}).text.splitlines()
+    assert [json.loads(line)["event"] for line in lines] == ["delta", "citations", "done"]
+    assert json.loads(lines[-1])["data"]["cached"] is True
+    assert completions.calls == 1
+    assert metrics.get("llm_cache.qa_summary.memory_hits") - before == 2
+
+    # 우회 헤더
+    client.post("/api/qa/summary", json={"question": "물가 요약"}, headers={"X-LLM-Cache": "bypass"})
+    client.post("/api/qa/summary", json={"question": "물가 요약"}, headers={"Cache-Control": "no-cache"})
+    assert completions.calls == 3
+    assert "qa_summary" in client.get("/api/health/metrics").json()["llm_cache"]
+
+
+def test_failures_are_not_cached(monkeypatch):
+    _use(monkeypatch, CountingCompletions(RuntimeError("503")))
+    fallback = asyncio.run(ai_advanced.generate_chart_from_query("금리와 물가"))
+    assert "오류" in fallback.explanation
+
+    completions = CountingCompletions(json.dumps({"chart_type": "bar", "title": "금리와 물가"}))
+    _use(monkeypatch, completions)
+    first = asyncio.run(ai_advanced.generate_chart_from_query("금리와 물가"))
+    second = asyncio.run(ai_advanced.generate_chart_from_query("금리와  물가"))
+    assert first.chart_type == second.chart_type == "bar"
+    assert completions.calls == 1
+
+
+def test_semantic_cache_serves_paraphrases(monkeypatch):
+    completions = CountingCompletions("금리 인상은 물가 안정을 위한 조치입니다.")
+    _use(monkeypatch, completions)
+
+    first = client.post("/api/qa/chat", json={"question": "기준금리가 왜 올랐나요?"}).json()
+    for question in ("기준금리 왜 올랐어?", "기준금리가 오른 이유"):
+        response = client.post("/api/qa/chat", json={"question": question})
+        assert response.json()["answer_md"] == first["answer_md"]
+    assert completions.calls == 1
+
+    # 숫자가 다르거나 참고 자료가 있으면 재사용하지 않음
+    client.post("/api/qa/chat", json={"question": "기준금리 2% 인상 효과"})
+    client.post("/api/qa/chat", json={"question": "기준금리 3% 인상 효과"})
+    client.post("/api/qa/chat", json={"question": "기준금리 왜 올랐어?", "context": "2024년 통화정책 보고서"})
+    assert completions.calls == 4
+
+    # 관리자 API 는 토큰이 설정되어 있을 때만, 맞는 헤더로 열림
+    assert client.get("/api/admin/semantic-cache").status_code == 404
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", "secret")
+    assert client.get("/api/admin/semantic-cache").status_code == 401
+    report = client.get(
+        "/api/admin/semantic-cache", params={"endpoint": "qa_chat"}, headers={"X-Admin-Token": "secret"}
+    ).json()["qa_chat"]
+    assert report["entries"] == 3 and report["largest_cluster"] == 3
+    assert report["clusters"][0]["paraphrases"] == ["기준금리 왜 올랐어?", "기준금리가 오른 이유"]
+
+    # 한 단어만 반대/다른 질문은 n-gram 유사도가 높아도 재사용하지 않음
+    for question, opposite in (
+        ("기준금리 인상 효과는?", "기준금리 인하 효과는?"),
+        ("CPI 상승이 금리에 미치는 영향", "CPI 하락이 금리에 미치는 영향"),
+        ("미국 기준금리 전망", "한국 기준금리 전망"),
+        ("기준금리를 1% 올리면?", "기준금리를 -1% 올리면?"),
+    ):
+        calls = completions.calls
+        client.post("/api/qa/chat", json={"question": question})
+        client.post("/api/qa/chat", json={"question": opposite})
+        assert completions.calls == calls + 2, opposite
+
+
+def test_semantic_index_scales_by_buckets():
+    index = SemanticCache("test", max_entries=1000)
+    for i in range(1200):
+        index.store(f"{i}번째 지표 동향 설명", i, ttl=60)
+    assert len(index) == 1000 and index.stats()["entries"] == 1000
+    assert index.lookup("1199번째 지표의 동향 설명") == 1199
+    assert index.lookup("0번째 지표 동향 설명") is None  # 오래된 항목부터 제거
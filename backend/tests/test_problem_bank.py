@@ -0,0 +1,211 @@
+"""문제 은행 테스트 (MongoDB 컬렉션은 메모리 대체)"""
+import asyncio
+import json
+from types import SimpleNamespace
+from pymongo.errors import DuplicateKeyError
+from fastapi.testclient import TestClient
+from app.main import app
+from app.core import clients
+from app.models.common import ProblemItem
+from app.services import problem_bank as bank_module
+from app.services.problem_bank import ProblemBank
+
+client = TestClient(app)
+
+
+def _matches(doc, query):
+    for field, condition in query.items():
+        value = doc.get(field)
+        if isinstance(condition, dict):
+            for op, operand in condition.items():
+                if op == "$lt" and not value < operand:
+                    return False
+                if op == "$gte" and not value >= operand:
+                    return False
+                if op == "$in" and value not in operand:
+                    return False
+                if op == "$nin" and value in operand:
+                    return False
+        elif value != condition:
+            return False
+    return True
+
+
+class FakeCursor:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def sort(self, keys):
+        for field, direction in reversed(keys):
+            self.docs.sort(key=lambda doc: (doc.get(field) is not None, doc.get(field) or 0), reverse=direction < 0)
+        return self
+
+    def limit(self, count):
+        self.docs = self.docs[:count]
+        return self
+
+    async def to_list(self, length):
+        return [dict(doc) for doc in self.docs]
+
+
+class FakeCollection:
+    def __init__(self):
+        self.docs = {}
+
+    async def create_index(self, keys):
+        return "_".join(field for field, _ in keys)
+
+    def find(self, query, projection=None):
+        return FakeCursor([doc for doc in self.docs.values() if _matches(doc, query)])
+
+    async def insert_one(self, doc):
+        if doc["_id"] in self.docs:
+            raise DuplicateKeyError("duplicate")
+        self.docs[doc["_id"]] = dict(doc)
+
+    async def find_one_and_update(self, query, update, sort=None, return_document=None):
+        docs = FakeCursor([doc for doc in self.docs.values() if _matches(doc, query)]).sort(sort or []).docs
+        if not docs:
+            return None
+        doc = docs[0]
+        for field, amount in update.get("$inc", {}).items():
+            doc[field] = doc.get(field, 0) + amount
+        doc.update(update.get("$set", {}))
+        return dict(doc)
+
+    async def count_documents(self, query):
+        return sum(1 for doc in self.docs.values() if _matches(doc, query))
+
+    async def delete_many(self, query):
+        ids = [key for key, doc in self.docs.items() if _matches(doc, query)]
+        for key in ids:
+            del self.docs[key]
+        return SimpleNamespace(deleted_count=len(ids))
+
+
+TOPICS = ["물가", "금리", "환율", "실업", "무역수지", "국채", "통화량", "재정적자", "성장률", "소비심리"]
+
+
+def _problem(term):
+    return ProblemItem(question=f"{term} 지표가 의미하는 바는?", options=["가", "나", "다", "라"], answer="가", explain=term)
+
+
+def test_draw_rotates_least_served(monkeypatch):
+    collection = FakeCollection()
+    bank = ProblemBank(database=lambda: {"problem_bank": collection})
+    monkeypatch.setattr(bank_module.settings, "PROBLEM_BANK_MAX_SERVES", 2)
+
+    async def scenario():
+        await bank.ensure_indexes()
+        problems = [_problem(term) for term in TOPICS[:6]]
+        # 공백/문장부호만 다른 문제와 근사 중복은 저장하지 않음
+        problems += [_problem("물가 "), ProblemItem(question="금리 지표가 의미하는 바는 ?", answer="가", explain="")]
+        assert await bank.add("basic", "macro", "mcq", problems) == 6
+
+        first = await bank.draw("basic", "macro", "mcq", 3)
+        second = await bank.draw("basic", "macro", "mcq", 3)
+        assert not {p.question for p in first} & {p.question for p in second}
+        assert len(await bank.draw("basic", "macro", "mcq", 6)) == 6
+
+        # 출제 한도에 도달한 문제는 더 이상 출제하지 않고 폐기
+        assert await bank.draw("basic", "macro", "mcq", 3) == []
+        assert await bank.retire() == 6
+
+    asyncio.run(scenario())
+
+
+def test_concurrent_draws_do_not_overlap_and_outage_falls_back(monkeypatch):
+    collection = FakeCollection()
+    bank = ProblemBank(database=lambda: {"problem_bank": collection})
+
+    async def scenario():
+        await bank.ensure_indexes()
+        await bank.add("basic", "macro", "mcq", [_problem(term) for term in TOPICS])
+        draws = await asyncio.gather(*(bank.draw("basic", "macro", "mcq", 2) for _ in range(5)))
+        questions = [p.question for problems in draws for p in problems]
+        assert len(questions) == 10 and len(set(questions)) == 10
+
+        # MongoDB 가 응답하지 않으면 타임아웃 후 빈 목록 (요청은 즉시 생성으로 대체)
+        async def hang(*args, **kwargs):
+            await asyncio.sleep(10)
+
+        monkeypatch.setattr(collection, "find_one_and_update", hang)
+        monkeypatch.setattr(bank_module.settings, "PROBLEM_BANK_MONGO_TIMEOUT", 0.05)
+        assert await bank.draw("basic", "macro", "mcq", 3) == []
+
+    asyncio.run(scenario())
+
+
+def test_disabled_or_unprepared_bank_is_not_queried(monkeypatch):
+    """은행이 꺼져 있거나 인덱스가 준비되지 않았으면 MongoDB 를 조회하지 않고 빈 목록"""
+    collection = FakeCollection()
+    bank = ProblemBank(database=lambda: {"problem_bank": collection})
+    queried = []
+
+    async def find_one_and_update(*args, **kwargs):
+        queried.append(args)
+
+    monkeypatch.setattr(collection, "find_one_and_update", find_one_and_update)
+
+    async def scenario():
+        assert await bank.draw("basic", "macro", "mcq", 3) == []
+        await bank.ensure_indexes()
+        monkeypatch.setattr(bank_module.settings, "PROBLEM_BANK_ENABLED", False)
+        assert await bank.draw("basic", "macro", "mcq", 3) == []
+
+    asyncio.run(scenario())
+    assert queried == []
+
+
+def test_refill_generates_only_the_emptiest_buckets_per_pass(monkeypatch):
+    collection = FakeCollection()
+    bank = ProblemBank(database=lambda: {"problem_bank": collection})
+    monkeypatch.setattr(bank_module.settings, "PROBLEM_BANK_LOW_WATERMARK", 4)
+    monkeypatch.setattr(bank_module.settings, "PROBLEM_BANK_TARGET", 4)
+    monkeypatch.setattr(bank_module.settings, "PROBLEM_BANK_REFILL_BUCKETS", 1)
+    generated = []
+
+    async def generate(level, topic, count, style):
+        generated.append((topic, count))
+        return [_problem(f"{topic} {term}") for term in TOPICS[:count]]
+
+    monkeypatch.setattr(bank_module, "generate_unique_problems", generate)
+    buckets = [("basic", "macro", "mcq"), ("basic", "finance", "mcq")]
+
+    async def scenario():
+        await bank.add("basic", "macro", "mcq", [_problem(term) for term in TOPICS[:2]])
+        assert await bank.refill(buckets) == {"basic:finance:mcq": 4}
+        assert await bank.refill(buckets) == {"basic:macro:mcq": 2}
+
+    asyncio.run(scenario())
+    assert generated == [("finance", 4), ("macro", 2)]
+
+
+def test_refill_fills_low_buckets_and_router_uses_bank(monkeypatch):
+    collection = FakeCollection()
+    monkeypatch.setattr(bank_module.problem_bank, "_database", lambda: {"problem_bank": collection})
+    monkeypatch.setattr(bank_module.problem_bank, "ready", True)
+    monkeypatch.setattr(bank_module.settings, "PROBLEM_BANK_LOW_WATERMARK", 4)
+    monkeypatch.setattr(bank_module.settings, "PROBLEM_BANK_TARGET", 6)
+    monkeypatch.setattr(bank_module.settings, "GENERATION_CHUNK_SIZE", 10)
+    monkeypatch.setattr(bank_module.settings, "PROBLEM_TEMPLATE_SHARE", 0)
+
+    class Completions:
+        calls = 0
+
+        async def create(self, **kwargs):
+            Completions.calls += 1
+            content = json.dumps({"problems": [_problem(term).model_dump() for term in TOPICS]}, ensure_ascii=False)
+
+            async def stream():
+                yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=content))])
+            return stream()
+
+    monkeypatch.setattr(clients, "_openai_client", SimpleNamespace(chat=SimpleNamespace(completions=Completions())))
+    added = asyncio.run(bank_module.problem_bank.refill([("basic", "macro", "mcq")]))
+    assert added == {"basic:macro:mcq": 6} and Completions.calls == 1
+
+    # 은행에 있는 만큼은 생성 없이 출제, 부족분만 생성
+    response = client.post("/api/problems", json={"level": "basic", "topic": "macro", "count": 8, "style": "mcq"})
+    assert len(response.json()["items"]) == 8
+    assert Completions.calls == 2
@@ -0,0 +1,60 @@
+"""템플릿 계산 문제 테스트"""
+import random
+import re
+from fastapi.testclient import TestClient
+from app.main import app
+from app.core import clients
+from app.services import problem_templates
+from app.services.problem_templates import TEMPLATES, generate_template_problems, template_count
+from app.services.series_store import SeriesStore
+
+
+def _numbers(text):
+    return [float(n.replace(",", "")) for n in re.findall(r"-?[\d,]+\.\d+", text)]
+
+
+def test_every_template_has_four_distinct_options_with_answer():
+    store, rng = SeriesStore(), random.Random(7)
+    for template in TEMPLATES:
+        for _ in range(20):
+            problem = template["build"](store, rng)
+            assert len(set(problem.options)) == 4 and problem.answer in problem.options
+
+
+def test_answers_are_computed_from_series_values():
+    store, rng = SeriesStore(), random.Random(3)
+    spread = problem_templates.yield_spread(store, rng)
+    long_rate, short_rate = _numbers(spread.question)
+    assert spread.answer == f"{(long_rate - short_rate) * 100:.0f}bp"
+
+    real = problem_templates.real_rate(store, rng)
+    rate, inflation, _ = _numbers(real.question)
+    assert abs(float(real.answer.rstrip("%p")) - (rate - inflation)) <= 0.011
+
+    misery = problem_templates.misery_index(store, rng)
+    inflation, unemployment = _numbers(misery.question)
+    assert misery.answer == f"{inflation + unemployment:.2f}"
+
+
+def test_reference_period_window_scales_with_frequency():
+    """분기 지표는 최근 8분기 (월별 24개월과 같은 기간) 안에서만 기준 시점을 고름"""
+    store, rng = SeriesStore(), random.Random(5)
+    gdp = store.ensure("GDP")
+    recent = set(gdp.labels(gdp.dates[-8:]))
+    labels = {problem_templates._observation(store, "GDP", rng, 4)[0][0] for _ in range(50)}
+    assert labels <= recent and len(labels) > 1
+
+
+def test_generate_respects_topic_level_and_share():
+    problems = generate_template_problems("intermediate", "finance", 3, rng=random.Random(1))
+    assert len(problems) == 3 and len({p.question for p in problems}) == 3
+    assert generate_template_problems("advanced", "trade", 3) == []
+    assert template_count(5, "mcq", 0.4) == 2 and template_count(5, "free", 0.4) == 0
+
+
+def test_problems_endpoint_serves_template_share_without_llm(monkeypatch):
+    monkeypatch.setattr(clients, "_openai_client", None)
+    monkeypatch.setattr(problem_templates.settings, "PROBLEM_TEMPLATE_SHARE", 1.0)
+    response = TestClient(app).post("/api/problems", json={"level": "intermediate", "topic": "finance", "count": 4})
+    items = response.json()["items"]
+    assert len(items) == 4 and all(item["answer"] in item["options"] for item in items)
@@ -0,0 +1,61 @@
+"""자료 카탈로그 (BM25) 추천 테스트"""
+import asyncio
+import json
+from types import SimpleNamespace
+from fastapi.testclient import TestClient
+from app.main import app
+from app.core import clients
+from app.services import openai_svc
+from app.services.resource_catalog import ResourceCatalog, index_terms
+
+client = TestClient(app)
+
+
+def test_index_terms_split_korean_compounds():
+    assert {"기준금리", "금리"} <= set(index_terms("기준금리가"))
+
+
+def test_catalog_ranks_by_topic_level_and_purpose():
+    catalog = ResourceCatalog()
+    catalog.load([
+        {"title": "무역 통계", "summary": "수출입 실적", "url": "https://a", "tags": ["데이터"], "levels": ["advanced"], "purposes": ["data"]},
+        {"title": "무역 입문 강의", "summary": "수출과 수입의 기초", "url": "https://b", "tags": ["강의"], "levels": ["beginner"], "purposes": ["study"]},
+        {"title": "물가 보고서", "summary": "소비자물가 동향", "url": "https://c", "tags": ["보고서"], "levels": ["beginner"], "purposes": ["study"]},
+        {"title": "중복", "summary": "", "url": "https://a"},
+    ])
+    assert len(catalog) == 3
+    assert [item.url for item in catalog.search("무역 수출", "advanced", "data", 3)] == ["https://a", "https://b", "https://c"]
+    assert [item.url for item in catalog.search("무역 수출", "beginner", "study", 2)] == ["https://b", "https://a"]
+    # 겹치는 단어가 없으면 목적/수준 일치 순
+    assert catalog.search("zzz", "beginner", "study", 1)[0].url == "https://b"
+
+
+def test_recommend_endpoint_is_local_and_deterministic(monkeypatch):
+    monkeypatch.setattr(clients, "_openai_client", None)
+    body = {"topic": "환율과 수출", "level": "intermediate", "purpose": "data", "count": 5}
+    first = client.post("/api/recommend", json=body).json()["items"]
+    assert len(first) == 5 and first == client.post("/api/recommend", json=body).json()["items"]
+    assert "무역" in first[0]["title"] or "수출" in first[0]["summary"]
+
+
+def test_optional_llm_rerank(monkeypatch):
+    class Completions:
+        def __init__(self, content):
+            self.content = content
+
+        async def create(self, **kwargs):
+            if isinstance(self.content, Exception):
+                raise self.content
+            return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=self.content))])
+
+    monkeypatch.setattr(openai_svc.settings, "RECOMMEND_LLM_RERANK", True)
+    monkeypatch.setattr(openai_svc.settings, "OPENAI_API_KEY", "test")
+    baseline = openai_svc.catalog.search("금리", "beginner", "study", 3)
+
+    monkeypatch.setattr(clients, "_openai_client", SimpleNamespace(chat=SimpleNamespace(completions=Completions(RuntimeError("503")))))
+    assert asyncio.run(openai_svc.generate_recommendations("금리", "beginner", "study", 3)) == baseline
+
+    completions = Completions(json.dumps({"order": [2, 0, 99]}))
+    monkeypatch.setattr(clients, "_openai_client", SimpleNamespace(chat=SimpleNamespace(completions=completions)))
+    reranked = asyncio.run(openai_svc.generate_recommendations("금리", "beginner", "study", 3))
+    assert reranked == [baseline[2], baseline[0], baseline[1]]
@@ -0,0 +1,98 @@
+"""시계열 저장소 테스트"""
+import asyncio
+import os
+import numpy as np
+import pytest
+from app.services import series_archive
+from app.services.series_store import SeriesStore, store
+from app.services.tools import get_series
+
+
+def test_slice_is_inclusive_view():
+    """start/end 범위 조회는 양 끝을 포함하는 view"""
+    s = SeriesStore()
+    dates = np.arange(np.datetime64("2020-01"), np.datetime64("2021-01")).astype("datetime64[D]")
+    series = s.put("X", dates, np.arange(12.0))
+    d, v = series.slice("2020-03-01", "2020-05-01")
+    assert v.tolist() == [2.0, 3.0, 4.0]
+    assert np.shares_memory(v, series.values)
+    assert series.labels(d) == ["2020-03", "2020-04", "2020-05"]
+
+
+def test_put_bumps_revision_and_version():
+    s = SeriesStore()
+    s.put("X", ["2020-02-01", "2020-01-01"], [2.0, 1.0])
+    version = s.version
+    series = s.put("X", ["2020-01-01"], [1.5])
+    assert series.revision == 1
+    assert s.version == version + 1
+    assert s.get("X").values.tolist() == [1.5]
+
+
+def test_get_series_reads_from_store():
+    """get_series 는 요청 구간만 잘라서 반환하고, 같은 지표는 항상 같은 값"""
+    result = asyncio.run(get_series(["CPI_YOY", "POLICY_RATE"], start="2004-01-01", end="2023-12-31"))
+    cpi = result["data"]["CPI_YOY"]
+    assert len(cpi) == 20 * 12
+    assert cpi[0]["date"] == "2004-01" and cpi[-1]["date"] == "2023-12"
+    assert cpi == store.to_points("CPI_YOY", "2004-01-01", "2023-12-31")
+
+
+def test_archive_roundtrip_is_memory_mapped(tmp_path):
+    """아카이브는 memmap view 로 열리고, append 후 다시 열면 새 레코드가 보인다"""
+    dates = np.arange(np.datetime64("2000-01-01"), np.datetime64("2002-01-01"))
+    values = np.arange(len(dates), dtype=np.float64)
+    series_archive.write_series(str(tmp_path), "USD/KRW", dates, values, freq="D")
+
+    series = series_archive.open_series(str(tmp_path), "USD/KRW")
+    d, v = series.slice("2001-06-01", "2001-06-03")
+    assert d.tolist()[0].isoformat() == "2001-06-01"
+    assert len(v) == 3 and np.shares_memory(v, series._records)
+    assert series.bounds("1999-01-01", "2100-01-01") == (0, len(dates))
+
+    series_archive.append(str(tmp_path), "USD/KRW", ["2002-01-01"], [-1.0])
+    target = SeriesStore()
+    assert series_archive.load_archive(str(tmp_path), target) == 1
+    assert target.get("USD/KRW").values[-1] == -1.0
+
+
+def test_archive_append_rejects_old_dates(tmp_path):
+    series_archive.write_series(str(tmp_path), "X", ["2020-01-01"], [1.0])
+    with pytest.raises(ValueError):
+        series_archive.append(str(tmp_path), "X", ["2019-12-01"], [0.5])
+
+
+def test_archived_series_append_writes_through_and_stays_mapped(tmp_path):
+    """저장소 append 는 아카이브 파일에 기록되고, 시계열은 계속 memmap view"""
+    series_archive.write_series(str(tmp_path), "X", ["2020-01-01", "2020-02-01"], [1.0, 2.0])
+    target = SeriesStore()
+    series_archive.load_archive(str(tmp_path), target)
+
+    series = target.append("X", ["2020-03-01"], [3.0])
+    assert series.values.tolist() == [1.0, 2.0, 3.0]
+    assert isinstance(series._records, np.memmap) and np.shares_memory(series.values, series._records)
+    assert series.bounds("2020-03-01", None) == (2, 3)
+    assert series_archive.open_series(str(tmp_path), "X").values.tolist() == [1.0, 2.0, 3.0]
+    with pytest.raises(ValueError):
+        target.append("X", ["2020-02-15"], [0.0])
+
+
+def test_archive_rewrite_commits_through_index(tmp_path):
+    """짧게 재작성해도 기존 매핑은 유지되고, 인덱스는 항상 자기 데이터 파일과 일치"""
+    root = str(tmp_path)
+    series_archive.write_series(root, "X", ["2020-01-01", "2020-02-01", "2020-03-01"], [1.0, 2.0, 3.0])
+    before = series_archive.open_series(root, "X")
+
+    meta = series_archive.write_series(root, "X", ["2021-01-01"], [9.0])
+    data_path, _ = series_archive.archive_paths(root, "X", meta)
+    assert os.path.getsize(data_path) == meta["count"] * series_archive.RECORD_DTYPE.itemsize
+    assert sorted(f for f in os.listdir(root) if f.endswith(".bin")) == [os.path.basename(data_path)]
+    assert before.values.tolist() == [1.0, 2.0, 3.0]
+    assert series_archive.open_series(root, "X").values.tolist() == [9.0]
+
+    # 인덱스가 데이터 파일보다 큰 레코드 수를 가리키면 매핑하지 않음
+    with open(data_path, "r+b") as f:
+        f.truncate(0)
+    with pytest.raises(ValueError):
+        series_archive.open_series(root, "X")
+    assert series_archive.load_archive(root, SeriesStore()) == 0
@@ -0,0 +1,69 @@
+"""요청 병합 (single-flight) 테스트"""
+import asyncio
+import pytest
+from app.core.metrics import metrics
+from app.core.singleflight import SingleFlight, normalize_key, singleflight
+
+
+def test_concurrent_calls_share_one_computation():
+    calls = []
+
+    @singleflight("test_share")
+    async def work(question: str):
+        calls.append(question)
+        await asyncio.sleep(0.01)
+        return {"answer": question}
+
+    async def main():
+        joins = metrics.get("singleflight.test_share.joins")
+        results = await asyncio.gather(work("CPI 란?"), work("  cpi   란? "), work("GDP 란?"))
+        assert results[0] is results[1] and results[2] == {"answer": "GDP 란?"}
+        assert metrics.get("singleflight.test_share.joins") - joins == 1
+        # 끝난 계산은 저장하지 않음
+        await work("CPI 란?")
+        assert len(calls) == 3 and work.flight.inflight == 0
+
+    asyncio.run(main())
+    assert normalize_key({"b": [1, "X "], "a": None}) == (("a", None), ("b", (1, "x")))
+
+
+def test_cancellation_and_errors():
+    flight = SingleFlight("test_cancel")
+    started = []
+
+    async def slow(value):
+        started.append(value)
+        await asyncio.sleep(0.05)
+        return value
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    async def main():
+        # 먼저 온 호출자가 취소돼도 합류한 호출자는 결과를 받음
+        leader = asyncio.create_task(flight.do("k", slow, 1))
+        await asyncio.sleep(0)
+        joiner = asyncio.create_task(flight.do("k", slow, 2))
+        await asyncio.sleep(0)
+        leader.cancel()
+        assert await joiner == 1 and started == [1]
+
+        # 모두 취소되면 계산도 취소
+        only = asyncio.create_task(flight.do("k", slow, 3))
+        await asyncio.sleep(0)
+        only.cancel()
+        await asyncio.sleep(0.01)
+        assert flight.inflight == 0
+
+        # 취소 직후 (계산 Task 가 아직 정리되기 전) 같은 키 호출은 새로 실행
+        cancelled = asyncio.create_task(flight.do("k", slow, 4))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        await asyncio.sleep(0)
+        assert await flight.do("k", slow, 5) == 5
+
+        results = await asyncio.gather(flight.do("e", fail), flight.do("e", fail), return_exceptions=True)
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    asyncio.run(main())
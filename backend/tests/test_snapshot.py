@@ -0,0 +1,95 @@
+"""스냅샷 캐시 / 조건부 요청 / 압축 테스트"""
+import orjson
+from fastapi.testclient import TestClient
+from app.main import app
+from app.core.metrics import metrics
+from app.models.common import TimeSeriesPoint
+from app.services.snapshot import SnapshotCache
+
+
+def test_snapshot_rebuilds_only_on_version_change():
+    cache = SnapshotCache(max_entries=2)
+    calls = []
+
+    def build():
+        calls.append(1)
+        return TimeSeriesPoint(date="2024-01", value=len(calls))
+
+    first = cache.get(("trends",), "s1", build)
+    assert orjson.loads(first.body) == {"date": "2024-01", "value": 1.0}
+    assert cache.get(("trends",), "s1", build) is first
+    assert orjson.loads(cache.get(("trends",), "s2", build).body)["value"] == 2.0
+    assert (cache.hits, cache.builds) == (1, 2)
+
+    # 용량 초과 시 가장 오래된 키 제거
+    cache.get(("a",), "s2", build)
+    cache.get(("b",), "s2", build)
+    cache.get(("trends",), "s2", build)
+    assert cache.builds == 5
+
+
+def test_snapshot_reads_version_after_build():
+    """build 중에 버전이 올라가면 올라간 버전으로 저장 (워밍업 직후 재조립 없음)"""
+    cache = SnapshotCache()
+    state = {"version": 1}
+
+    def build():
+        state["version"] += 1
+        return {"value": state["version"]}
+
+    version = lambda: f"s{state['version']}"
+    first = cache.get(("kpis",), version, build)
+    assert first.version == "s2"
+    assert cache.get(("kpis",), version, build) is first
+    assert cache.builds == 1
+
+
+def test_market_endpoints_honor_conditional_requests():
+    client = TestClient(app)
+    first = client.get("/api/market/tickers")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"].startswith("public")
+
+    second = client.get("/api/market/tickers", headers={"If-None-Match": etag})
+    assert second.status_code == 304 and second.content == b""
+    assert second.headers["etag"] == etag
+
+    by_date = client.get("/api/market/tickers", headers={"If-Modified-Since": first.headers["last-modified"]})
+    assert by_date.status_code == 304
+    # If-None-Match 가 우선
+    stale = client.get("/api/market/tickers", headers={
+        "If-None-Match": '"other"', "If-Modified-Since": first.headers["last-modified"],
+    })
+    assert stale.status_code == 200
+
+
+def test_snapshot_serves_stored_compressed_variant():
+    client = TestClient(app)
+    metrics.reset()
+    first = client.get("/api/market/kpis/extended", headers={"Accept-Encoding": "gzip"})
+    second = client.get("/api/market/kpis/extended", headers={"Accept-Encoding": "gzip"})
+    assert first.headers["content-encoding"] == "gzip"
+    assert first.headers["etag"].endswith('-gzip"')
+    assert first.json() == second.json()
+    counters = metrics.snapshot("compression.gzip")
+    assert counters["compression.gzip.responses"] == 1
+    assert counters["compression.gzip.precompressed_hits"] >= 1
+
+    # 다른 인코딩으로 받은 ETag 로도 304
+    plain = client.get("/api/market/kpis/extended", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+    revalidated = client.get("/api/market/kpis/extended", headers={
+        "Accept-Encoding": "identity", "If-None-Match": first.headers["etag"],
+    })
+    assert revalidated.status_code == 304
+
+
+def test_middleware_compresses_large_bodies_only():
+    client = TestClient(app)
+    large = client.get("/api/market/series/KOSPI/rolling?stats=sma,std", headers={"Accept-Encoding": "gzip"})
+    assert large.headers["content-encoding"] == "gzip"
+    assert int(large.headers["content-length"]) < len(large.content)
+    small = client.get("/api/health", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in small.headers
+    assert client.get("/api/health/metrics").json()["compression"]["gzip"]["ratio"] < 1
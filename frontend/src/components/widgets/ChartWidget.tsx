@@ -11,15 +11,23 @@ interface ChartWidgetProps {
 }
 
 export default function ChartWidget({ widget, onBookmark, onAddToReport }: ChartWidgetProps) {
-  const { id, spec, data, title, source } = widget
+  const { id, spec, data, aligned, title, source } = widget
   const chartType = spec?.chart_type || 'line'
   const series = spec?.series || []
   const y2Axis = spec?.y2_axis || []
   const annotations = spec?.annotations || []
 
-  // 데이터 변환
+  // 데이터 변환 (서버에서 정렬된 행렬이 있으면 그대로 사용)
   const chartData: any[] = []
-  if (data && Object.keys(data).length > 0) {
+  if (aligned && aligned.dates?.length > 0) {
+    aligned.dates.forEach((date: string, rowIdx: number) => {
+      const row: any = { date }
+      aligned.series.forEach((seriesName: string, colIdx: number) => {
+        row[seriesName] = aligned.values[rowIdx][colIdx]
+      })
+      chartData.push(row)
+    })
+  } else if (data && Object.keys(data).length > 0) {
     const firstSeries = Object.values(data)[0] as any[]
     firstSeries.forEach((point, idx) => {
       const row: any = { date: point.date }
@@ -1,4 +1,5 @@
 import axios from 'axios'
+import type { DashboardResponse } from './types'
 
 const API_BASE = import.meta.env.VITE_API_BASE || '/api'
 
@@ -38,12 +39,79 @@ export const getTrends = () => api.get('/market/trends')
 
 export const getNews = () => api.get('/market/news')
 
+// 대시보드 첫 화면: 여러 파트를 한 요청으로 조회 (파트별 실패는 errors 에 담김)
+export const getDashboard = (parts: string[]) =>
+  api.get<DashboardResponse>('/dashboard', { params: { parts: parts.join(',') } })
+
+export const dashboardPartError = (data: DashboardResponse | undefined, part: string) =>
+  data?.errors?.[part] ? new Error(data.errors[part].detail) : null
+
+// Server-Sent Events (POST) 스트림: 프레임마다 onEvent(event, data) 호출
+export type StreamHandler = (event: string, data: any) => void
+
+export async function streamSSE(
+  path: string,
+  body: unknown,
+  onEvent: StreamHandler,
+  signal?: AbortSignal
+) {
+  const response = await fetch(`${API_BASE}${path}`, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json', Accept: 'text/event-stream' },
+    body: JSON.stringify(body),
+    signal,
+  })
+  if (!response.ok || !response.body) {
+    const detail = await response.json().then((d) => d.detail).catch(() => null)
+    throw new Error(detail || `요청 실패 (${response.status})`)
+  }
+
+  const reader = response.body.getReader()
+  const decoder = new TextDecoder()
+  let buffer = ''
+  while (true) {
+    const { done, value } = await reader.read()
+    if (done) break
+    buffer += decoder.decode(value, { stream: true })
+    let boundary
+    while ((boundary = buffer.indexOf('\n\n')) >= 0) {
+      const frame = buffer.slice(0, boundary)
+      buffer = buffer.slice(boundary + 2)
+      let event = 'message'
+      let data = ''
+      for (const line of frame.split('\n')) {
+        if (line.startsWith('event: ')) event = line.slice(7)
+        else if (line.startsWith('data: ')) data += line.slice(6)
+      }
+      if (data) onEvent(event, JSON.parse(data))
+    }
+  }
+}
+
+export const streamChat = (
+  data: { session_id?: string | null; message: string; auto_brief?: boolean },
+  onEvent: StreamHandler,
+  signal?: AbortSignal
+) => streamSSE('/chat/stream', data, onEvent, signal)
+
 export const qaChat = (data: { question: string; context?: string }) =>
   api.post('/qa/chat', data)
 
 export const qaSummary = (data: { question: string; context?: string }) =>
   api.post('/qa/summary', data)
 
+export const qaChatStream = (
+  data: { question: string; context?: string },
+  onEvent: StreamHandler,
+  signal?: AbortSignal
+) => streamSSE('/qa/chat/stream', data, onEvent, signal)
+
+export const qaSummaryStream = (
+  data: { question: string; context?: string },
+  onEvent: StreamHandler,
+  signal?: AbortSignal
+) => streamSSE('/qa/summary/stream', data, onEvent, signal)
+
 export const generateProblems = (data: {
   level: string
   topic: string
@@ -51,10 +119,18 @@ export const generateProblems = (data: {
   style: string
 }) => api.post('/problems', data)
 
+// 문제가 하나 완성될 때마다 'problem' 이벤트
+export const streamProblems = (
+  data: { level: string; topic: string; count: number; style: string },
+  onEvent: StreamHandler,
+  signal?: AbortSignal
+) => streamSSE('/problems/stream?format=sse', data, onEvent, signal)
+
 export const getRecommendations = (data: {
   topic: string
   level: string
   purpose: string
+  count?: number
 }) => api.post('/recommend', data)
 
 export const createBookmark = (data: {
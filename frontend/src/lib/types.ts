@@ -50,3 +50,14 @@ export interface RecommendItem {
   tags: string[]
 }
 
+
+export interface DashboardPartError {
+  status: number
+  detail: string
+}
+
+export interface DashboardResponse {
+  version: string
+  parts: Record<string, any>
+  errors: Record<string, DashboardPartError>
+}
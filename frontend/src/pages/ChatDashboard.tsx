@@ -1,7 +1,7 @@
 import { useState } from 'react'
 import { useMutation } from '@tanstack/react-query'
 import { Send, Sparkles } from 'lucide-react'
-import { api } from '@/lib/api'
+import { streamChat } from '@/lib/api'
 import Button from '@/components/ui/Button'
 import Textarea from '@/components/ui/Textarea'
 import { Card, CardHeader, CardTitle, CardContent } from '@/components/ui/Card'
@@ -23,45 +23,43 @@ export default function ChatDashboard() {
   const [widgets, setWidgets] = useState<any[]>([])
   const [suggestions, setSuggestions] = useState<string[]>([])
 
+  // 토큰/위젯을 도착하는 대로 화면에 반영 (SSE)
   const chatMutation = useMutation({
     mutationFn: async (msg: string) => {
-      return await api.post('/chat', {
-        session_id: sessionId,
-        message: msg,
+      setMessages(prev => [
+        ...prev,
+        { role: 'user', content: msg },
+        { role: 'assistant', content: '' },
+      ])
+      setMessage('')
+
+      await streamChat({ session_id: sessionId, message: msg }, (event, data) => {
+        switch (event) {
+          case 'session':
+            setSessionId(data.session_id)
+            break
+          case 'token':
+            setMessages(prev => {
+              const last = prev[prev.length - 1]
+              return [...prev.slice(0, -1), { ...last, content: last.content + data.content }]
+            })
+            break
+          case 'widget':
+            setWidgets(prev => [...prev, data])
+            break
+          case 'done':
+            setSuggestions(data.suggestions || [])
+            break
+          case 'error':
+            throw new Error(data.detail)
+        }
       })
     },
-    onSuccess: (response) => {
-      const data = response.data
-      
-      // 세션 ID 저장
-      if (data.session_id) {
-        setSessionId(data.session_id)
-      }
-      
-      // 메시지 추가
-      const assistantMessages = data.messages.filter(
-        (m: any) => m.role === 'assistant' && m.content
-      )
-      if (assistantMessages.length > 0) {
-        setMessages(prev => [
-          ...prev,
-          { role: 'user', content: message },
-          ...assistantMessages
-        ])
-      }
-      
-      // 위젯 추가
-      if (data.widgets && data.widgets.length > 0) {
-        setWidgets(prev => [...prev, ...data.widgets])
-      }
-      
-      // 제안 업데이트
-      if (data.suggestions) {
-        setSuggestions(data.suggestions)
-      }
-      
-      // 입력 초기화
-      setMessage('')
+    onError: (error: Error) => {
+      setMessages(prev => {
+        const last = prev[prev.length - 1]
+        return [...prev.slice(0, -1), { ...last, content: last.content || `오류: ${error.message}` }]
+      })
     },
   })
 
@@ -132,7 +130,7 @@ export default function ChatDashboard() {
                 </div>
               )}
 
-              {messages.map((msg, idx) => (
+              {messages.filter(msg => msg.content).map((msg, idx) => (
                 <div
                   key={idx}
                   className={`${
@@ -148,7 +146,7 @@ export default function ChatDashboard() {
                 </div>
               ))}
 
-              {chatMutation.isPending && (
+              {chatMutation.isPending && !messages[messages.length - 1]?.content && (
                 <div className="flex justify-center py-8">
                   <LoadingSpinner text="AI가 분석 중입니다..." />
                 </div>
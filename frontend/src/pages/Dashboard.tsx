@@ -13,7 +13,7 @@ import {
   ResponsiveContainer,
   Legend,
 } from 'recharts'
-import { getKPIs, getTrends, getNews } from '@/lib/api'
+import { getDashboard, dashboardPartError } from '@/lib/api'
 import KpiCard from '@/components/KpiCard'
 import ChartCard from '@/components/ChartCard'
 import NewsCard from '@/components/NewsCard'
@@ -21,35 +21,29 @@ import ErrorDisplay from '@/components/ErrorDisplay'
 import Skeleton from '@/components/ui/Skeleton'
 
 export default function Dashboard() {
+  // 첫 화면 데이터는 한 번의 배치 요청으로 조회
   const {
-    data: kpis,
-    isLoading: kpisLoading,
-    error: kpisError,
-    refetch: refetchKpis,
+    data: dashboard,
+    isLoading,
+    error,
+    refetch,
   } = useQuery({
-    queryKey: ['kpis'],
-    queryFn: async () => (await getKPIs()).data,
+    queryKey: ['dashboard', 'kpis', 'trends', 'news'],
+    queryFn: async () => (await getDashboard(['kpis', 'trends', 'news'])).data,
   })
 
-  const {
-    data: trends,
-    isLoading: trendsLoading,
-    error: trendsError,
-    refetch: refetchTrends,
-  } = useQuery({
-    queryKey: ['trends'],
-    queryFn: async () => (await getTrends()).data,
-  })
-
-  const {
-    data: news,
-    isLoading: newsLoading,
-    error: newsError,
-    refetch: refetchNews,
-  } = useQuery({
-    queryKey: ['news'],
-    queryFn: async () => (await getNews()).data,
-  })
+  const kpis = dashboard?.parts.kpis
+  const trends = dashboard?.parts.trends
+  const news = dashboard?.parts.news
+  const kpisError = error || dashboardPartError(dashboard, 'kpis')
+  const trendsError = error || dashboardPartError(dashboard, 'trends')
+  const newsError = error || dashboardPartError(dashboard, 'news')
+  const kpisLoading = isLoading
+  const trendsLoading = isLoading
+  const newsLoading = isLoading
+  const refetchKpis = refetch
+  const refetchTrends = refetch
+  const refetchNews = refetch
 
   return (
     <div className="space-y-6 animation-fade-in">
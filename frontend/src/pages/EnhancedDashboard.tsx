@@ -1,5 +1,5 @@
 import { useQuery } from '@tanstack/react-query'
-import { api } from '@/lib/api'
+import { getDashboard, dashboardPartError } from '@/lib/api'
 import EnhancedKpiCard from '@/components/EnhancedKpiCard'
 import MarketTickers from '@/components/MarketTickers'
 import ChartCard from '@/components/ChartCard'
@@ -21,35 +21,29 @@ import {
 } from 'recharts'
 
 export default function EnhancedDashboard() {
+  // 첫 화면 데이터는 한 번의 배치 요청으로 조회
   const {
-    data: kpis,
-    isLoading: kpisLoading,
-    error: kpisError,
-    refetch: refetchKpis,
+    data: dashboard,
+    isLoading,
+    error,
+    refetch,
   } = useQuery({
-    queryKey: ['extended-kpis'],
-    queryFn: async () => (await api.get('/market/kpis/extended')).data,
+    queryKey: ['dashboard', 'kpis_extended', 'trends', 'news'],
+    queryFn: async () => (await getDashboard(['kpis_extended', 'trends', 'news'])).data,
   })
 
-  const {
-    data: trends,
-    isLoading: trendsLoading,
-    error: trendsError,
-    refetch: refetchTrends,
-  } = useQuery({
-    queryKey: ['trends'],
-    queryFn: async () => (await api.get('/market/trends')).data,
-  })
-
-  const {
-    data: news,
-    isLoading: newsLoading,
-    error: newsError,
-    refetch: refetchNews,
-  } = useQuery({
-    queryKey: ['news'],
-    queryFn: async () => (await api.get('/market/news')).data,
-  })
+  const kpis = dashboard?.parts['kpis_extended']
+  const trends = dashboard?.parts.trends
+  const news = dashboard?.parts.news
+  const kpisError = error || dashboardPartError(dashboard, 'kpis_extended')
+  const trendsError = error || dashboardPartError(dashboard, 'trends')
+  const newsError = error || dashboardPartError(dashboard, 'news')
+  const kpisLoading = isLoading
+  const trendsLoading = isLoading
+  const newsLoading = isLoading
+  const refetchKpis = refetch
+  const refetchTrends = refetch
+  const refetchNews = refetch
 
   return (
     <div className="space-y-6 animation-fade-in">
@@ -1,7 +1,7 @@
 import { useState } from 'react'
 import { useMutation } from '@tanstack/react-query'
 import { FileText, Download, ChevronDown, ChevronUp } from 'lucide-react'
-import { generateProblems } from '@/lib/api'
+import { streamProblems } from '@/lib/api'
 import { ProblemItem } from '@/lib/types'
 import Button from '@/components/ui/Button'
 import { Card, CardHeader, CardTitle, CardContent } from '@/components/ui/Card'
@@ -17,17 +17,19 @@ export default function ProblemsPage() {
   const [problems, setProblems] = useState<ProblemItem[]>([])
   const [expandedIdx, setExpandedIdx] = useState<number | null>(null)
 
+  // 문제는 완성되는 대로 하나씩 목록에 추가
   const mutation = useMutation({
-    mutationFn: () =>
-      generateProblems({
-        level,
-        topic,
-        count,
-        style,
-      }),
-    onSuccess: (response) => {
-      setProblems(response.data.items)
+    mutationFn: async () => {
+      setProblems([])
       setExpandedIdx(null)
+      await streamProblems({ level, topic, count, style }, (event, data) => {
+        if (event === 'problem') {
+          const { index, ...problem } = data
+          setProblems(prev => [...prev, problem as ProblemItem])
+        } else if (event === 'error') {
+          throw new Error(data.detail)
+        }
+      })
     },
   })
 
@@ -179,7 +181,7 @@ export default function ProblemsPage() {
 
         {/* Right: Results */}
         <div className="lg:col-span-2 space-y-4">
-          {mutation.isPending && <LoadingSpinner text="문제를 생성하고 있습니다..." />}
+          {mutation.isPending && problems.length === 0 && <LoadingSpinner text="문제를 생성하고 있습니다..." />}
 
           {mutation.error && (
             <ErrorDisplay
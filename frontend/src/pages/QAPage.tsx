@@ -2,7 +2,7 @@ import { useState } from 'react'
 import { useMutation } from '@tanstack/react-query'
 import { MessageSquare, Sparkles } from 'lucide-react'
 import ReactMarkdown from 'react-markdown'
-import { qaChat, qaSummary } from '@/lib/api'
+import { qaChatStream, qaSummaryStream } from '@/lib/api'
 import Button from '@/components/ui/Button'
 import Textarea from '@/components/ui/Textarea'
 import { Card, CardHeader, CardTitle, CardContent } from '@/components/ui/Card'
@@ -27,19 +27,29 @@ export default function QAPage() {
   const [answer, setAnswer] = useState('')
   const [citations, setCitations] = useState<string[]>([])
 
+  // 응답은 스트림으로 받아 조각이 도착하는 대로 표시
+  const handleStreamEvent = (event: string, data: any) => {
+    if (event === 'delta') setAnswer(prev => prev + data.content)
+    else if (event === 'citations') setCitations(data.citations)
+    else if (event === 'error') throw new Error(data.detail)
+  }
+
+  const startAnswer = () => {
+    setAnswer('')
+    setCitations([])
+  }
+
   const chatMutation = useMutation({
-    mutationFn: (q: string) => qaChat({ question: q }),
-    onSuccess: (response) => {
-      setAnswer(response.data.answer_md)
-      setCitations(response.data.citations || [])
+    mutationFn: async (q: string) => {
+      startAnswer()
+      await qaChatStream({ question: q }, handleStreamEvent)
     },
   })
 
   const summaryMutation = useMutation({
-    mutationFn: (q: string) => qaSummary({ question: q }),
-    onSuccess: (response) => {
-      setAnswer(response.data.answer_md)
-      setCitations(response.data.citations || [])
+    mutationFn: async (q: string) => {
+      startAnswer()
+      await qaSummaryStream({ question: q }, handleStreamEvent)
     },
   })
 
@@ -125,7 +135,7 @@ export default function QAPage() {
               </CardTitle>
             </CardHeader>
             <CardContent>
-              {isLoading && <LoadingSpinner text="AI가 답변을 생성하고 있습니다..." />}
+              {isLoading && !answer && <LoadingSpinner text="AI가 답변을 생성하고 있습니다..." />}
 
               {error && (
                 <ErrorDisplay
@@ -134,7 +144,7 @@ export default function QAPage() {
                 />
               )}
 
-              {!isLoading && !error && answer && (
+              {!error && answer && (
                 <div className="space-y-4">
                   <div className="prose prose-invert max-w-none">
                     <ReactMarkdown